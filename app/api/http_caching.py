@@ -0,0 +1,105 @@
+import hashlib
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+from fastapi import Depends, Request, Response
+
+from app import settings
+from app.cache import get_data_versions
+from app.dependencies import create_db_conn
+
+
+class NotModified(Exception):
+    """
+    Raised by the conditional request dependency when the client
+    already has the current representation
+    """
+    def __init__(self, headers: Dict[str, str]) -> None:
+        super().__init__()
+        self.headers = headers
+
+
+async def not_modified_handler(request: Request, exc: NotModified) -> Response:
+    return Response(status_code=304, headers=exc.headers)
+
+
+def gzip_etag(etag: str) -> str:
+    """
+    Returns the ETag of the gzip body of a representation, the
+    encodings of a body are different representations
+    """
+    return f'{etag[:-1]}-gzip"'
+
+
+def _matching_etag(if_none_match: str, etag: str) -> Optional[str]:
+    """
+    Returns the tag of If-None-Match that matches etag or its gzip
+    variant, None when there is no match
+    """
+    if if_none_match.strip() == '*':
+        return etag
+
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    for candidate in (etag, gzip_etag(etag)):
+        if candidate in tags:
+            return candidate
+
+    return None
+
+
+def _not_modified_since(if_modified_since: str, last_modified) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    # Http dates have a resolution of a second
+    return last_modified.replace(microsecond=0) <= since
+
+
+def conditional_response(*table_names: str) -> Callable:
+    """
+    Returns a dependency that sets the ETag, Last-Modified and Cache-Control
+    headers of a response from the data versions of the tables the endpoint
+    reads. Requests with a matching If-None-Match (or If-Modified-Since) get
+    a 304 before the endpoint runs any query.
+    """
+    async def dependency(
+        request: Request,
+        response: Response,
+        db_session = Depends(create_db_conn)
+    ) -> None:
+        data_versions = await get_data_versions().get_data_versions(table_names, db_session)
+
+        etag_source = '|'.join(
+            [request.url.path, request.url.query] +
+            [f'{data_version.table_name}:{data_version.version}' for data_version in data_versions]
+        )
+        headers = {
+            'ETag': f'"{hashlib.sha256(etag_source.encode()).hexdigest()[:32]}"',
+            'Cache-Control': f'public, max-age={settings.http_cache_max_age_seconds}'
+        }
+
+        updated_at = [
+            data_version.updated_at
+            for data_version in data_versions
+            if data_version.updated_at is not None
+        ]
+        last_modified = max(updated_at) if updated_at else None
+        if last_modified is not None:
+            headers['Last-Modified'] = format_datetime(last_modified, usegmt=True)
+
+        if_none_match: Optional[str] = request.headers.get('if-none-match')
+        if_modified_since: Optional[str] = request.headers.get('if-modified-since')
+        if if_none_match is not None:
+            matching_etag = _matching_etag(if_none_match, headers['ETag'])
+            if matching_etag is not None:
+                # The 304 carries the tag of the body the client has
+                raise NotModified({**headers, 'ETag': matching_etag})
+        elif if_modified_since is not None and last_modified is not None:
+            if _not_modified_since(if_modified_since, last_modified):
+                raise NotModified(headers)
+
+        response.headers.update(headers)
+
+    return dependency
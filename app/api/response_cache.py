@@ -0,0 +1,118 @@
+import gzip
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+import orjson
+from fastapi import Depends, Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app import settings
+from app.api.http_caching import gzip_etag
+from app.cache import TTLCache, get_data_versions
+from app.dependencies import create_db_conn
+
+RESPONSE_CACHE = None
+
+
+def get_response_cache() -> TTLCache:
+    global RESPONSE_CACHE
+    if RESPONSE_CACHE is None:
+        RESPONSE_CACHE = TTLCache(maxsize=settings.response_cache_max_entries)
+
+    return RESPONSE_CACHE
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    body: bytes
+    # None when the body is too small to be worth compressing
+    gzip_body: Optional[bytes]
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Returns True when the Accept-Encoding header allows a gzip body,
+    gzip (or *) must be listed with a q-value above 0
+    """
+    qualities = {}
+    for token in accept_encoding.split(','):
+        coding, *params = [part.strip() for part in token.split(';')]
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.lower()] = quality
+
+    return qualities.get('gzip', qualities.get('*', 0.0)) > 0
+
+
+class CachedEndpoint:
+    """
+    Serves the json body of an endpoint from the response cache.
+    The body is built, validated and encoded once per data version
+    and served as raw bytes afterwards.
+    """
+    def __init__(self, request: Request, response: Response, key: Hashable) -> None:
+        self._request = request
+        self._response = response
+        self._key = key
+
+    async def respond(self, build_content: Callable[[], Awaitable[Any]]) -> Response:
+        """
+        :build_content -> Returns the content of the endpoint (pydantic
+        models, lists, dicts). It's only called on a cache miss, errors
+        it raises (e.g. HTTPException) are not cached.
+        """
+        cached_body = await get_response_cache().get_or_compute(
+            key=self._key,
+            compute=lambda: self._render(build_content),
+            ttl_seconds=float('inf')
+        )
+
+        # Headers set by other dependencies (e.g. conditional_response)
+        headers = dict(self._response.headers)
+        headers.pop('content-length', None)
+        headers['Vary'] = 'Accept-Encoding'
+
+        accept_encoding = self._request.headers.get('accept-encoding', '')
+        if cached_body.gzip_body is not None and accepts_gzip(accept_encoding):
+            headers['Content-Encoding'] = 'gzip'
+            if 'etag' in headers:
+                headers['etag'] = gzip_etag(headers['etag'])
+            return Response(cached_body.gzip_body, media_type='application/json', headers=headers)
+
+        return Response(cached_body.body, media_type='application/json', headers=headers)
+
+    @staticmethod
+    async def _render(build_content: Callable[[], Awaitable[Any]]) -> CachedBody:
+        content = await build_content()
+        body = orjson.dumps(jsonable_encoder(content))
+        gzip_body = None
+        if len(body) >= settings.response_gzip_min_bytes:
+            gzip_body = gzip.compress(body, compresslevel=6)
+
+        return CachedBody(body=body, gzip_body=gzip_body)
+
+
+def cached_response(*table_names: str) -> Callable:
+    """
+    Returns a dependency that provides a CachedEndpoint keyed on the
+    path, the query and the data versions of the tables the endpoint reads
+    """
+    async def dependency(
+        request: Request,
+        response: Response,
+        db_session = Depends(create_db_conn)
+    ) -> CachedEndpoint:
+        versions = await get_data_versions().get(table_names, db_session)
+        key = (request.url.path, request.url.query, table_names, versions)
+        return CachedEndpoint(request, response, key)
+
+    return dependency
@@ -3,6 +3,8 @@ from typing import List
 from fastapi import APIRouter, Depends
 
 from app.dependencies import create_db_conn
+from app.api.http_caching import conditional_response
+from app.api.response_cache import CachedEndpoint, cached_response
 from app.api import schema
 from app.api import serializers
 from app.services.collections import CollectionsService
@@ -14,150 +16,195 @@ router = APIRouter(prefix='/collections')
     "/dividend_leaders",
     tags=["Collections"],
     status_code=200,
-    response_model=List[schema.StockLeader]
+    response_model=List[schema.StockLeader],
+    dependencies=[Depends(conditional_response('dividend_leaders'))]
 )
 async def get_dividend_leaders_collection(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('dividend_leaders'))
 ):
-    service = CollectionsService(db_session)
-    dividend_leaders = service.get_dividend_leaders()
-    return [
-        serializers.serialize_stock_leader(dividend_leader)
-        for dividend_leader in dividend_leaders
-    ]
+    async def build_content():
+        service = CollectionsService(db_session)
+        dividend_leaders = await service.get_dividend_leaders()
+        return [
+            serializers.serialize_stock_leader(dividend_leader)
+            for dividend_leader in dividend_leaders
+        ]
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/reit_leaders",
     tags=["Collections"],
     status_code=200,
-    response_model=List[schema.StockLeader]
+    response_model=List[schema.StockLeader],
+    dependencies=[Depends(conditional_response('reit_leaders'))]
 )
 async def get_reit_leaders_collection(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('reit_leaders'))
 ):
-    service = CollectionsService(db_session)
-    reit_leaders = service.get_reit_leaders()
-    return [
-        serializers.serialize_stock_leader(reit_leader)
-        for reit_leader in reit_leaders
-    ]
+    async def build_content():
+        service = CollectionsService(db_session)
+        reit_leaders = await service.get_reit_leaders()
+        return [
+            serializers.serialize_stock_leader(reit_leader)
+            for reit_leader in reit_leaders
+        ]
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/utility_leaders",
     tags=["Collections"],
     status_code=200,
-    response_model=List[schema.StockLeader]
+    response_model=List[schema.StockLeader],
+    dependencies=[Depends(conditional_response('utility_leaders'))]
 )
 async def get_utility_leaders_collection(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('utility_leaders'))
 ):
-    service = CollectionsService(db_session)
-    utility_leaders = service.get_utility_leaders()
-    return [
-        serializers.serialize_stock_leader(utility_leader)
-        for utility_leader in utility_leaders
-    ]
+    async def build_content():
+        service = CollectionsService(db_session)
+        utility_leaders = await service.get_utility_leaders()
+        return [
+            serializers.serialize_stock_leader(utility_leader)
+            for utility_leader in utility_leaders
+        ]
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/tech_leaders",
     tags=["Collections"],
     status_code=200,
-    response_model=List[schema.TechLeader]
+    response_model=List[schema.TechLeader],
+    dependencies=[Depends(conditional_response('tech_leaders'))]
 )
 async def get_tech_leaders_collection(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('tech_leaders'))
 ):
-    service = CollectionsService(db_session)
-    tech_leaders = service.get_tech_leaders()
-    return [
-        serializers.serialize_tech_leader(tech_leader)
-        for tech_leader in tech_leaders
-    ]
+    async def build_content():
+        service = CollectionsService(db_session)
+        tech_leaders = await service.get_tech_leaders()
+        return [
+            serializers.serialize_tech_leader(tech_leader)
+            for tech_leader in tech_leaders
+        ]
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/top_200_overall_rated_stocks",
     tags=["Collections"],
     status_code=200,
-    response_model=List[schema.Stock]
+    response_model=List[schema.Stock],
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_top_overall_rated_stocks_collection(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('stocks_with_sector'))
 ):
-    service = CollectionsService(db_session)
-    stocks = service.get_top_composite_stocks()
-    return [
-        serializers.serialize_stock(stock)
-        for stock in stocks
-    ]
+    async def build_content():
+        service = CollectionsService(db_session)
+        stocks = await service.get_top_composite_stocks()
+        return [
+            serializers.serialize_stock(stock)
+            for stock in stocks
+        ]
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/eps_rating_leaders",
     tags=["Collections"],
     status_code=200,
-    response_model=List[schema.Stock]
+    response_model=List[schema.Stock],
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_eps_rating_leaders_collection(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('stocks_with_sector'))
 ):
-    service = CollectionsService(db_session)
-    stocks = service.get_eps_rating_leaders()
-    return [
-        serializers.serialize_stock(stock)
-        for stock in stocks
-    ]
+    async def build_content():
+        service = CollectionsService(db_session)
+        stocks = await service.get_eps_rating_leaders()
+        return [
+            serializers.serialize_stock(stock)
+            for stock in stocks
+        ]
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/price_strength_rating_leaders",
     tags=["Collections"],
     status_code=200,
-    response_model=List[schema.Stock]
+    response_model=List[schema.Stock],
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_rs_rating_leaders_collection(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('stocks_with_sector'))
 ):
-    service = CollectionsService(db_session)
-    stocks = service.get_price_rs_rating_leaders()
-    return [
-        serializers.serialize_stock(stock)
-        for stock in stocks
-    ]
+    async def build_content():
+        service = CollectionsService(db_session)
+        stocks = await service.get_price_rs_rating_leaders()
+        return [
+            serializers.serialize_stock(stock)
+            for stock in stocks
+        ]
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/stocks_under_heavy_buying",
     tags=["Collections"],
     status_code=200,
-    response_model=List[schema.Stock]
+    response_model=List[schema.Stock],
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_stocks_under_heavy_buying_collection(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('stocks_with_sector'))
 ):
-    service = CollectionsService(db_session)
-    stocks = service.get_stocks_under_heavy_buying()
-    return [
-        serializers.serialize_stock(stock)
-        for stock in stocks
-    ]
+    async def build_content():
+        service = CollectionsService(db_session)
+        stocks = await service.get_stocks_under_heavy_buying()
+        return [
+            serializers.serialize_stock(stock)
+            for stock in stocks
+        ]
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/stocks_under_heavy_selling",
     tags=["Collections"],
     status_code=200,
-    response_model=List[schema.Stock]
+    response_model=List[schema.Stock],
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_stocks_under_heavy_selling_collection(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('stocks_with_sector'))
 ):
-    service = CollectionsService(db_session)
-    stocks = service.get_stocks_under_heavy_selling()
-    return [
-        serializers.serialize_stock(stock)
-        for stock in stocks
-    ]
+    async def build_content():
+        service = CollectionsService(db_session)
+        stocks = await service.get_stocks_under_heavy_selling()
+        return [
+            serializers.serialize_stock(stock)
+            for stock in stocks
+        ]
+
+    return await cached_endpoint.respond(build_content)
@@ -20,7 +20,7 @@ async def get_economic_indicator_time_series(
     db_session = Depends(create_db_conn)
 ):
     service = TimeSeriesService(db_session)
-    time_series = service.get_economic_indicator_time_series(
+    time_series = await service.get_economic_indicator_time_series(
         indicator=EconomicIndicator(indicator.value)
     )
 
@@ -131,16 +131,3 @@ async def get_six_months_price_prediction_model_info():
             'probability_threshold': '>= 75%'
         }
     }
-
-
-@router.post(
-    "/support/add_symbol",
-    tags=["Support"],
-    status_code=200,
-)
-async def add_symbol_data(symbol: str):
-    """
-    In case we don't have data for a symbol we use this
-    endpoint to add them.
-    """
-    pass
\ No newline at end of file
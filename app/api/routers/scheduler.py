@@ -0,0 +1,64 @@
+from http import HTTPStatus
+from typing import List, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query
+)
+
+from app.dependencies import create_db_conn
+from app.api import schema
+from app.api import serializers
+from app.services.scheduler_jobs import SchedulerJobsService
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/scheduler/jobs",
+    tags=["Scheduler"],
+    status_code=200,
+    response_model=List[schema.SchedulerJob]
+)
+async def get_scheduler_jobs(
+    status: Optional[schema.SchedulerJobStatus] = None,
+    dataset: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    db_session = Depends(create_db_conn)
+):
+    service = SchedulerJobsService(db_session)
+    jobs = await service.get_jobs(
+        status=status.value if status is not None else None,
+        dataset=dataset,
+        limit=limit
+    )
+
+    return [
+        serializers.serialize_scheduler_job(job)
+        for job in jobs
+    ]
+
+
+@router.get(
+    "/scheduler/jobs/{job_id}",
+    tags=["Scheduler"],
+    status_code=200,
+    response_model=schema.SchedulerJob
+)
+async def get_scheduler_job(
+    job_id: int,
+    db_session = Depends(create_db_conn)
+):
+    service = SchedulerJobsService(db_session)
+    job = await service.get_job(job_id)
+
+    if job is None:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+    return serializers.serialize_scheduler_job(job)
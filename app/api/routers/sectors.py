@@ -4,6 +4,8 @@ from fastapi import APIRouter, Depends
 
 from app.domain.sector import Sector
 from app.dependencies import create_db_conn
+from app.api.http_caching import conditional_response
+from app.api.response_cache import CachedEndpoint, cached_response
 from app.api import schema
 from app.api import serializers
 from app.services.sectors import SectorService
@@ -31,71 +33,86 @@ def _sector_schema_to_domain_model(sector_schema: schema.Sector) -> Sector:
     "/sectors/{sector}/stocks",
     tags=["Sectors"],
     status_code=200,
-    response_model=List[schema.Stock]
+    response_model=List[schema.Stock],
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_sector_stocks(
     sector: schema.Sector,
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('stocks_with_sector'))
 ):
-    service = SectorService(db_session)
-    stocks = service.get_sector_stocks(
-        sector=_sector_schema_to_domain_model(sector)
-    )
-    return [
-        serializers.serialize_stock(stock)
-        for stock in stocks
-    ]
+    async def build_content():
+        service = SectorService(db_session)
+        stocks = await service.get_sector_stocks(
+            sector=_sector_schema_to_domain_model(sector)
+        )
+        return [
+            serializers.serialize_stock(stock)
+            for stock in stocks
+        ]
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/sectors/performance",
     tags=["Sectors"],
     status_code=200,
-    response_model=List[schema.SectorsPerformanceEntry]
+    response_model=List[schema.SectorsPerformanceEntry],
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_sectors_performance(
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('stocks_with_sector'))
 ):
-    service = SectorService(db_session)
-    sectors_historical_performance = service.get_sectors_performance()
-    
-    response = []
-    for date, sectors_performance in sectors_historical_performance.items():
-        response.append(
-            schema.SectorsPerformanceEntry(
-                date=date,
-                sectors_performance=[
-                    serializers.serialize_sector_performance(performance)
-                    for performance in sectors_performance
-                ]
+    async def build_content():
+        service = SectorService(db_session)
+        sectors_historical_performance = await service.get_sectors_performance()
+
+        response = []
+        for date, sectors_performance in sectors_historical_performance.items():
+            response.append(
+                schema.SectorsPerformanceEntry(
+                    date=date,
+                    sectors_performance=[
+                        serializers.serialize_sector_performance(performance)
+                        for performance in sectors_performance
+                    ]
+                )
             )
-        )
 
-    return response
+        return response
+
+    return await cached_endpoint.respond(build_content)
 
 
 @router.get(
     "/sectors/{sector}/performance",
     tags=["Sectors"],
     status_code=200,
-    response_model=List[schema.SectorPerformanceEntry]
+    response_model=List[schema.SectorPerformanceEntry],
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_sectors_performance(
     sector: schema.Sector,
-    db_session = Depends(create_db_conn)
+    db_session = Depends(create_db_conn),
+    cached_endpoint: CachedEndpoint = Depends(cached_response('stocks_with_sector'))
 ):
-    service = SectorService(db_session)
-    sector_historical_performance = service.get_sector_performance(
-        sector=_sector_schema_to_domain_model(sector)
-    )
-    
-    response = []
-    for date, sector_performance in sector_historical_performance.items():
-        response.append(
-            schema.SectorPerformanceEntry(
-                date=date,
-                sector_performance=serializers.serialize_sector_performance(sector_performance)
-            )
+    async def build_content():
+        service = SectorService(db_session)
+        sector_historical_performance = await service.get_sector_performance(
+            sector=_sector_schema_to_domain_model(sector)
         )
 
-    return response
+        response = []
+        for date, sector_performance in sector_historical_performance.items():
+            response.append(
+                schema.SectorPerformanceEntry(
+                    date=date,
+                    sector_performance=serializers.serialize_sector_performance(sector_performance)
+                )
+            )
+
+        return response
+
+    return await cached_endpoint.respond(build_content)
@@ -8,6 +8,7 @@ from fastapi import (
 )
 
 from app.dependencies import create_db_conn
+from app.api.http_caching import conditional_response
 from app.api import schema
 from app.api import serializers
 from app.services.stocks_service import StocksService
@@ -20,7 +21,8 @@ router = APIRouter()
     "/stocks/{symbol}/profile",
     tags=["Stocks"],
     status_code=200,
-    response_model=schema.Stock
+    response_model=schema.Stock,
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_stock_profile(
     symbol: str = Path(
@@ -32,7 +34,7 @@ async def get_stock_profile(
     db_session = Depends(create_db_conn)
 ):
     service = StocksService(db_session)
-    stock_profile = service.get_stock_profile(symbol)
+    stock_profile = await service.get_stock_profile(symbol)
 
     if stock_profile is None:
         raise HTTPException(
@@ -47,7 +49,8 @@ async def get_stock_profile(
     "/stocks/{symbol}/historical_performance",
     tags=["Stocks"],
     status_code=200,
-    response_model=schema.StockHistoricalPerformance
+    response_model=schema.StockHistoricalPerformance,
+    dependencies=[Depends(conditional_response('stocks_with_sector'))]
 )
 async def get_stock_historical_performance(
     symbol: str = Path(
@@ -59,7 +62,7 @@ async def get_stock_historical_performance(
     db_session = Depends(create_db_conn)
 ):
     service = StocksService(db_session)
-    stock_performance_data = service.get_stock_historical_performance(symbol)
+    stock_performance_data = await service.get_stock_historical_performance(symbol)
 
     if len(stock_performance_data) == 0:
         raise HTTPException(
@@ -74,7 +77,8 @@ async def get_stock_historical_performance(
     "/stocks/{symbol}/financials",
     tags=["Stock Financials"],
     status_code=200,
-    response_model=schema.StockFinancialsQuarterly
+    response_model=schema.StockFinancialsQuarterly,
+    dependencies=[Depends(conditional_response('balance_sheet', 'income_statement', 'cash_flow'))]
 )
 async def get_stock_financials(
     symbol: str = Path(
@@ -86,7 +90,7 @@ async def get_stock_financials(
     db_session = Depends(create_db_conn)
 ):
     service = StocksService(db_session)
-    stock_financials = service.get_stock_financials(symbol)
+    stock_financials = await service.get_stock_financials(symbol)
 
     if not any(stock_financials.values()):
         raise HTTPException(
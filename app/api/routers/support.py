@@ -0,0 +1,63 @@
+from http import HTTPStatus
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query
+)
+
+from app.dependencies import create_db_conn, get_db_conn
+from app.api import schema
+from app.api import serializers
+from app.services.scheduler_jobs import SchedulerJobsService
+
+
+# Same prefix as the machine learning router, the support endpoints
+# don't need the ml models loaded
+router = APIRouter(prefix='/price_predictions')
+
+
+@router.post(
+    "/support/add_symbol",
+    tags=["Support"],
+    status_code=202,
+    response_model=schema.SchedulerJob
+)
+async def add_symbol_data(
+    symbol: str = Query(min_length=1, max_length=10, regex=r'^[A-Za-z][A-Za-z.\-]*$'),
+    writer_conn = Depends(get_db_conn)
+):
+    """
+    In case we don't have data for a symbol we use this
+    endpoint to add them. The data are fetched in the
+    background, the returned job reports the progress
+    (see /support/add_symbol/{job_id}). Requests for a
+    symbol that is already queued return the same job.
+    """
+    service = SchedulerJobsService()
+    job, _ = await service.enqueue_symbol_data(symbol.upper(), db_conn=writer_conn)
+
+    return serializers.serialize_scheduler_job(job)
+
+
+@router.get(
+    "/support/add_symbol/{job_id}",
+    tags=["Support"],
+    status_code=200,
+    response_model=schema.SchedulerJob
+)
+async def get_add_symbol_job(
+    job_id: int,
+    db_session = Depends(create_db_conn)
+):
+    service = SchedulerJobsService(db_session)
+    job = await service.get_job(job_id)
+
+    if job is None or job.dataset != 'symbol_data':
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+    return serializers.serialize_scheduler_job(job)
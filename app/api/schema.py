@@ -1,5 +1,6 @@
+from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import pydantic
 
@@ -325,3 +326,27 @@ class ChatbotQuestionExamples(pydantic.BaseModel):
 class ChatbotDatabaseContext(pydantic.BaseModel):
     table_name: str
     table_columns: List[str]
+
+
+class SchedulerJobStatus(str, Enum):
+    pending = 'pending'
+    running = 'running'
+    done = 'done'
+    failed = 'failed'
+
+
+class SchedulerJob(pydantic.BaseModel):
+    id: int
+    dataset: str
+    params: Dict[str, Any]
+    provider: str
+    priority: int
+    status: SchedulerJobStatus
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    error: Optional[str]
+    result: Optional[str]
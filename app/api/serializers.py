@@ -9,6 +9,7 @@ from app.domain.tech_leader_stock import TechLeaderStock
 from app.domain.composite_stock import CompositeStock
 from app.domain.sector_performance import SectorPerformance
 from app.domain.sector import Sector
+from app.domain.scheduler_job import SchedulerJob
 
 from langchain_core.messages.base import BaseMessage
 from langchain_core.messages.human import HumanMessage
@@ -166,4 +167,8 @@ def serialize_chatbot_conversation_message(message: BaseMessage) -> schema.Conve
             sender=schema.MessageSender.Agent
         )
     else:
-        raise ValueError(f"Invalid message type: {type(message)}")
\ No newline at end of file
+        raise ValueError(f"Invalid message type: {type(message)}")
+
+
+def serialize_scheduler_job(job: SchedulerJob) -> schema.SchedulerJob:
+    return schema.SchedulerJob(**asdict(job))
@@ -0,0 +1,179 @@
+"""
+Latency of async handlers under parallel load, with the repo queries
+running directly on the event loop (before) and through the database
+executor on pooled read connections (after).
+
+Requests arrive at a fixed rate and the latency of each one is measured
+from its scheduled arrival, so time spent waiting for a blocked event
+loop is included.
+
+Usage: python -m app.benchmarks.async_db_concurrency [--days 60] [--requests 1500] [--rps 250]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from app import dependencies, settings
+from app.benchmarks.synthetic_db import create_synthetic_db
+from app.database.migrate import apply_migrations
+from app.domain.sector import Sector
+from app.repos.dividend_leaders_repo import DividendLeadersRepo
+from app.repos.stocks_with_sector_repo import StocksWithSectorRepo
+from app.services.base_service import run_query
+
+Handler = Callable[[], Awaitable]
+
+
+def _blocking_handlers() -> List[Tuple[str, Handler]]:
+    # The way the routes used to call the repos, straight from the coroutine
+    async def stock_historical_data():
+        return StocksWithSectorRepo().get_stock_historical_data('AB')
+
+    async def stock_profile():
+        return StocksWithSectorRepo().get_stock_latest_data('AB')
+
+    async def sector_stocks():
+        return StocksWithSectorRepo().get_sector_stocks(Sector.ENERGY)
+
+    async def dividend_leaders():
+        return DividendLeadersRepo().get_latest_stock_leaders()
+
+    async def sectors_performance():
+        return StocksWithSectorRepo().get_sectors_performance()
+
+    return _mix(stock_historical_data, stock_profile, sector_stocks, dividend_leaders, sectors_performance)
+
+
+def _executor_handlers() -> List[Tuple[str, Handler]]:
+    async def stock_historical_data():
+        return await run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_stock_historical_data('AB')
+        )
+
+    async def stock_profile():
+        return await run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_stock_latest_data('AB')
+        )
+
+    async def sector_stocks():
+        return await run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_sector_stocks(Sector.ENERGY)
+        )
+
+    async def dividend_leaders():
+        return await run_query(
+            lambda db_session: DividendLeadersRepo(db_session).get_latest_stock_leaders()
+        )
+
+    async def sectors_performance():
+        return await run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_sectors_performance()
+        )
+
+    return _mix(stock_historical_data, stock_profile, sector_stocks, dividend_leaders, sectors_performance)
+
+
+def _mix(
+    stock_historical_data: Handler,
+    stock_profile: Handler,
+    sector_stocks: Handler,
+    dividend_leaders: Handler,
+    sectors_performance: Handler
+) -> List[Tuple[str, Handler]]:
+    # Mostly short lookups, one historical data request for every four
+    # of them and a single heavy aggregate that scans the whole table
+    handlers = [('sectors_performance', sectors_performance)]
+    for _ in range(100):
+        handlers.extend([
+            ('stock_historical_data', stock_historical_data),
+            ('stock_profile', stock_profile),
+            ('sector_stocks', sector_stocks),
+            ('dividend_leaders', dividend_leaders),
+            ('stock_profile', stock_profile),
+        ])
+
+    return handlers
+
+
+async def _run_load(
+    handlers: List[Tuple[str, Handler]],
+    requests: int,
+    rps: float
+) -> Dict[str, List[float]]:
+    """
+    Returns the latencies in milliseconds grouped by handler name
+    """
+    latencies = defaultdict(list)
+
+    async def issue(name: str, handler: Handler, arrival: float) -> None:
+        await handler()
+        latencies[name].append((time.perf_counter() - arrival) * 1000)
+
+    tasks = []
+    start = time.perf_counter()
+    for i in range(requests):
+        name, handler = handlers[i % len(handlers)]
+        arrival = start + i / rps
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(issue(name, handler, arrival)))
+
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(percentile / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def _print_latencies(title: str, latencies: Dict[str, List[float]]) -> None:
+    print(title)
+    print(f"{'handler':<25}{'p50 (ms)':>12}{'p99 (ms)':>12}{'max (ms)':>12}")
+    all_latencies = []
+    for name, values in sorted(latencies.items()):
+        all_latencies.extend(values)
+        print(f"{name:<25}{statistics.median(values):>12.2f}{_percentile(values, 99):>12.2f}{max(values):>12.2f}")
+    print(
+        f"{'all':<25}{statistics.median(all_latencies):>12.2f}"
+        f"{_percentile(all_latencies, 99):>12.2f}{max(all_latencies):>12.2f}\n"
+    )
+
+
+def run_benchmark(days: int, stocks_per_day: int, requests: int, rps: float, pool_size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'benchmark.db')
+        print(f"Creating synthetic database ({days} days x {stocks_per_day} stocks)...")
+        conn = create_synthetic_db(db_path, days=days, stocks_per_day=stocks_per_day)
+        apply_migrations(conn)
+        conn.close()
+
+        settings.db_path = db_path
+        settings.db_pool_size = pool_size
+        try:
+            before = asyncio.run(_run_load(_blocking_handlers(), requests, rps))
+            after = asyncio.run(_run_load(_executor_handlers(), requests, rps))
+        finally:
+            dependencies.close_db_conn()
+
+    print(f"{requests} requests at {rps} requests/s, pool size {pool_size}\n")
+    _print_latencies('Before (queries on the event loop)', before)
+    _print_latencies('After (database executor)', after)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--days', type=int, default=60)
+    parser.add_argument('--stocks-per-day', type=int, default=2000)
+    parser.add_argument('--requests', type=int, default=1500)
+    parser.add_argument('--rps', type=float, default=250)
+    parser.add_argument('--pool-size', type=int, default=settings.db_pool_size)
+    args = parser.parse_args()
+    run_benchmark(args.days, args.stocks_per_day, args.requests, args.rps, args.pool_size)
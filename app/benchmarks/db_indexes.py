@@ -0,0 +1,113 @@
+"""
+Benchmark of the repo queries before and after the index migrations.
+Every migration that creates an index is left out of the "before" run.
+The snapshot_dates catalog is created in both runs because the repos
+need it, the legacy "latest date" subquery is timed separately.
+
+Usage: python -m app.benchmarks.db_indexes [--days 250] [--stocks-per-day 2000]
+"""
+import argparse
+import os
+import re
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+from app.benchmarks.synthetic_db import create_synthetic_db
+from app.database.migrate import Migration, apply_migrations, load_migrations
+from app.domain.sector import Sector
+from app.repos.balance_sheet_repo import BalanceSheetRepo
+from app.repos.dividend_leaders_repo import DividendLeadersRepo
+from app.repos.small_mid_cap_leaders_index_repo import SmallMidCapLeadersIndexRepo
+from app.repos.snapshot_dates_repo import SnapshotDatesRepo
+from app.repos.stock_time_series_repo import StockTimeSeriesRepo
+from app.repos.stocks_with_sector_repo import StocksWithSectorRepo
+
+
+_CREATE_INDEX_PATTERN = re.compile(r'\bCREATE\s+(UNIQUE\s+)?INDEX\b', re.IGNORECASE)
+
+
+def _creates_indexes(migration: Migration) -> bool:
+    return any(_CREATE_INDEX_PATTERN.search(statement) for statement in migration.statements)
+
+
+def _queries(conn) -> List[Tuple[str, Callable]]:
+    return [
+        (
+            'latest stocks_with_sector date (table scan)',
+            lambda: conn.execute(
+                "SELECT registered_date FROM stocks_with_sector ORDER BY registered_date_ts DESC LIMIT 1"
+            ).fetchone()
+        ),
+        (
+            'latest stocks_with_sector date (snapshot_dates)',
+            lambda: SnapshotDatesRepo(conn).get_latest_snapshot_date('stocks_with_sector')
+        ),
+        ('StocksWithSectorRepo.get_sector_stocks', lambda: StocksWithSectorRepo(conn).get_sector_stocks(Sector.ENERGY)),
+        ('StocksWithSectorRepo.get_top_overall_rated_stocks', lambda: StocksWithSectorRepo(conn).get_top_overall_rated_stocks()),
+        ('StocksWithSectorRepo.get_eps_rating_leaders', lambda: StocksWithSectorRepo(conn).get_eps_rating_leaders()),
+        ('StocksWithSectorRepo.get_stock_latest_data', lambda: StocksWithSectorRepo(conn).get_stock_latest_data('AB')),
+        ('StocksWithSectorRepo.get_stock_historical_data', lambda: StocksWithSectorRepo(conn).get_stock_historical_data('AB')),
+        ('DividendLeadersRepo.get_latest_stock_leaders', lambda: DividendLeadersRepo(conn).get_latest_stock_leaders()),
+        ('SmallMidCapLeadersIndexRepo.get_latest_stock_leaders', lambda: SmallMidCapLeadersIndexRepo(conn).get_latest_stock_leaders()),
+        ('StockTimeSeriesRepo.get_symbol_time_series', lambda: StockTimeSeriesRepo(conn).get_symbol_time_series('AB')),
+        ('BalanceSheetRepo.get_balance_sheets_for_symbol', lambda: BalanceSheetRepo(conn).get_balance_sheets_for_symbol('AB')),
+    ]
+
+
+def _time_queries(conn, repeat: int) -> Dict[str, float]:
+    """
+    Returns the median latency of each query in milliseconds
+    """
+    latencies = {}
+    for name, query in _queries(conn):
+        query()     # Warm up the page cache
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            query()
+            timings.append((time.perf_counter() - start) * 1000)
+        latencies[name] = statistics.median(timings)
+
+    return latencies
+
+
+def run_benchmark(days: int, stocks_per_day: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(f"Creating synthetic database ({days} days x {stocks_per_day} stocks)...")
+        conn = create_synthetic_db(
+            os.path.join(tmp_dir, 'benchmark.db'),
+            days=days,
+            stocks_per_day=stocks_per_day
+        )
+
+        migrations = load_migrations()
+        apply_migrations(
+            conn,
+            [migration for migration in migrations if not _creates_indexes(migration)]
+        )
+        indexes = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND sql IS NOT NULL"
+        ).fetchall()
+        assert indexes == [], f"The before database has indexes: {indexes}"
+        before = _time_queries(conn, repeat)
+        start = time.perf_counter()
+        apply_migrations(conn, migrations)
+        migration_time = time.perf_counter() - start
+        after = _time_queries(conn, repeat)
+        conn.close()
+
+    print(f"Migrations applied in {migration_time:.2f}s\n")
+    print(f"{'query':<55}{'before (ms)':>14}{'after (ms)':>14}{'speedup':>10}")
+    for name in before:
+        print(f"{name:<55}{before[name]:>14.2f}{after[name]:>14.2f}{before[name] / after[name]:>9.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--days', type=int, default=250)
+    parser.add_argument('--stocks-per-day', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+    run_benchmark(args.days, args.stocks_per_day, args.repeat)
@@ -0,0 +1,133 @@
+"""
+Parse time and peak memory of the ibd scrapers on the pages in
+app/tests/ibd_responses, compared to the way they parsed a page before
+(pd.read_html for the tables, plus BeautifulSoup for the sector headings
+of the stocks by sector page). Both paths build the same domain objects.
+The memory is the peak of the python allocations (tracemalloc), the
+trees of libxml2 are not counted in either path.
+
+Usage: python -m app.benchmarks.ibd_parsers [--repeat 20]
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+import bs4
+import pandas as pd
+
+from app.services.ibd_scrapers.composite_stocks import CompositeStocksScraper
+from app.services.ibd_scrapers.leaders_index import LeadersIndexScraper
+from app.services.ibd_scrapers.stock_leaders import StockLeadersScraper
+from app.services.ibd_scrapers.stocks_with_sector import StocksWithSectorScraper
+from app.services.ibd_scrapers.tech_leaders_stocks import TechLeadersStocksScraper
+
+
+_RESPONSES_DIR = 'app/tests/ibd_responses'
+
+
+def _legacy_first_table(scraper, header_rows: int) -> Callable[[str], List]:
+    def parse(html_response: str) -> List:
+        records = pd.read_html(html_response)[0].to_records(index=False)
+        return [
+            scraper._convert_table_record_to_domain_model(record)
+            for record in records[header_rows:]
+        ]
+
+    return parse
+
+
+def _legacy_stocks_with_sector(html_response: str) -> Tuple[List, List]:
+    soup = bs4.BeautifulSoup(html_response, "lxml")
+    sectors = [
+        StocksWithSectorScraper._scrape_sector_from_heading(header.text)
+        for header in soup.find_all('h3')
+    ]
+    stocks = [
+        StocksWithSectorScraper._scrape_stocks_table(table.to_records(index=False))
+        for table in pd.read_html(html_response)
+    ]
+    return [sector for sector in sectors if sector is not None], stocks
+
+
+def _parsers() -> List[Tuple[str, Callable[[str], object], Callable[[str], object]]]:
+    # (page, before, now)
+    return [
+        (
+            'top_200_comp_stocks',
+            _legacy_first_table(CompositeStocksScraper, header_rows=2),
+            CompositeStocksScraper.scrape_composite_stocks
+        ),
+        (
+            'dividend_leaders',
+            _legacy_first_table(StockLeadersScraper, header_rows=2),
+            StockLeadersScraper.parse_stock_leaders
+        ),
+        (
+            'large_mid_cap_leaders_index',
+            _legacy_first_table(LeadersIndexScraper, header_rows=1),
+            LeadersIndexScraper.parse_leaders_index
+        ),
+        (
+            'tech_leaders_stocks',
+            _legacy_first_table(TechLeadersStocksScraper, header_rows=3),
+            TechLeadersStocksScraper.parse_tech_leaders_stocks
+        ),
+        (
+            'stocks_by_sector',
+            _legacy_stocks_with_sector,
+            StocksWithSectorScraper.parse_stocks_with_sector
+        ),
+    ]
+
+
+def _median_seconds(parse: Callable[[str], object], html_response: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(html_response)
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def _peak_kib(parse: Callable[[str], object], html_response: str) -> float:
+    tracemalloc.start()
+    try:
+        parse(html_response)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak / 1024
+
+
+def run_benchmark(repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    print(f"{'page':<30}{'before ms':>11}{'now ms':>9}{'speedup':>9}{'before KiB':>12}{'now KiB':>10}")
+    for page, legacy_parse, parse in _parsers():
+        with open(f'{_RESPONSES_DIR}/{page}.html', mode='r') as f:
+            html_response = f.read()
+
+        results[page] = {
+            'before_ms': _median_seconds(legacy_parse, html_response, repeat) * 1000,
+            'now_ms': _median_seconds(parse, html_response, repeat) * 1000,
+            'before_kib': _peak_kib(legacy_parse, html_response),
+            'now_kib': _peak_kib(parse, html_response),
+        }
+        result = results[page]
+        print(
+            f"{page:<30}{result['before_ms']:>11.1f}{result['now_ms']:>9.1f}"
+            f"{result['before_ms'] / result['now_ms']:>8.1f}x"
+            f"{result['before_kib']:>12.0f}{result['now_kib']:>10.0f}"
+        )
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    run_benchmark(args.repeat)
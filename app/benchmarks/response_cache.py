@@ -0,0 +1,108 @@
+"""
+Requests per second of /collections/top_200_overall_rated_stocks served
+from the response cache, compared to building the pydantic models and
+validating them against the response_model on every request (the way the
+endpoint worked before). The service cache is warm in both cases.
+
+Usage: python -m app.benchmarks.response_cache [--days 30] [--requests 2000]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from app import dependencies, settings
+from app.api import schema
+from app.api import serializers
+from app.api.routers import collections
+from app.benchmarks.synthetic_db import create_synthetic_db
+from app.database.migrate import apply_migrations
+from app.services.collections import CollectionsService
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(collections.router)
+
+    @app.get(
+        "/uncached/top_200_overall_rated_stocks",
+        response_model=List[schema.Stock]
+    )
+    async def get_top_200_overall_rated_stocks_uncached(
+        db_session = Depends(dependencies.create_db_conn)
+    ):
+        service = CollectionsService(db_session)
+        stocks = await service.get_top_composite_stocks()
+        return [
+            serializers.serialize_stock(stock)
+            for stock in stocks
+        ]
+
+    return app
+
+
+async def _requests_per_second(
+    client: httpx.AsyncClient,
+    url: str,
+    requests: int,
+    headers: Optional[Dict[str, str]] = None
+) -> float:
+    # Warm up the service and response caches
+    response = await client.get(url, headers=headers)
+    response.raise_for_status()
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await client.get(url, headers=headers)
+    return requests / (time.perf_counter() - start)
+
+
+async def _run(requests: int) -> Dict[str, float]:
+    async with httpx.AsyncClient(app=_create_app(), base_url='http://benchmark') as client:
+        return {
+            'pydantic + response_model': await _requests_per_second(
+                client, '/uncached/top_200_overall_rated_stocks', requests
+            ),
+            'response cache': await _requests_per_second(
+                client, '/collections/top_200_overall_rated_stocks', requests
+            ),
+            'response cache (gzip)': await _requests_per_second(
+                client,
+                '/collections/top_200_overall_rated_stocks',
+                requests,
+                headers={'Accept-Encoding': 'gzip'}
+            ),
+        }
+
+
+def run_benchmark(days: int, requests: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'benchmark.db')
+        print(f"Creating synthetic database ({days} days)...")
+        conn = create_synthetic_db(db_path, days=days)
+        apply_migrations(conn)
+        conn.close()
+
+        settings.db_path = db_path
+        try:
+            results = asyncio.run(_run(requests))
+        finally:
+            dependencies.close_db_conn()
+
+    baseline = results['pydantic + response_model']
+    print(f"{'path':<30}{'requests/s':>14}{'speedup':>10}")
+    for name, rps in results.items():
+        print(f"{name:<30}{rps:>14.0f}{rps / baseline:>9.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+    run_benchmark(args.days, args.requests)
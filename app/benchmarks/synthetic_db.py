@@ -0,0 +1,147 @@
+import datetime as dt
+import os
+import random
+import sqlite3
+from typing import List
+
+from app.domain.sector import Sector
+
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'database', 'schema.sql')
+
+_ACC_DIS_RATINGS = ['A+', 'A', 'A-', 'B+', 'B', 'B-', 'C+', 'C', 'C-', 'D+', 'D', 'D-', 'E']
+_SMR_RATINGS = ['A', 'B', 'C', 'D', 'E']
+
+
+def _symbols(count: int) -> List[str]:
+    symbols = []
+    for i in range(count):
+        symbol = ''
+        i += 1
+        while i > 0:
+            i, remainder = divmod(i - 1, 26)
+            symbol = chr(ord('A') + remainder) + symbol
+        symbols.append(symbol)
+
+    return symbols
+
+
+def _dates(days: int) -> List[dt.datetime]:
+    start = dt.datetime(2020, 1, 1)
+    return [start + dt.timedelta(days=i) for i in range(days)]
+
+
+def create_synthetic_db(
+    db_path: str,
+    days: int = 250,
+    stocks_per_day: int = 2000,
+    leaders_per_day: int = 50,
+    symbols_with_history: int = 1000,
+    weeks_of_history: int = 260,
+    quarters_of_history: int = 40,
+    seed: int = 42
+) -> sqlite3.Connection:
+    """
+    Creates a database at db_path using schema.sql and fills it with
+    random data shaped like the data our ingest scripts store.
+    """
+    rnd = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    with open(SCHEMA_PATH, mode='r') as f:
+        conn.executescript(f.read())
+
+    sectors = list(Sector)
+    symbols = _symbols(max(stocks_per_day, symbols_with_history))
+    dates = _dates(days)
+
+    with conn:
+        for date in dates:
+            date_string = date.strftime("%d-%m-%Y")
+            date_ts = date.timestamp()
+            conn.executemany(
+                "INSERT INTO stocks_with_sector VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
+                [
+                    (
+                        rnd.randint(1, 99),
+                        rnd.randint(1, 99),
+                        rnd.randint(1, 99),
+                        rnd.choice(_ACC_DIS_RATINGS),
+                        rnd.uniform(10, 500),
+                        f'Company {symbol}',
+                        symbol,
+                        rnd.uniform(10, 500),
+                        rnd.uniform(-5, 5),
+                        rnd.uniform(-50, 50),
+                        rnd.choice(_SMR_RATINGS),
+                        sectors[i % len(sectors)].value,
+                        rnd.uniform(-3, 3),
+                        rnd.uniform(-30, 30),
+                        date_string,
+                        date_ts
+                    )
+                    for i, symbol in enumerate(symbols[:stocks_per_day])
+                ]
+            )
+
+            for table in ('dividend_leaders', 'utility_leaders', 'reit_leaders'):
+                conn.executemany(
+                    f"INSERT INTO {table} VALUES(?,?,?,?,?,?,?)",
+                    [
+                        (
+                            f'Company {symbol}',
+                            symbol,
+                            rnd.uniform(10, 500),
+                            rnd.uniform(0, 10),
+                            rnd.uniform(-10, 30),
+                            date_string,
+                            date_ts
+                        )
+                        for symbol in rnd.sample(symbols, leaders_per_day)
+                    ]
+                )
+
+            for table in ('large_mid_cap_leaders_index', 'small_mid_cap_leaders_index'):
+                conn.executemany(
+                    f"INSERT INTO {table} VALUES(?,?,?,?,?,?,?)",
+                    [
+                        (
+                            rnd.randint(1, 99),
+                            rnd.randint(1, 99),
+                            f'Company {symbol}',
+                            symbol,
+                            rnd.uniform(10, 500),
+                            date_string,
+                            date_ts
+                        )
+                        for symbol in rnd.sample(symbols, leaders_per_day)
+                    ]
+                )
+
+        weeks = [dates[-1] - dt.timedelta(weeks=i) for i in range(weeks_of_history)]
+        quarters = [dates[-1] - dt.timedelta(days=91 * i) for i in range(quarters_of_history)]
+        for symbol in symbols[:symbols_with_history]:
+            conn.executemany(
+                "INSERT INTO stock_time_series VALUES(?,?,?,?,?,?,?,?,?)",
+                [
+                    (
+                        symbol,
+                        rnd.uniform(10, 500),
+                        rnd.uniform(10, 500),
+                        rnd.uniform(10, 500),
+                        rnd.uniform(10, 500),
+                        rnd.uniform(1e5, 1e7),
+                        0.0,
+                        week.strftime("%d-%m-%Y"),
+                        week.timestamp()
+                    )
+                    for week in weeks
+                ]
+            )
+            conn.executemany(
+                f"INSERT INTO balance_sheet VALUES(?, ?, ?{', ?' * 36})",
+                [
+                    (symbol, quarter.strftime("%Y-%m-%d"), 'USD') + tuple(rnd.uniform(1e6, 1e9) for _ in range(36))
+                    for quarter in quarters
+                ]
+            )
+
+    return conn
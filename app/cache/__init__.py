@@ -0,0 +1,10 @@
+from app.cache.backends import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from app.cache.ttl_cache import CacheStats, TTLCache
+from app.cache.data_versions import DataVersions
+from app.cache.service_cache import (
+    cached,
+    close_cache_backend,
+    get_cache_backend,
+    get_data_versions,
+    get_service_cache
+)
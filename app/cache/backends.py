@@ -0,0 +1,110 @@
+import logging
+import math
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+
+class CacheBackend:
+    """
+    Shared (L2) cache tier that stores serialized values.
+    Errors of the backend are logged and treated as misses, an
+    unavailable backend costs latency but doesn't fail requests.
+    Backends must override _get and _set.
+    """
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            value = await self._get(key)
+        except Exception as err:
+            self.errors += 1
+            logging.warning(f"Cache backend get failed for key {key}: {err}")
+            return None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        try:
+            await self._set(key, value, ttl_seconds)
+        except Exception as err:
+            self.errors += 1
+            logging.warning(f"Cache backend set failed for key {key}: {err}")
+
+    async def close(self) -> None:
+        pass
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def _set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Backend that keeps the values in a dict, used in tests and
+    when there is a single worker
+    """
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        super().__init__()
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, expires_at)
+        self._entries: Dict[str, Tuple[bytes, float]] = {}
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return None
+
+            return value
+
+    async def _set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl_seconds)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend on top of a redis server, shared by all the workers
+    """
+    def __init__(self, url: str, key_prefix: str = 'investor_api:', client = None) -> None:
+        super().__init__()
+        if client is None:
+            # Imported here so redis is only needed when it's configured
+            import redis.asyncio as redis
+            client = redis.from_url(url)
+
+        self._client = client
+        self._key_prefix = key_prefix
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self._key_prefix + key)
+
+    async def _set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if math.isinf(ttl_seconds):
+            await self._client.set(self._key_prefix + key, value)
+        else:
+            await self._client.set(
+                self._key_prefix + key,
+                value,
+                px=max(1, int(ttl_seconds * 1000))
+            )
+
+    async def close(self) -> None:
+        await self._client.close()
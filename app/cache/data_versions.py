@@ -0,0 +1,48 @@
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.domain.data_version import DataVersion
+
+
+class DataVersions:
+    """
+    Process local copy of the data_versions table. The table is
+    reloaded at most once every refresh_seconds, so a new version
+    written by another process is picked up within that interval.
+    """
+    def __init__(
+        self,
+        load_versions: Callable[..., Awaitable[Dict[str, DataVersion]]],
+        refresh_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._load_versions = load_versions
+        self._refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._versions: Optional[Dict[str, DataVersion]] = None
+        self._expires_at = 0.0
+
+    async def get_data_versions(
+        self,
+        table_names: Sequence[str],
+        db_session = None
+    ) -> List[DataVersion]:
+        """
+        :db_session -> Connection to reload the versions with, a pooled
+        read connection is used when it's None
+        """
+        if self._versions is None or self._clock() >= self._expires_at:
+            self._versions = await self._load_versions(db_session)
+            self._expires_at = self._clock() + self._refresh_seconds
+
+        return [
+            self._versions.get(table_name, DataVersion(table_name, 0, None))
+            for table_name in table_names
+        ]
+
+    async def get(self, table_names: Sequence[str], db_session = None) -> Tuple[int, ...]:
+        data_versions = await self.get_data_versions(table_names, db_session)
+        return tuple(data_version.version for data_version in data_versions)
+
+    def invalidate(self) -> None:
+        self._expires_at = 0.0
@@ -0,0 +1,149 @@
+import hashlib
+import pickle
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from app import settings
+from app.cache.backends import CacheBackend, RedisCacheBackend
+from app.cache.data_versions import DataVersions
+from app.domain.data_version import DataVersion
+from app.cache.ttl_cache import TTLCache
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.services.base_service import run_query
+
+SERVICE_CACHE = None
+DATA_VERSIONS = None
+# Shared cache tier, False until it's created because None means
+# that no backend is configured
+CACHE_BACKEND = False
+
+
+def get_service_cache() -> TTLCache:
+    global SERVICE_CACHE
+    if SERVICE_CACHE is None:
+        SERVICE_CACHE = TTLCache(maxsize=settings.cache_max_entries)
+
+    return SERVICE_CACHE
+
+
+def get_cache_backend() -> Optional[CacheBackend]:
+    global CACHE_BACKEND
+    if CACHE_BACKEND is False:
+        CACHE_BACKEND = None
+        if settings.cache_redis_url:
+            CACHE_BACKEND = RedisCacheBackend(settings.cache_redis_url)
+
+    return CACHE_BACKEND
+
+
+async def close_cache_backend() -> None:
+    global CACHE_BACKEND
+    if CACHE_BACKEND:
+        await CACHE_BACKEND.close()
+    CACHE_BACKEND = False
+
+
+async def _load_data_versions(db_session = None) -> Dict[str, DataVersion]:
+    return await run_query(
+        lambda db_session: DataVersionsRepo(db_session).get_data_versions(),
+        db_session=db_session
+    )
+
+
+def get_data_versions() -> DataVersions:
+    global DATA_VERSIONS
+    if DATA_VERSIONS is None:
+        DATA_VERSIONS = DataVersions(
+            load_versions=_load_data_versions,
+            refresh_seconds=settings.data_versions_refresh_seconds
+        )
+
+    return DATA_VERSIONS
+
+
+def _make_key(
+    func: Callable,
+    args: Tuple[Any],
+    kwargs: Dict[str, Any],
+    versions: Tuple[int, ...]
+) -> Hashable:
+    # The first argument is the service instance (or class for classmethods),
+    # only its type is part of the key so every instance shares the entries
+    owner = args[0] if isinstance(args[0], type) else type(args[0])
+    return (
+        f'{owner.__module__}.{owner.__qualname__}.{func.__name__}',
+        args[1:],
+        tuple(sorted(kwargs.items())),
+        versions
+    )
+
+
+def _backend_key(key: Hashable) -> str:
+    # Keys have to be the same in every worker, the method name is kept
+    # readable and the rest is hashed
+    return f'{key[0]}:{hashlib.sha256(repr(key[1:]).encode()).hexdigest()}'
+
+
+async def _compute_through_backend(
+    backend: CacheBackend,
+    key: Hashable,
+    compute: Callable[[], Awaitable[Any]],
+    ttl_seconds: float
+) -> Any:
+    backend_key = _backend_key(key)
+    data = await backend.get(backend_key)
+    if data is not None:
+        return pickle.loads(data)
+
+    value = await compute()
+    await backend.set(
+        backend_key,
+        pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+        min(ttl_seconds, settings.cache_backend_ttl_seconds)
+    )
+    return value
+
+
+def cached(tables: Sequence[str] = (), minutes: Optional[float] = None):
+    """
+    Caches the result of an async service method in the process wide
+    service cache, keyed on the method and its arguments. When a shared
+    cache backend is configured the process cache only keeps entries for
+    cache_local_ttl_seconds and misses are filled from the backend first.
+    :tables -> The tables the method reads. Their data versions are part
+    of the key, so entries are replaced as soon as one of the tables is
+    written. Entries keyed on data versions don't expire unless minutes
+    is given.
+    """
+    def wrapper_cache(func):
+        @wraps(func)
+        async def wrapped_func(*args, **kwargs):
+            versions = ()
+            if tables:
+                # Reuse the connection the service already holds, taking a
+                # second one from the pool per request could exhaust it
+                db_session = getattr(args[0], '_db_session', None)
+                versions = await get_data_versions().get(tables, db_session)
+
+            if minutes is not None:
+                ttl_seconds = minutes * 60
+            elif tables:
+                ttl_seconds = float('inf')
+            else:
+                ttl_seconds = settings.cache_time_minutes * 60
+
+            key = _make_key(func, args, kwargs, versions)
+            compute = lambda: func(*args, **kwargs)
+            backend = get_cache_backend()
+            if backend is None:
+                return await get_service_cache().get_or_compute(key, compute, ttl_seconds)
+
+            return await get_service_cache().get_or_compute(
+                key=key,
+                compute=lambda: _compute_through_backend(backend, key, compute, ttl_seconds),
+                ttl_seconds=min(ttl_seconds, settings.cache_local_ttl_seconds)
+            )
+
+        return wrapped_func
+
+    return wrapper_cache
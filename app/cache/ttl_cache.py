@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    expirations: int
+    size: int
+    maxsize: int
+
+
+class TTLCache:
+    """
+    LRU cache where every entry has its own expiry time.
+    Concurrent misses for the same key are coalesced, only the first
+    caller computes the value and the rest wait for its result. When
+    that caller is cancelled one of the waiters takes over the compute.
+    """
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._maxsize = maxsize
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, expires_at)
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, float]]' = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Returns a (found, value) tuple
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if self._clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+
+                del self._entries[key]
+                self._expirations += 1
+
+            self._misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, self._clock() + ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: float
+    ) -> Any:
+        found, value = self.lookup(key)
+        if found:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            with self._lock:
+                self._coalesced += 1
+        while inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    # This caller was cancelled
+                    raise
+
+            # The caller computing the value was cancelled, the first
+            # waiter to get here computes it again for the rest
+            found, value = self.lookup(key)
+            if found:
+                return value
+            inflight = self._inflight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved in case nobody was waiting
+            future.exception()
+            raise
+        else:
+            self.set(key, value, ttl_seconds)
+            future.set_result(value)
+        finally:
+            del self._inflight[key]
+
+        return value
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                maxsize=self._maxsize
+            )
@@ -1,20 +1,91 @@
+from typing import Dict, Optional
+
 from pydantic import BaseSettings
 
 # TODO Create a .env file and read these values from there
 class Settings(BaseSettings):
     # Ibd
     ibd_base_url: str = 'https://www.investors.com/data-tables'
+    ibd_max_connections: int = 4
+    ibd_requests_per_second: float = 2
+    ibd_burst: int = 2
+    # Dates ingested at a time by the backfill
+    ibd_backfill_concurrency: int = 2
     # SQLite
     db_path: str = 'app/database/ibd.db'
+    db_pool_size: int = 8
+    db_pool_timeout_seconds: float = 30
+    db_mmap_size: int = 256 * 1024 * 1024
+    db_cache_size_kib: int = 64 * 1024
+    db_synchronous: str = 'NORMAL'
     chatbot_db_path: str = 'analytics/chatbot/chatbot.db'
+    # Outgoing http, one pooled client per base url
+    http_max_connections: int = 10
+    http_max_keepalive_connections: int = 5
+    http_keepalive_expiry_seconds: float = 30
+    # Needs the h2 package
+    http_http2: bool = False
+    # Retries with exponential backoff and jitter, see RetryPolicy
+    http_retry_max_attempts: int = 3
+    http_retry_backoff_base_seconds: float = 0.5
+    http_retry_backoff_max_seconds: float = 30
+    # Consecutive failures that open the circuit of a host, and
+    # how long it stays open before a trial request
+    http_circuit_failure_threshold: int = 5
+    http_circuit_reset_seconds: float = 30
+    # Raw responses of the scrapers, '' (off), 'record' or 'replay'
+    response_store_mode: str = ''
+    response_store_path: str = 'app/database/responses'
     # Yahoo finance
     y_finance_base_url: str = 'https://query1.finance.yahoo.com/v7'
     # Alpha vantage
     alpha_vantage_base_url: str = 'https://www.alphavantage.co/query'
     alpha_vantage_token: str = ''
+    alpha_vantage_requests_per_minute: int = 70
+    alpha_vantage_burst: int = 1
+    # A throttled call is retried after a longer backoff than other hosts
+    alpha_vantage_retry_max_attempts: int = 4
+    alpha_vantage_retry_backoff_base_seconds: float = 5
+    # Symbols updated concurrently by the update_stock_data script
+    alpha_vantage_concurrency: int = 8
+    # Fetched payloads waiting for the database writer
+    refresh_queue_size: int = 64
+    # Fetched payloads stored per transaction
+    refresh_batch_size: int = 32
+    # Worker processes that parse the scraped pages, None is one per core
+    # and 0 parses in a thread of the script
+    parse_pool_workers: Optional[int] = None
+    # Ingest scheduler, see app.scheduler
+    # Dataset -> cron expression (UTC) replacing the default of the dataset
+    scheduler_crons: Dict[str, str] = {}
+    scheduler_max_running_jobs: int = 4
+    # Provider -> jobs running at a time, 1 for the ones not listed. The
+    # alpha vantage jobs share the rate limiter of AlphaVantageClient, a
+    # symbol added on demand doesn't wait for the hours of the batch refresh
+    scheduler_provider_concurrency: Dict[str, int] = {'alpha_vantage': 2}
+    scheduler_max_attempts: int = 3
+    # A failed attempt runs again after backoff * 2^(attempt-1), capped at the max
+    scheduler_retry_backoff_seconds: float = 60
+    scheduler_retry_backoff_max_seconds: float = 60 * 60
+    # Longest sleep between two checks of the job table
+    scheduler_poll_seconds: float = 30
     # OPENAI
     openai_key: str = ''
     # Dataroma
     dataroma_base_url: str = 'https://www.dataroma.com/m'
+    dataroma_requests_per_second: float = 2
+    dataroma_burst: int = 2
+    # Pages fetched and parsed at a time by the dataroma ingest
+    dataroma_concurrency: int = 4
+    dataroma_grand_portfolio_pages: int = 10
     # App settings
-    cache_time_minutes = 60 * 2
\ No newline at end of file
+    cache_time_minutes = 60 * 2
+    cache_max_entries: int = 1024
+    data_versions_refresh_seconds: float = 5
+    # Shared cache tier, disabled when the url is empty
+    cache_redis_url: str = ''
+    cache_local_ttl_seconds: float = 30
+    cache_backend_ttl_seconds: float = 60 * 60 * 24
+    http_cache_max_age_seconds: int = 60
+    response_cache_max_entries: int = 256
+    response_gzip_min_bytes: int = 1024
\ No newline at end of file
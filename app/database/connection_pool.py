@@ -0,0 +1,296 @@
+import itertools
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, List, Optional
+
+from app.errors.database import ConnectionPoolTimeoutError
+
+
+class SerializedCursor(sqlite3.Cursor):
+    """
+    Cursor of a SerializedConnection. Statements run while holding the
+    connection's lock, so a statement of another thread waits for the
+    open transaction to end instead of seeing its uncommitted rows. The
+    rows of a query are fetched under the lock too and then served from
+    a buffer.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._rows: Iterator[Any] = iter(())
+
+    def execute(self, sql: str, parameters: Any = ()) -> 'SerializedCursor':
+        with self.connection._lock:
+            super().execute(sql, parameters)
+            self._buffer_rows()
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> 'SerializedCursor':
+        with self.connection._lock:
+            super().executemany(sql, seq_of_parameters)
+            self._buffer_rows()
+        return self
+
+    def executescript(self, sql_script: str) -> 'SerializedCursor':
+        with self.connection._lock:
+            super().executescript(sql_script)
+            self._rows = iter(())
+        return self
+
+    def _buffer_rows(self) -> None:
+        rows = super().fetchall() if self.description is not None else []
+        self._rows = iter(rows)
+
+    def fetchone(self) -> Any:
+        return next(self._rows, None)
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Any]:
+        return list(itertools.islice(self._rows, self.arraysize if size is None else size))
+
+    def fetchall(self) -> List[Any]:
+        return list(self._rows)
+
+    def __iter__(self) -> 'SerializedCursor':
+        return self
+
+    def __next__(self) -> Any:
+        return next(self._rows)
+
+
+class SerializedConnection(sqlite3.Connection):
+    """
+    Connection used for writes. Transactions opened with `with conn:`
+    hold the connection's lock so writes from different threads are
+    serialized. Transactions can be nested, only the outermost block
+    commits (or rolls back). Reads on the connection take the lock as
+    well (see SerializedCursor), they never see the uncommitted rows of
+    another thread's transaction.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self.acquired_count = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def cursor(self, factory=SerializedCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> sqlite3.Cursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str) -> sqlite3.Cursor:
+        return self.cursor().executescript(sql_script)
+
+    def __enter__(self) -> 'SerializedConnection':
+        start = time.perf_counter()
+        self._lock.acquire()
+        if self._depth == 0:
+            wait_seconds = time.perf_counter() - start
+            self.acquired_count += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        try:
+            self._depth -= 1
+            if self._depth == 0:
+                return super().__exit__(exc_type, exc_value, traceback)
+            return False
+        finally:
+            self._lock.release()
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    size: int
+    open_connections: int
+    idle_connections: int
+    in_use_connections: int
+    acquired_count: int
+    wait_count: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    writer_acquired_count: int
+    writer_total_wait_seconds: float
+    writer_max_wait_seconds: float
+
+
+class ConnectionPool:
+    """
+    Pool of read only sqlite connections plus a single writer connection.
+    The database runs in WAL mode so readers don't block while the
+    writer is inside a transaction (and vice versa).
+    """
+    def __init__(
+        self,
+        db_path: str,
+        size: int = 8,
+        timeout: float = 30.0,
+        mmap_size: int = 256 * 1024 * 1024,
+        cache_size_kib: int = 64 * 1024,
+        synchronous: str = 'NORMAL',
+    ) -> None:
+        self._db_path = db_path
+        self._size = size
+        self._timeout = timeout
+        self._mmap_size = mmap_size
+        self._cache_size_kib = cache_size_kib
+        self._synchronous = synchronous
+
+        self._condition = threading.Condition()
+        self._idle_connections: List[sqlite3.Connection] = []
+        self._open_connections = 0
+        self._closed = False
+        self._acquired_count = 0
+        self._wait_count = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+        # The writer is opened first because it switches the database to WAL
+        self._writer = self._connect(read_only=False)
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=self._timeout,
+            check_same_thread=False,
+            factory=sqlite3.Connection if read_only else SerializedConnection
+        )
+        conn.execute(f"PRAGMA mmap_size={int(self._mmap_size)}")
+        conn.execute(f"PRAGMA cache_size=-{int(self._cache_size_kib)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        else:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self._synchronous}")
+
+        return conn
+
+    @property
+    def writer(self) -> SerializedConnection:
+        return self._writer
+
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        """
+        Returns a read only connection. The connection must be given
+        back with release once the caller is done with it.
+        """
+        timeout = self._timeout if timeout is None else timeout
+        start = time.perf_counter()
+        waited = False
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise ConnectionPoolTimeoutError('Connection pool is closed')
+
+                if self._idle_connections:
+                    conn = self._idle_connections.pop()
+                    break
+
+                if self._open_connections < self._size:
+                    self._open_connections += 1
+                    conn = None
+                    break
+
+                remaining = timeout - (time.perf_counter() - start)
+                if remaining <= 0:
+                    self._record_wait(time.perf_counter() - start, waited=True)
+                    raise ConnectionPoolTimeoutError(
+                        f'No database connection available after {timeout} seconds'
+                    )
+                waited = True
+                self._condition.wait(remaining)
+
+            self._acquired_count += 1
+            self._record_wait(time.perf_counter() - start, waited)
+
+        if conn is None:
+            try:
+                conn = self._connect(read_only=True)
+            except Exception:
+                with self._condition:
+                    self._open_connections -= 1
+                    self._condition.notify()
+                raise
+
+        return conn
+
+    def _record_wait(self, wait_seconds: float, waited: bool) -> None:
+        # Must be called while holding self._condition
+        if waited:
+            self._wait_count += 1
+        self._total_wait_seconds += wait_seconds
+        self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+
+        with self._condition:
+            if self._closed:
+                conn.close()
+                self._open_connections -= 1
+                return
+
+            self._idle_connections.append(conn)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def stats(self) -> ConnectionPoolStats:
+        with self._condition:
+            return ConnectionPoolStats(
+                size=self._size,
+                open_connections=self._open_connections,
+                idle_connections=len(self._idle_connections),
+                in_use_connections=self._open_connections - len(self._idle_connections),
+                acquired_count=self._acquired_count,
+                wait_count=self._wait_count,
+                total_wait_seconds=self._total_wait_seconds,
+                max_wait_seconds=self._max_wait_seconds,
+                writer_acquired_count=self._writer.acquired_count,
+                writer_total_wait_seconds=self._writer.total_wait_seconds,
+                writer_max_wait_seconds=self._writer.max_wait_seconds,
+            )
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        logging.info(
+            f"Connection pool: {stats.in_use_connections}/{stats.open_connections} connections in use "
+            f"(size {stats.size}), {stats.acquired_count} acquired, {stats.wait_count} waited "
+            f"{stats.total_wait_seconds:.3f}s (max {stats.max_wait_seconds:.3f}s), "
+            f"writer {stats.writer_acquired_count} acquired, waited {stats.writer_total_wait_seconds:.3f}s "
+            f"(max {stats.writer_max_wait_seconds:.3f}s)"
+        )
+
+    def close(self) -> None:
+        """
+        Closes the idle connections and the writer, connections that
+        are in use are closed when they are released
+        """
+        with self._condition:
+            self._closed = True
+            for conn in self._idle_connections:
+                conn.close()
+            self._open_connections -= len(self._idle_connections)
+            self._idle_connections = []
+            self._condition.notify_all()
+
+        self._writer.close()
@@ -0,0 +1,30 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar('T')
+
+
+class DatabaseExecutor:
+    """
+    Bounded thread pool that runs the blocking sqlite calls so they
+    don't stall the event loop. The number of workers should not be
+    larger than the connection pool, extra workers would only wait
+    for a free connection.
+    """
+    def __init__(self, max_workers: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='db'
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
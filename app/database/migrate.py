@@ -0,0 +1,150 @@
+import logging
+import os
+import re
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), 'migrations')
+
+# Migration files are named <version>_<name>.sql, e.g. 0001_add_indexes.sql
+_MIGRATION_FILE_PATTERN = re.compile(r'^(\d+)_(\w+)\.sql$')
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    statements: List[str]
+
+
+def _split_statements(sql_script: str) -> List[str]:
+    statements = []
+    statement = ''
+    for line in sql_script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            statements.append(statement.strip())
+            statement = ''
+
+    # Whatever is left after the last statement must be comments
+    leftover = [
+        line for line in statement.splitlines()
+        if line.strip() and not line.strip().startswith('--')
+    ]
+    if leftover:
+        raise ValueError(f'Incomplete sql statement: {statement}')
+
+    return statements
+
+
+def load_migrations(migrations_dir: str = MIGRATIONS_DIR) -> List[Migration]:
+    """
+    Returns the migrations found in migrations_dir
+    sorted by version
+    """
+    migrations = []
+    for file_name in os.listdir(migrations_dir):
+        match = _MIGRATION_FILE_PATTERN.match(file_name)
+        if match is None:
+            continue
+
+        with open(os.path.join(migrations_dir, file_name), mode='r') as f:
+            sql_script = f.read()
+
+        migrations.append(
+            Migration(
+                version=int(match.group(1)),
+                name=match.group(2),
+                statements=_split_statements(sql_script)
+            )
+        )
+
+    migrations.sort(key=lambda migration: migration.version)
+    versions = [migration.version for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f'Duplicate migration versions in {migrations_dir}')
+
+    return migrations
+
+
+def _create_schema_version_table(db_conn: sqlite3.Connection) -> None:
+    db_conn.execute(
+        """CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )"""
+    )
+
+
+def get_schema_version(db_conn: sqlite3.Connection) -> int:
+    """
+    Returns the version of the latest applied migration,
+    0 if no migration has been applied yet
+    """
+    _create_schema_version_table(db_conn)
+    row = db_conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] if row[0] is not None else 0
+
+
+def apply_migrations(
+    db_conn: sqlite3.Connection,
+    migrations: Optional[List[Migration]] = None
+) -> List[int]:
+    """
+    Applies the migrations that have not been applied yet, each one
+    in its own transaction together with its schema_version row.
+    Returns the versions that were applied.
+    """
+    if migrations is None:
+        migrations = load_migrations()
+
+    _create_schema_version_table(db_conn)
+
+    applied_versions = []
+    for migration in migrations:
+        # BEGIN IMMEDIATE takes the write lock before we read the
+        # current version so that concurrent runners (e.g several
+        # uvicorn workers) apply each migration only once
+        db_conn.execute("BEGIN IMMEDIATE")
+        try:
+            already_applied = db_conn.execute(
+                "SELECT 1 FROM schema_version WHERE version=?",
+                (migration.version, )
+            ).fetchone()
+
+            if already_applied:
+                db_conn.execute("COMMIT")
+                continue
+
+            for statement in migration.statements:
+                db_conn.execute(statement)
+
+            db_conn.execute(
+                "INSERT INTO schema_version VALUES(?, ?, ?)",
+                (migration.version, migration.name, datetime.utcnow().isoformat())
+            )
+            db_conn.execute("COMMIT")
+        except Exception:
+            db_conn.execute("ROLLBACK")
+            logging.exception(f"Failed to apply migration {migration.version}_{migration.name}")
+            raise
+
+        logging.info(f"Applied migration {migration.version}_{migration.name}")
+        applied_versions.append(migration.version)
+
+    return applied_versions
+
+
+if __name__ == '__main__':
+    from app import settings
+
+    logging.basicConfig(level=logging.INFO)
+    conn = sqlite3.connect(settings.db_path)
+    try:
+        versions = apply_migrations(conn)
+        print(f"Applied migrations: {versions}, schema version: {get_schema_version(conn)}")
+    finally:
+        conn.close()
@@ -0,0 +1,95 @@
+-- Indexes that match the access patterns of the repos.
+-- "Latest snapshot" lookups order by registered_date_ts, snapshot reads
+-- filter by registered_date and per symbol reads filter by symbol.
+
+-- stocks_with_sector (StocksWithSectorRepo)
+CREATE INDEX IF NOT EXISTS idx_stocks_with_sector_registered_date_ts
+    ON stocks_with_sector (registered_date_ts, registered_date);
+CREATE INDEX IF NOT EXISTS idx_stocks_with_sector_registered_date_sector
+    ON stocks_with_sector (registered_date, sector_name, comp_rating);
+CREATE INDEX IF NOT EXISTS idx_stocks_with_sector_symbol
+    ON stocks_with_sector (symbol, registered_date_ts);
+CREATE INDEX IF NOT EXISTS idx_stocks_with_sector_sector_name
+    ON stocks_with_sector (sector_name, registered_date_ts);
+
+-- Stock leaders tables (StockLeadersRepo)
+CREATE INDEX IF NOT EXISTS idx_dividend_leaders_registered_date_ts
+    ON dividend_leaders (registered_date_ts, registered_date);
+CREATE INDEX IF NOT EXISTS idx_dividend_leaders_registered_date
+    ON dividend_leaders (registered_date);
+CREATE INDEX IF NOT EXISTS idx_dividend_leaders_stock_symbol
+    ON dividend_leaders (stock_symbol, registered_date_ts);
+
+CREATE INDEX IF NOT EXISTS idx_utility_leaders_registered_date_ts
+    ON utility_leaders (registered_date_ts, registered_date);
+CREATE INDEX IF NOT EXISTS idx_utility_leaders_registered_date
+    ON utility_leaders (registered_date);
+CREATE INDEX IF NOT EXISTS idx_utility_leaders_stock_symbol
+    ON utility_leaders (stock_symbol, registered_date_ts);
+
+CREATE INDEX IF NOT EXISTS idx_reit_leaders_registered_date_ts
+    ON reit_leaders (registered_date_ts, registered_date);
+CREATE INDEX IF NOT EXISTS idx_reit_leaders_registered_date
+    ON reit_leaders (registered_date);
+CREATE INDEX IF NOT EXISTS idx_reit_leaders_stock_symbol
+    ON reit_leaders (stock_symbol, registered_date_ts);
+
+-- Leaders index tables (LeadersIndexRepo)
+CREATE INDEX IF NOT EXISTS idx_large_mid_cap_leaders_index_registered_date_ts
+    ON large_mid_cap_leaders_index (registered_date_ts, registered_date);
+CREATE INDEX IF NOT EXISTS idx_large_mid_cap_leaders_index_registered_date
+    ON large_mid_cap_leaders_index (registered_date);
+CREATE INDEX IF NOT EXISTS idx_large_mid_cap_leaders_index_stock_symbol
+    ON large_mid_cap_leaders_index (stock_symbol, registered_date_ts);
+
+CREATE INDEX IF NOT EXISTS idx_small_mid_cap_leaders_index_registered_date_ts
+    ON small_mid_cap_leaders_index (registered_date_ts, registered_date);
+CREATE INDEX IF NOT EXISTS idx_small_mid_cap_leaders_index_registered_date
+    ON small_mid_cap_leaders_index (registered_date);
+CREATE INDEX IF NOT EXISTS idx_small_mid_cap_leaders_index_stock_symbol
+    ON small_mid_cap_leaders_index (stock_symbol, registered_date_ts);
+
+-- tech_leaders (TechLeadersStocksRepo)
+CREATE INDEX IF NOT EXISTS idx_tech_leaders_registered_date_ts
+    ON tech_leaders (registered_date_ts, registered_date);
+CREATE INDEX IF NOT EXISTS idx_tech_leaders_registered_date
+    ON tech_leaders (registered_date);
+CREATE INDEX IF NOT EXISTS idx_tech_leaders_stock_symbol
+    ON tech_leaders (stock_symbol, registered_date_ts);
+
+-- Composite stocks tables (CompositeStockRepo)
+CREATE INDEX IF NOT EXISTS idx_top_composite_stocks_registered_date_ts
+    ON top_composite_stocks (registered_date_ts, registered_date);
+CREATE INDEX IF NOT EXISTS idx_top_composite_stocks_registered_date
+    ON top_composite_stocks (registered_date);
+
+CREATE INDEX IF NOT EXISTS idx_bottom_composite_stocks_registered_date_ts
+    ON bottom_composite_stocks (registered_date_ts, registered_date);
+CREATE INDEX IF NOT EXISTS idx_bottom_composite_stocks_registered_date
+    ON bottom_composite_stocks (registered_date);
+
+-- Time series tables
+CREATE INDEX IF NOT EXISTS idx_stock_time_series_symbol
+    ON stock_time_series (symbol, registered_date_ts);
+CREATE INDEX IF NOT EXISTS idx_world_indices_time_series_index_name
+    ON world_indices_time_series (index_name, registered_date_ts);
+CREATE INDEX IF NOT EXISTS idx_economic_indicator_time_series_indicator_name
+    ON economic_indicator_time_series (indicator_name, registered_date_ts);
+
+-- Fundamentals tables
+CREATE INDEX IF NOT EXISTS idx_stock_overview_symbol
+    ON stock_overview (symbol, registered_date_ts);
+CREATE INDEX IF NOT EXISTS idx_income_statement_symbol
+    ON income_statement (symbol, fiscal_date_ending);
+CREATE INDEX IF NOT EXISTS idx_balance_sheet_symbol
+    ON balance_sheet (symbol, fiscal_date_ending);
+CREATE INDEX IF NOT EXISTS idx_cash_flow_symbol
+    ON cash_flow (symbol, fiscal_date_ending);
+CREATE INDEX IF NOT EXISTS idx_earnings_symbol
+    ON earnings (symbol, fiscal_date_ending);
+
+-- Super investor tables (SuperInvestorRepo)
+CREATE INDEX IF NOT EXISTS idx_super_investor_portfolio_holding_super_investor
+    ON super_investor_portfolio_holding (super_investor);
+CREATE INDEX IF NOT EXISTS idx_super_investor_portfolio_sector_analysis_super_investor
+    ON super_investor_portfolio_sector_analysis (super_investor);
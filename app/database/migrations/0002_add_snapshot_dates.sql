@@ -0,0 +1,29 @@
+-- Catalog of the dates for which each ibd table has a snapshot.
+-- Repos resolve the "latest" snapshot of a table with a primary key
+-- lookup here instead of scanning the table itself.
+CREATE TABLE IF NOT EXISTS snapshot_dates (
+    table_name TEXT NOT NULL,
+    registered_date TEXT NOT NULL,
+    registered_date_ts INT NOT NULL,
+    PRIMARY KEY (table_name, registered_date_ts)
+) WITHOUT ROWID;
+
+-- Backfill the catalog from the data we already have
+INSERT OR IGNORE INTO snapshot_dates
+    SELECT DISTINCT 'stocks_with_sector', registered_date, registered_date_ts FROM stocks_with_sector;
+INSERT OR IGNORE INTO snapshot_dates
+    SELECT DISTINCT 'dividend_leaders', registered_date, registered_date_ts FROM dividend_leaders;
+INSERT OR IGNORE INTO snapshot_dates
+    SELECT DISTINCT 'utility_leaders', registered_date, registered_date_ts FROM utility_leaders;
+INSERT OR IGNORE INTO snapshot_dates
+    SELECT DISTINCT 'reit_leaders', registered_date, registered_date_ts FROM reit_leaders;
+INSERT OR IGNORE INTO snapshot_dates
+    SELECT DISTINCT 'large_mid_cap_leaders_index', registered_date, registered_date_ts FROM large_mid_cap_leaders_index;
+INSERT OR IGNORE INTO snapshot_dates
+    SELECT DISTINCT 'small_mid_cap_leaders_index', registered_date, registered_date_ts FROM small_mid_cap_leaders_index;
+INSERT OR IGNORE INTO snapshot_dates
+    SELECT DISTINCT 'tech_leaders', registered_date, registered_date_ts FROM tech_leaders;
+INSERT OR IGNORE INTO snapshot_dates
+    SELECT DISTINCT 'top_composite_stocks', registered_date, registered_date_ts FROM top_composite_stocks;
+INSERT OR IGNORE INTO snapshot_dates
+    SELECT DISTINCT 'bottom_composite_stocks', registered_date, registered_date_ts FROM bottom_composite_stocks;
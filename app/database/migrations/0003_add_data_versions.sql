@@ -0,0 +1,7 @@
+-- Version of the data of each table. Every write to a table bumps its
+-- version in the same transaction, read caches are keyed on it.
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name TEXT PRIMARY KEY,
+    version INT NOT NULL,
+    updated_at TEXT NOT NULL
+) WITHOUT ROWID;
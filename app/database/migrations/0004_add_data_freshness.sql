@@ -0,0 +1,34 @@
+-- Date of the most recent data stored for each symbol of a table (dataset),
+-- the ingest writers keep it up to date so the "do we already have the
+-- latest data" checks don't have to load the rows themselves.
+CREATE TABLE IF NOT EXISTS data_freshness (
+    dataset TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    latest_date TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (dataset, symbol)
+) WITHOUT ROWID;
+
+INSERT OR REPLACE INTO data_freshness
+SELECT 'balance_sheet', symbol, MAX(fiscal_date_ending), datetime('now')
+FROM balance_sheet GROUP BY symbol;
+
+INSERT OR REPLACE INTO data_freshness
+SELECT 'cash_flow', symbol, MAX(fiscal_date_ending), datetime('now')
+FROM cash_flow GROUP BY symbol;
+
+INSERT OR REPLACE INTO data_freshness
+SELECT 'income_statement', symbol, MAX(fiscal_date_ending), datetime('now')
+FROM income_statement GROUP BY symbol;
+
+INSERT OR REPLACE INTO data_freshness
+SELECT 'earnings', symbol, MAX(fiscal_date_ending), datetime('now')
+FROM earnings GROUP BY symbol;
+
+INSERT OR REPLACE INTO data_freshness
+SELECT 'stock_overview', symbol, date(MAX(registered_date_ts), 'unixepoch', 'localtime'), datetime('now')
+FROM stock_overview GROUP BY symbol;
+
+INSERT OR REPLACE INTO data_freshness
+SELECT 'stock_time_series', symbol, date(MAX(registered_date_ts), 'unixepoch', 'localtime'), datetime('now')
+FROM stock_time_series GROUP BY symbol;
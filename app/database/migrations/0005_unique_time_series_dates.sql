@@ -0,0 +1,23 @@
+-- A time series has one row per date, the indexes of 0001 become unique
+-- and let the refreshes upsert only new or changed rows.
+-- Duplicates left by older writes are dropped first, the latest row wins.
+DELETE FROM stock_time_series WHERE rowid NOT IN (
+    SELECT MAX(rowid) FROM stock_time_series GROUP BY symbol, registered_date_ts
+);
+DROP INDEX IF EXISTS idx_stock_time_series_symbol;
+CREATE UNIQUE INDEX idx_stock_time_series_symbol
+    ON stock_time_series (symbol, registered_date_ts);
+
+DELETE FROM world_indices_time_series WHERE rowid NOT IN (
+    SELECT MAX(rowid) FROM world_indices_time_series GROUP BY index_name, registered_date_ts
+);
+DROP INDEX IF EXISTS idx_world_indices_time_series_index_name;
+CREATE UNIQUE INDEX idx_world_indices_time_series_index_name
+    ON world_indices_time_series (index_name, registered_date_ts);
+
+DELETE FROM economic_indicator_time_series WHERE rowid NOT IN (
+    SELECT MAX(rowid) FROM economic_indicator_time_series GROUP BY indicator_name, registered_date_ts
+);
+DROP INDEX IF EXISTS idx_economic_indicator_time_series_indicator_name;
+CREATE UNIQUE INDEX idx_economic_indicator_time_series_indicator_name
+    ON economic_indicator_time_series (indicator_name, registered_date_ts);
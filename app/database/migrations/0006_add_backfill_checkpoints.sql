@@ -0,0 +1,13 @@
+-- Progress of the historical backfills, one row per (job, date).
+-- A backfill that is started again skips the dates that are done and
+-- the ones ibd didn't publish, and retries the failed ones.
+CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+    job_name TEXT NOT NULL,
+    registered_date TEXT NOT NULL,
+    registered_date_ts INT NOT NULL,
+    -- 'done', 'missing' or 'failed'
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (job_name, registered_date_ts)
+) WITHOUT ROWID;
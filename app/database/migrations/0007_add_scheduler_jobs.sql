@@ -0,0 +1,33 @@
+-- Jobs of the ingest scheduler, one row per run of a dataset.
+-- The times are utc, 'YYYY-MM-DD HH:MM:SS' like datetime('now').
+CREATE TABLE IF NOT EXISTS scheduler_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dataset TEXT NOT NULL,
+    -- Arguments of the job, json with sorted keys so equal params are equal strings
+    params TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    priority INT NOT NULL,
+    -- 'pending', 'running', 'done' or 'failed'
+    status TEXT NOT NULL,
+    attempts INT NOT NULL,
+    max_attempts INT NOT NULL,
+    run_at TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    error TEXT,
+    result TEXT
+);
+
+-- A job that is already waiting is not queued twice
+CREATE UNIQUE INDEX IF NOT EXISTS idx_scheduler_jobs_pending
+ON scheduler_jobs (dataset, params) WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS idx_scheduler_jobs_status_run_at
+ON scheduler_jobs (status, run_at);
+
+-- Next time the cron trigger of each dataset fires
+CREATE TABLE IF NOT EXISTS scheduler_triggers (
+    dataset TEXT PRIMARY KEY,
+    next_run_at TEXT NOT NULL
+) WITHOUT ROWID;
@@ -180,7 +180,7 @@ CREATE TABLE stock_overview (
     outstanding_shares FLOAT,
     registered_date TEXT NOT NULL,
     registered_date_ts INT NOT NULL
-)
+);
 
 CREATE TABLE income_statement (
     symbol TEXT NOT NULL,
@@ -210,7 +210,7 @@ CREATE TABLE income_statement (
     ebit FLOAT,
     ebitda FLOAT,
     net_income FLOAT
-)
+);
 
 CREATE TABLE balance_sheet (
     symbol TEXT NOT NULL,
@@ -252,7 +252,7 @@ CREATE TABLE balance_sheet (
     retained_earnings FLOAT,
     common_stock FLOAT,
     common_stock_shares_outstanding FLOAT
-)
+);
 
 CREATE TABLE cash_flow(
     symbol TEXT NOT NULL,
@@ -285,7 +285,7 @@ CREATE TABLE cash_flow(
     change_in_cash_and_cash_equivalents FLOAT,
     change_in_exchange_rate FLOAT,
     net_income FLOAT
-)
+);
 
 CREATE TABLE earnings (
     symbol TEXT NOT NULL,
@@ -295,7 +295,7 @@ CREATE TABLE earnings (
     estimated_eps FLOAT,
     surprise FLOAT,
     surprise_percentage FLOAT
-)
+);
 
 CREATE TABLE stock_time_series (
     symbol TEXT NOT NULL,
@@ -1,25 +1,68 @@
 import sqlite3
 
 from app import settings
+from app.database.connection_pool import ConnectionPool
+from app.database.executor import DatabaseExecutor
+from app.database.migrate import apply_migrations
+
+CONNECTION_POOL = None
+DB_EXECUTOR = None
+
+def get_connection_pool() -> ConnectionPool:
+	global CONNECTION_POOL
+	if CONNECTION_POOL is None:
+		CONNECTION_POOL = ConnectionPool(
+			db_path=settings.db_path,
+			size=settings.db_pool_size,
+			timeout=settings.db_pool_timeout_seconds,
+			mmap_size=settings.db_mmap_size,
+			cache_size_kib=settings.db_cache_size_kib,
+			synchronous=settings.db_synchronous
+		)
+		# Scripts don't go through the api startup, make sure every
+		# process sees the tables the repos depend on
+		apply_migrations(CONNECTION_POOL.writer)
+
+	return CONNECTION_POOL
 
-DB_CONN = sqlite3.connect(settings.db_path)
 
 def get_db_conn() -> sqlite3.Connection:
-	global DB_CONN
-	if DB_CONN is None:
-		DB_CONN = sqlite3.connect(settings.db_path)
+	"""
+	Returns the writer connection of the pool, writes through it
+	are serialized
+	"""
+	return get_connection_pool().writer
 
-	return DB_CONN
+
+def get_db_executor() -> DatabaseExecutor:
+	global DB_EXECUTOR
+	if DB_EXECUTOR is None:
+		DB_EXECUTOR = DatabaseExecutor(max_workers=settings.db_pool_size)
+
+	return DB_EXECUTOR
 
 
 def close_db_conn():
-	global DB_CONN
-	DB_CONN.close()
+	global CONNECTION_POOL, DB_EXECUTOR
+	if DB_EXECUTOR is not None:
+		DB_EXECUTOR.shutdown()
+		DB_EXECUTOR = None
+
+	if CONNECTION_POOL is not None:
+		CONNECTION_POOL.log_stats()
+		CONNECTION_POOL.close()
+		CONNECTION_POOL = None
 
 
-async def create_db_conn():
-    db = sqlite3.connect(settings.db_path)
+def create_db_conn():
+    """
+    Yields a read only connection from the pool for the duration
+    of a request. This is a sync dependency so FastAPI runs it in its
+    threadpool and waiting for a free connection doesn't block the loop.
+    """
+    pool = get_connection_pool()
+    db = pool.acquire()
     try:
         yield db
     finally:
-        db.close()
+        pool.release(db)
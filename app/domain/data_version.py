@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class DataVersion:
+    table_name: str
+    version: int
+    # UTC time of the last write, None if the table was never written
+    updated_at: Optional[datetime]
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class SchedulerJob:
+    id: int
+    # Name of the job definition, see app.scheduler.jobs
+    dataset: str
+    params: Dict[str, Any]
+    provider: str
+    # Higher runs first
+    priority: int
+    status: str
+    attempts: int
+    max_attempts: int
+    # The times are UTC, a pending job doesn't start before run_at
+    run_at: datetime
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    error: Optional[str]
+    # Summary of the ingest report of a job that is done
+    result: Optional[str]
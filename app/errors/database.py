@@ -0,0 +1,6 @@
+class ConnectionPoolTimeoutError(Exception):
+	"""
+	Raised when no database connection became
+	available in the pool within the timeout
+	"""
+	pass
@@ -1,2 +1,9 @@
 class HttpRequestError(Exception):
-	pass
\ No newline at end of file
+	pass
+
+class CircuitOpenError(HttpRequestError):
+	"""
+	Raised without calling the host while
+	its circuit breaker is open
+	"""
+	pass
@@ -6,4 +6,11 @@ class IbdScrapeError(Exception):
 	Raised when something goes wrong during
 	data scraping from ibd 
 	"""
-	pass
\ No newline at end of file
+	pass
+
+class IbdTableNotFoundError(IbdScrapeError):
+	"""
+	Raised when ibd has no table for the
+	requested date, e.g. on market holidays
+	"""
+	pass
@@ -0,0 +1,12 @@
+class SchedulerError(Exception):
+	pass
+
+class InvalidCronExpressionError(SchedulerError):
+	pass
+
+class UnknownJobError(SchedulerError):
+	"""
+	Raised when a job is queued for a dataset
+	that has no job definition
+	"""
+	pass
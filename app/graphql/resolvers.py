@@ -24,7 +24,7 @@ from app.graphql.serializers import(
 
 
 async def top_composite_stocks_resolver(limit: int = 200) -> List[s.CompositeStock]:
-    top_comp_stocks = TopCompositeStocksService().get_latest_top_comp_stocks(limit=limit)
+    top_comp_stocks = await TopCompositeStocksService().get_latest_top_comp_stocks(limit=limit)
     return [
         serialize_composite_stock(comp_stock)
         for comp_stock in top_comp_stocks[:limit]
@@ -32,7 +32,7 @@ async def top_composite_stocks_resolver(limit: int = 200) -> List[s.CompositeSto
 
 
 async def reit_leaders_resolver() -> List[s.StockLeader]:
-    reit_leaders = ReitLeadersService().get_latest_reit_leaders()
+    reit_leaders = await ReitLeadersService().get_latest_reit_leaders()
 
     return [
         serialize_stock_leader(reit_leader)
@@ -41,7 +41,7 @@ async def reit_leaders_resolver() -> List[s.StockLeader]:
  
 
 async def sector_stocks_resolver(sector: s.Sector) -> List[s.CompositeStock]:
-    sector_stocks = StocksWithSectorService().get_sector_stocks(
+    sector_stocks = await StocksWithSectorService().get_sector_stocks(
         sector=Sector(sector.value)
     )
 
@@ -52,7 +52,7 @@ async def sector_stocks_resolver(sector: s.Sector) -> List[s.CompositeStock]:
 
 
 async def stock_historical_data_resolver(stock_symbol: str) -> List[s.CompositeStock]:
-    stock_historical_data = StocksWithSectorService().get_stock_historical_data(
+    stock_historical_data = await StocksWithSectorService().get_stock_historical_data(
         stock_symbol=stock_symbol
     )
 
@@ -63,7 +63,7 @@ async def stock_historical_data_resolver(stock_symbol: str) -> List[s.CompositeS
 
 
 async def sectors_performance_resolver(sector: Optional[s.Sector] = None) -> List[s.SectorPerformance]:
-    sectors_performance = StocksWithSectorService().get_sectors_performance(
+    sectors_performance = await StocksWithSectorService().get_sectors_performance(
         sector=Sector(sector.value) if sector else None
     )
     return [
@@ -80,7 +80,7 @@ async def sectors_performance_resolver(sector: Optional[s.Sector] = None) -> Lis
 
 
 async def tech_leaders_stocks_resolver() -> List[s.TechLeaderStock]:
-    tech_leaders_stocks = TechLeadersStocksService().get_latest_tech_leaders_stocks()
+    tech_leaders_stocks = await TechLeadersStocksService().get_latest_tech_leaders_stocks()
 
     return [
         serialize_tech_leader_stock(stock)
@@ -89,7 +89,7 @@ async def tech_leaders_stocks_resolver() -> List[s.TechLeaderStock]:
 
 
 async def dividend_leaders_resolver() -> List[s.StockLeader]:
-    dividend_leaders = DividendLeadersService().get_latest_dividend_leaders()
+    dividend_leaders = await DividendLeadersService().get_latest_dividend_leaders()
 
     return [
         serialize_stock_leader(dividend_leader)
@@ -98,7 +98,7 @@ async def dividend_leaders_resolver() -> List[s.StockLeader]:
 
 
 async def utility_leaders_resolver() -> List[s.StockLeader]:
-    utility_leaders = UtilityLeadersService().get_latest_utility_leaders()
+    utility_leaders = await UtilityLeadersService().get_latest_utility_leaders()
 
     return [
         serialize_stock_leader(utility_leader)
@@ -107,7 +107,7 @@ async def utility_leaders_resolver() -> List[s.StockLeader]:
 
 
 async def small_mid_cap_leaders_index_resolver() -> List[s.LeadersIndexStock]:
-    small_mid_cap_leaders_index = SmallMidCapLeadersIndexService.get_latest_leaders_index()
+    small_mid_cap_leaders_index = await SmallMidCapLeadersIndexService.get_latest_leaders_index()
 
     return [
         serialize_leaders_index_stock(stock)
@@ -116,7 +116,7 @@ async def small_mid_cap_leaders_index_resolver() -> List[s.LeadersIndexStock]:
 
 
 async def large_mid_cap_leaders_index_resolver() -> List[s.LeadersIndexStock]:
-    large_mid_cap_leaders_index = LargeMidCapLeadersIndexService.get_latest_leaders_index()
+    large_mid_cap_leaders_index = await LargeMidCapLeadersIndexService.get_latest_leaders_index()
 
     return [
         serialize_leaders_index_stock(stock)
@@ -127,7 +127,7 @@ async def large_mid_cap_leaders_index_resolver() -> List[s.LeadersIndexStock]:
 async def index_time_series_resolver(
     index: s.WorldIndex
 ) -> s.IndexTimeSeries:
-    index_time_series = TimeSeriesService().get_index_time_series(
+    index_time_series = await TimeSeriesService().get_index_time_series(
         index=WorldIndex(index.value)
     )
 
@@ -143,7 +143,7 @@ async def index_time_series_resolver(
 async def economic_indicator_time_series_resolver(
     indicator: s.EconomicIndicator
 ) -> s.EconomicIndicatorTimeSeries:
-    indicator_time_series = TimeSeriesService().get_economic_indicator_time_series(
+    indicator_time_series = await TimeSeriesService().get_economic_indicator_time_series(
         indicator=EconomicIndicator(indicator.value)
     )
     
@@ -158,7 +158,7 @@ async def economic_indicator_time_series_resolver(
 
 
 async def eps_rating_leaders_resolver() -> List[s.CompositeStock]:
-    eps_leaders = StocksWithSectorService().get_eps_rating_leaders()
+    eps_leaders = await StocksWithSectorService().get_eps_rating_leaders()
     return [
         serialize_composite_stock(stock)
         for stock in eps_leaders
@@ -166,7 +166,7 @@ async def eps_rating_leaders_resolver() -> List[s.CompositeStock]:
 
 
 async def rs_rating_leaders_resolver() -> List[s.CompositeStock]:
-    rs_leaders = StocksWithSectorService().get_rs_rating_leaders()
+    rs_leaders = await StocksWithSectorService().get_rs_rating_leaders()
     return [
         serialize_composite_stock(stock)
         for stock in rs_leaders
@@ -1,17 +1,70 @@
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
 
 from app import settings
 from app.http.http_client import HttpClient
+from app.http.rate_limiter import TokenBucket
+from app.http.resilience import RetryPolicy
 from app.errors.http import HttpRequestError
 from app.errors.alpha_vantage import AlphaVantageRequestError
 from app.domain.economic_indicator import EconomicIndicator
 
 class AlphaVantageClient(HttpClient):
-    def __init__(self) -> None:
+    _source = 'alpha_vantage'
+    # The api key is a secret
+    _unstored_params = frozenset({'apikey'})
+    # Shared by all the instances, the provider limit is per api key
+    _rate_limiter: Optional[TokenBucket] = None
+
+    def __init__(self, decode_json: bool = True) -> None:
+        """
+        :decode_json -> When False the company data methods return the raw
+        body, so a ParsePool worker can decode it off the event loop
+        """
         super().__init__(url=settings.alpha_vantage_base_url)
         self._token = settings.alpha_vantage_token
-    
+        self._decode_json = decode_json
+
+    @classmethod
+    def get_rate_limiter(cls) -> TokenBucket:
+        if cls._rate_limiter is None:
+            cls._rate_limiter = TokenBucket.per_minute(
+                requests=settings.alpha_vantage_requests_per_minute,
+                burst=settings.alpha_vantage_burst
+            )
+
+        return cls._rate_limiter
+
+    @classmethod
+    def get_retry_policy(cls) -> RetryPolicy:
+        return RetryPolicy(
+            max_attempts=settings.alpha_vantage_retry_max_attempts,
+            backoff_base_seconds=settings.alpha_vantage_retry_backoff_base_seconds,
+            backoff_max_seconds=settings.http_retry_backoff_max_seconds
+        )
+
+    def _should_retry(self, response, retry_policy: RetryPolicy) -> bool:
+        if super()._should_retry(response, retry_policy):
+            return True
+
+        # A throttled call gets a 200 with a Note (or Information) instead
+        # of the data, the body is small so only small bodies are decoded
+        if response.status_code == 200 and len(response.content) < 1024:
+            try:
+                body = response.json()
+            except ValueError:
+                return False
+
+            return isinstance(body, dict) and ('Note' in body or 'Information' in body)
+
+        return False
+
+    def _json_response(self, response) -> Union[Dict[str, Any], bytes]:
+        if not self._decode_json:
+            return response.content
+
+        return response.json()
+
     async def get_economic_indicator_time_series(self, indicator: EconomicIndicator) -> Dict[str, Any]:
         """
         Returns json response of global commodities
@@ -60,7 +113,7 @@ class AlphaVantageClient(HttpClient):
 
         return response.json()
 
-    async def get_company_overview(self, symbol: str) -> Dict[str, Any]:
+    async def get_company_overview(self, symbol: str) -> Union[Dict[str, Any], bytes]:
         """
         Returns json response of company overview from alpha vantage.
         Example response: https://www.alphavantage.co/query?function=OVERVIEW&symbol=IBM&apikey=demo
@@ -83,9 +136,9 @@ class AlphaVantageClient(HttpClient):
             logging.error(f"Call to get {symbol} overview failed with status: {response.status_code}")
             raise AlphaVantageRequestError(f"Call to get {symbol} overview failed, status: {response.status_code}, response {response.text}")
 
-        return response.json()
+        return self._json_response(response)
 
-    async def get_company_income_statements(self, symbol: str) -> Dict[str, Any]:
+    async def get_company_income_statements(self, symbol: str) -> Union[Dict[str, Any], bytes]:
         """
         Returns json response of income statement from alpha vantage.
         Example response: https://www.alphavantage.co/query?function=INCOME_STATEMENT&symbol=IBM&apikey=demo
@@ -108,9 +161,9 @@ class AlphaVantageClient(HttpClient):
             logging.error(f"Call to get {symbol} income statement failed with status: {response.status_code}")
             raise AlphaVantageRequestError(f"Call to get {symbol} income statement failed, status: {response.status_code}, response {response.text}")
 
-        return response.json()
+        return self._json_response(response)
 
-    async def get_company_balance_sheets(self, symbol: str) -> Dict[str, Any]:
+    async def get_company_balance_sheets(self, symbol: str) -> Union[Dict[str, Any], bytes]:
         """
         Returns json response of balance sheet from alpha vantage.
         Example response: https://www.alphavantage.co/query?function=BALANCE_SHEET&symbol=IBM&apikey=demo
@@ -133,9 +186,9 @@ class AlphaVantageClient(HttpClient):
             logging.error(f"Call to get {symbol} balance sheets failed with status: {response.status_code}")
             raise AlphaVantageRequestError(f"Call to get {symbol} balance sheets failed, status: {response.status_code}, response {response.text}")
 
-        return response.json()
+        return self._json_response(response)
 
-    async def get_company_cash_flows(self, symbol: str) -> Dict[str, Any]:
+    async def get_company_cash_flows(self, symbol: str) -> Union[Dict[str, Any], bytes]:
         """
         Returns json response of cash flow from alpha vantage.
         Example response: https://www.alphavantage.co/query?function=CASH_FLOW&symbol=IBM&apikey=demo
@@ -158,9 +211,9 @@ class AlphaVantageClient(HttpClient):
             logging.error(f"Call to get {symbol} cash flows failed with status: {response.status_code}")
             raise AlphaVantageRequestError(f"Call to get {symbol} cash flows failed, status: {response.status_code}, response {response.text}")
 
-        return response.json()
+        return self._json_response(response)
 
-    async def get_company_earnings(self, symbol: str) -> Dict[str, Any]:
+    async def get_company_earnings(self, symbol: str) -> Union[Dict[str, Any], bytes]:
         """
         Returns json response of earnings from alpha vantage.
         Example response: https://www.alphavantage.co/query?function=EARNINGS&symbol=IBM&apikey=demo
@@ -183,9 +236,9 @@ class AlphaVantageClient(HttpClient):
             logging.error(f"Call to get {symbol} earnings failed with status: {response.status_code}")
             raise AlphaVantageRequestError(f"Call to get {symbol} earnings failed, status: {response.status_code}, response {response.text}")
 
-        return response.json()
+        return self._json_response(response)
 
-    async def get_company_time_series(self, symbol: str) -> Dict[str, Any]:
+    async def get_company_time_series(self, symbol: str) -> Union[Dict[str, Any], bytes]:
         """
         Returns json response of adjusted weekly time series from alpha vantage.
         Example response: https://www.alphavantage.co/query?function=TIME_SERIES_WEEKLY_ADJUSTED&symbol=IBM&apikey=demo
@@ -208,4 +261,4 @@ class AlphaVantageClient(HttpClient):
             logging.error(f"Call to get {symbol} monthly time series failed with status: {response.status_code}")
             raise AlphaVantageRequestError(f"Call to get {symbol} monthly time series failed, status: {response.status_code}, response {response.text}")
 
-        return response.json()
+        return self._json_response(response)
@@ -1,20 +1,37 @@
 import logging
+from typing import Dict, Optional
 
 from app import settings
 from app.http.http_client import HttpClient
+from app.http.rate_limiter import TokenBucket
 from app.domain.super_investor import SuperInvestor
 from app.errors.http import HttpRequestError
 from app.errors.dataroma import DataromaRequestError
 
 class DataromaClient(HttpClient):
+    _source = 'dataroma'
+    # Politeness towards dataroma.com, shared by all the instances
+    _rate_limiter: Optional[TokenBucket] = None
+    # Super investor -> manager code of the dataroma holdings page,
+    # a new super investor needs an entry here
+    _super_investor_map: Dict[SuperInvestor, str] = {
+        SuperInvestor.Warren_Buffet: 'BRK',
+        SuperInvestor.Bill_Ackman: 'psc'
+    }
+
     def __init__(self) -> None:
         super().__init__(url=settings.dataroma_base_url)
 
-        self._super_investor_map = {
-            SuperInvestor.Warren_Buffet: 'BRK',
-            SuperInvestor.Bill_Ackman: 'psc'
-        }
-    
+    @classmethod
+    def get_rate_limiter(cls) -> TokenBucket:
+        if cls._rate_limiter is None:
+            cls._rate_limiter = TokenBucket(
+                rate=settings.dataroma_requests_per_second,
+                burst=settings.dataroma_burst
+            )
+
+        return cls._rate_limiter
+
     async def get_superinvestor_portfolio(self, super_investor: SuperInvestor) -> str:
         super_investor_symbol = self._super_investor_map[super_investor]
         try:
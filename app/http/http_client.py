@@ -1,13 +1,47 @@
-from typing import Dict,Any,Optional
+from typing import Dict,Any,FrozenSet,Optional,Tuple
+import asyncio
 import logging
+import sqlite3
 
 import httpx
 
-from app.errors.http import HttpRequestError
+from app import settings
+from app.errors.http import CircuitOpenError, HttpRequestError
+from app.http.rate_limiter import TokenBucket
+from app.http.resilience import CircuitBreaker, HttpStats, RetryPolicy
+from app.http.response_store import ResponseStore
 
 class HttpClient:
-    def __init__(self, url: str) -> None:
+    # One pooled httpx client per base url and pool settings, shared by
+    # every instance so that connections are kept alive for the whole run
+    # of a script. The event loop is stored too because the pooled
+    # connections can't be reused from another loop.
+    _clients: Dict[Tuple, Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]] = {}
+    # Shared by every client, see use_response_store
+    _response_store: Optional[ResponseStore] = None
+    # Name of the host in the response store, the base url when not set
+    _source: Optional[str] = None
+    # Params left out of the response store, secrets and the ones
+    # that change on every call
+    _unstored_params: FrozenSet[str] = frozenset()
+    # One circuit breaker per host, shared by every client of the host
+    _circuit_breakers: Dict[str, CircuitBreaker] = {}
+    # Source -> counters of the requests, see get_stats
+    _stats: Dict[str, HttpStats] = {}
+
+    def __init__(
+        self,
+        url: str,
+        limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None
+    ) -> None:
         self._url = url
+        self._limits = limits or httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds
+        )
+        self._http2 = settings.http_http2 if http2 is None else http2
         self._headers = {
             'User-Agent': 'Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:105.0) Gecko/20100101 Firefox/105.0',
             'Connection': 'keep-alive',
@@ -17,6 +51,135 @@ class HttpClient:
             'Sec-Fetch-Site': 'same-origin'
         }
 
+    @property
+    def _client_key(self) -> Tuple:
+        # Instances with different pool limits don't share a client
+        return (
+            self._url,
+            self._limits.max_connections,
+            self._limits.max_keepalive_connections,
+            self._limits.keepalive_expiry,
+            self._http2
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client, client_loop = self._clients.get(self._client_key, (None, None))
+        if client is None or client.is_closed or client_loop is not loop:
+            # http2 needs the h2 package, it's an optional dependency of httpx
+            client = httpx.AsyncClient(limits=self._limits, http2=self._http2)
+            self._clients[self._client_key] = (client, loop)
+
+        return client
+
+    @classmethod
+    def get_rate_limiter(cls) -> Optional[TokenBucket]:
+        """
+        Subclasses return a bucket shared by their instances to space
+        out the requests to their host, requests are not limited by default
+        """
+        return None
+
+    @classmethod
+    def get_retry_policy(cls) -> RetryPolicy:
+        """
+        Subclasses return the policy that fits their host
+        """
+        return RetryPolicy(
+            max_attempts=settings.http_retry_max_attempts,
+            backoff_base_seconds=settings.http_retry_backoff_base_seconds,
+            backoff_max_seconds=settings.http_retry_backoff_max_seconds
+        )
+
+    def _get_circuit_breaker(self) -> CircuitBreaker:
+        host = httpx.URL(self._url).host
+        if host not in self._circuit_breakers:
+            self._circuit_breakers[host] = CircuitBreaker(
+                failure_threshold=settings.http_circuit_failure_threshold,
+                reset_timeout_seconds=settings.http_circuit_reset_seconds
+            )
+
+        return self._circuit_breakers[host]
+
+    def _get_source_stats(self) -> HttpStats:
+        return self._stats.setdefault(self.source, HttpStats())
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, HttpStats]:
+        """
+        Returns source -> counters of the requests sent since the start
+        of the process (or the last reset_stats)
+        """
+        return dict(HttpClient._stats)
+
+    @classmethod
+    def log_stats(cls) -> None:
+        for source, stats in cls.get_stats().items():
+            logging.info(
+                f"{source}: {stats.requests} requests, {stats.retries} retries, {stats.failed} failed, "
+                f"{stats.short_circuited} short circuited, statuses {stats.statuses}"
+            )
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        HttpClient._stats.clear()
+        HttpClient._circuit_breakers.clear()
+
+    def _should_retry(self, response: httpx.Response, retry_policy: RetryPolicy) -> bool:
+        return response.status_code in retry_policy.retry_statuses
+
+    @classmethod
+    def get_response_store(cls) -> Optional[ResponseStore]:
+        if HttpClient._response_store is None and settings.response_store_mode:
+            HttpClient._response_store = ResponseStore(
+                path=settings.response_store_path,
+                mode=settings.response_store_mode
+            )
+
+        return HttpClient._response_store
+
+    @classmethod
+    def use_response_store(cls, store: Optional[ResponseStore]) -> None:
+        """
+        Records the responses of every client to the store or replays
+        them from it, depending on the mode of the store
+        """
+        HttpClient._response_store = store
+
+    @property
+    def source(self) -> str:
+        return self._source or self._url
+
+    def _stored_params(self, params: Optional[Dict[str,Any]]) -> Dict[str,Any]:
+        return {
+            key: value for key, value in (params or {}).items()
+            if key not in self._unstored_params
+        }
+
+    async def open(self) -> 'HttpClient':
+        self._get_client()
+        return self
+
+    async def close(self) -> None:
+        """
+        Does nothing, the pooled client is shared with the other instances
+        of the base url and may be in use by them. The pooled clients are
+        closed with close_all at the end of the run.
+        """
+
+    @classmethod
+    async def close_all(cls) -> None:
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        for client, _ in clients:
+            if not client.is_closed:
+                await client.aclose()
+
+    async def __aenter__(self) -> 'HttpClient':
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
 
     async def _make_request(
         self,
@@ -27,22 +190,112 @@ class HttpClient:
         headers: Optional[Dict[str,Any]] = None,
         timeout: int = 5
     ) -> Dict[str,Any]:
-        async with httpx.AsyncClient() as client:
-            request = client.build_request(
+        client = self._get_client()
+        request = client.build_request(
+            method=method,
+            url=f'{self._url}{endpoint}',
+            json=json,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+        )
+
+        response_store = self.get_response_store()
+        if response_store is not None and response_store.replaying:
+            # No network and no rate limit, the scrapers run at the speed of the disk
+            response = await asyncio.to_thread(
+                response_store.load,
+                source=self.source,
                 method=method,
-                url=f'{self._url}{endpoint}',
-                json=json,
-                params=params,
-                headers=headers,
-                timeout=timeout,
+                endpoint=endpoint,
+                params=self._stored_params(params),
+                request=request
             )
+            if response is None:
+                logging.error(f"No recorded response for {request.url!r}")
+                raise HttpRequestError()
+
+            return response
+
+        response = await self._send(client, request)
+
+        # A response that is still retryable once the attempts ran out
+        # (e.g. a throttled 200) is not data, it's not recorded
+        if (
+            response_store is not None
+            and response.is_success
+            and not self._should_retry(response, self.get_retry_policy())
+        ):
+            try:
+                await asyncio.to_thread(
+                    response_store.save,
+                    source=self.source,
+                    method=method,
+                    endpoint=endpoint,
+                    params=self._stored_params(params),
+                    response=response
+                )
+            except (OSError, sqlite3.Error) as err:
+                # Recording is best effort, the scrape goes on
+                logging.error(f"Storing the response of {request.url!r} failed with: {str(err)}")
+
+        return response
+
+    async def _send(self, client: httpx.AsyncClient, request: httpx.Request) -> httpx.Response:
+        """
+        Sends the request, retrying the connection errors and the retryable
+        responses of the retry policy. Fails fast while the circuit of the
+        host is open.
+        """
+        retry_policy = self.get_retry_policy()
+        circuit_breaker = self._get_circuit_breaker()
+        stats = self._get_source_stats()
+        rate_limiter = self.get_rate_limiter()
+        attempt = 0
+        while True:
+            attempt += 1
+            if not circuit_breaker.allow_request():
+                stats.short_circuited += 1
+                logging.error(f"Http call to {request.url!r} rejected, the circuit of the host is open")
+                raise CircuitOpenError()
+
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+
+            stats.requests += 1
             try:
                 response = await client.send(request)
             except httpx.RequestError as exc:
-                logging.error(f"Http call to {exc.request.url!r} failed with: {str(exc)}")
-                raise HttpRequestError()
-            
-            return response
+                circuit_breaker.record_failure()
+                if attempt >= retry_policy.max_attempts:
+                    stats.failed += 1
+                    logging.error(f"Http call to {exc.request.url!r} failed with: {str(exc)}")
+                    raise HttpRequestError()
+
+                delay = retry_policy.backoff_seconds(attempt)
+            else:
+                stats.statuses[response.status_code] = stats.statuses.get(response.status_code, 0) + 1
+                # The host answered, only its errors count against the circuit
+                if response.status_code >= 500:
+                    circuit_breaker.record_failure()
+                else:
+                    circuit_breaker.record_success()
+
+                if not self._should_retry(response, retry_policy):
+                    return response
+
+                delay = retry_policy.retry_after_seconds(response)
+                if delay is None:
+                    delay = retry_policy.backoff_seconds(attempt)
+
+                if attempt >= retry_policy.max_attempts or delay > retry_policy.max_retry_after_seconds:
+                    # The caller handles the error response as before
+                    stats.failed += 1
+                    return response
+
+            stats.retries += 1
+            logging.warning(f"Retrying http call to {request.url!r} in {delay:.1f}s, attempt {attempt} failed")
+            await asyncio.sleep(delay)
 
     async def get(
         self,
@@ -63,4 +316,3 @@ class HttpClient:
     @property
     def headers(self):
         return self._headers
-    
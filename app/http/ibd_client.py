@@ -1,14 +1,29 @@
 import logging
+from typing import Optional
+
+import httpx
 
 from app import settings
 from app.http.http_client import HttpClient
+from app.http.rate_limiter import TokenBucket
 from app.errors.http import HttpRequestError
 from app.errors.ibd import IbdRequestError
 
 
 class IbdClient(HttpClient):
+    _source = 'ibd'
+    # Politeness towards investors.com, shared by all the instances
+    _rate_limiter: Optional[TokenBucket] = None
+
     def __init__(self) -> None:
-        super().__init__(url=settings.ibd_base_url)
+        super().__init__(
+            url=settings.ibd_base_url,
+            limits=httpx.Limits(
+                max_connections=settings.ibd_max_connections,
+                max_keepalive_connections=settings.ibd_max_connections,
+                keepalive_expiry=settings.http_keepalive_expiry_seconds
+            )
+        )
         
         self._month_dict = {
             1: "jan",
@@ -25,6 +40,16 @@ class IbdClient(HttpClient):
             12: "dec"
         }
 
+    @classmethod
+    def get_rate_limiter(cls) -> TokenBucket:
+        if cls._rate_limiter is None:
+            cls._rate_limiter = TokenBucket(
+                rate=settings.ibd_requests_per_second,
+                burst=settings.ibd_burst
+            )
+
+        return cls._rate_limiter
+
     def _get_month_name(self, month: int) -> str:
         return self._month_dict.get(month)
 
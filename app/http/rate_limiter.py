@@ -0,0 +1,74 @@
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+
+class TokenBucket:
+    """
+    Async token bucket rate limiter. The bucket holds at most burst tokens
+    and refills at rate tokens per second, every acquire takes one token.
+
+    A caller that finds the bucket empty reserves the next token and sleeps
+    until it's refilled, so waiters are served in the order they arrived
+    and the bucket doesn't need a lock (or an event loop) of its own.
+    Over any window of t seconds at most burst + rate * t acquires return.
+    """
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ) -> None:
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        if burst < 1:
+            raise ValueError('burst must be at least 1')
+
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._updated_at = clock()
+
+    @classmethod
+    def per_minute(
+        cls,
+        requests: int,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ) -> 'TokenBucket':
+        """
+        Returns a bucket that never allows more than requests acquires
+        in any 60 seconds window, the burst is taken out of the refill rate
+        """
+        if requests <= burst:
+            raise ValueError('requests must be greater than burst')
+
+        return cls(rate=(requests - burst) / 60, burst=burst, clock=clock, sleep=sleep)
+
+    @property
+    def available_tokens(self) -> float:
+        self._refill()
+        return max(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._burst,
+            self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        self._refill()
+        # Reserve the token even if it's not there yet, a negative balance
+        # is the queue of callers that are waiting for a refill
+        self._tokens -= 1
+        if self._tokens < 0:
+            # A cancelled waiter keeps its reservation, the callers behind
+            # it already sleep until their own slot and giving the token
+            # back would let a new caller go in between them
+            await self._sleep(-self._tokens / self._rate)
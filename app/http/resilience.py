@@ -0,0 +1,113 @@
+import datetime as dt
+import email.utils
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, FrozenSet, Optional
+
+import httpx
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How HttpClient retries a request. Attempts are spaced out by an
+    exponential backoff with full jitter (a random delay between 0 and
+    base * 2^(attempt-1), capped at max), a Retry-After header of the
+    response is used instead when present.
+    """
+    max_attempts: int = 3
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 30
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    # A longer Retry-After is not waited for, the response is returned
+    max_retry_after_seconds: float = 60
+
+    def backoff_seconds(self, attempt: int, uniform: Callable[[float, float], float] = random.uniform) -> float:
+        return uniform(0, min(self.backoff_max_seconds, self.backoff_base_seconds * 2 ** (attempt - 1)))
+
+    @classmethod
+    def retry_after_seconds(cls, response: httpx.Response, now: Optional[dt.datetime] = None) -> Optional[float]:
+        """
+        Returns the delay of the Retry-After header, given either in
+        seconds or as an http date. None when there is no valid header.
+        """
+        retry_after = response.headers.get('retry-after')
+        if retry_after is None:
+            return None
+
+        if retry_after.strip().isdigit():
+            return float(retry_after)
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        if now is None:
+            now = dt.datetime.now(dt.timezone.utc)
+        return max((retry_at - now).total_seconds(), 0.0)
+
+
+class CircuitBreaker:
+    """
+    Stops the requests to a host that keeps failing. After
+    failure_threshold consecutive failures the circuit opens and the
+    requests fail fast. Once reset_timeout_seconds have passed one trial
+    request is let through (half open): a success closes the circuit,
+    a failure opens it again.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow_request(self) -> bool:
+        if self._state == self.CLOSED:
+            return True
+
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self._reset_timeout_seconds:
+            self._state = self.HALF_OPEN
+            return True
+
+        # Open, or half open with the trial request in flight
+        return False
+
+    def record_success(self) -> None:
+        self._state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self._failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = self._clock()
+
+
+@dataclass
+class HttpStats:
+    # Attempts sent to the host, retries included
+    requests: int = 0
+    retries: int = 0
+    # Requests that failed after their last attempt
+    failed: int = 0
+    # Requests rejected by an open circuit
+    short_circuited: int = 0
+    # Response status code -> count
+    statuses: dict = field(default_factory=dict)
@@ -0,0 +1,155 @@
+from typing import Any, Callable, Dict, Optional
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import httpx
+
+
+class ResponseStore:
+    """
+    Local store of raw response bodies. The bodies are gzipped and named
+    by their sha256, a page fetched many times is written once. An sqlite
+    index maps (source, method, endpoint, params, fetched_at) to a body.
+
+    In 'record' mode HttpClient saves every successful response, in
+    'replay' mode it serves the latest recorded response instead of
+    calling the host, which lets the scrapers re-ingest old dates offline.
+    """
+    RECORD = 'record'
+    REPLAY = 'replay'
+
+    def __init__(self, path: str, mode: str = RECORD, clock: Callable[[], float] = time.time) -> None:
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f'Unknown response store mode: {mode}')
+
+        self._path = path
+        self._mode = mode
+        self._clock = clock
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(path, 'objects'), exist_ok=True)
+        # Used from the threads of asyncio.to_thread, the lock serializes the access
+        self._index = sqlite3.connect(os.path.join(path, 'index.db'), check_same_thread=False)
+        with self._index:
+            self._index.execute(
+                """CREATE TABLE IF NOT EXISTS responses(
+                    source TEXT NOT NULL,
+                    method TEXT NOT NULL,
+                    endpoint TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    status_code INTEGER NOT NULL,
+                    content_type TEXT,
+                    digest TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )"""
+            )
+            self._index.execute(
+                """CREATE INDEX IF NOT EXISTS idx_responses_request
+                ON responses (source, method, endpoint, params, fetched_at)"""
+            )
+
+    @property
+    def replaying(self) -> bool:
+        return self._mode == self.REPLAY
+
+    @classmethod
+    def _params_key(cls, params: Optional[Dict[str, Any]]) -> str:
+        return json.dumps(params or {}, sort_keys=True, default=str)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._path, 'objects', digest[:2], f'{digest}.gz')
+
+    def _write_object(self, digest: str, body: bytes) -> None:
+        object_path = self._object_path(digest)
+        if os.path.exists(object_path):
+            return
+
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        tmp_path = f'{object_path}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(gzip.compress(body))
+        # Readers never see a half written body
+        os.replace(tmp_path, object_path)
+
+    def save(
+        self,
+        source: str,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        response: httpx.Response
+    ) -> str:
+        """
+        Stores the body of the response and returns its digest
+        """
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        self._write_object(digest, body)
+        with self._lock, self._index:
+            self._index.execute(
+                "INSERT INTO responses VALUES(?,?,?,?,?,?,?,?)",
+                (
+                    source,
+                    method,
+                    endpoint,
+                    self._params_key(params),
+                    response.status_code,
+                    response.headers.get('content-type'),
+                    digest,
+                    self._clock()
+                )
+            )
+
+        return digest
+
+    def load(
+        self,
+        source: str,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        fetched_before: Optional[float] = None,
+        request: Optional[httpx.Request] = None
+    ) -> Optional[httpx.Response]:
+        """
+        Returns the latest recorded response of the request, None when
+        it was never recorded.
+        :fetched_before -> Ignore the responses recorded after this timestamp
+        :request -> Attached to the response, like a response of httpx
+        """
+        with self._lock:
+            row = self._index.execute(
+                """SELECT status_code, content_type, digest FROM responses
+                WHERE source=? AND method=? AND endpoint=? AND params=? AND fetched_at<=?
+                ORDER BY fetched_at DESC LIMIT 1""",
+                (
+                    source,
+                    method,
+                    endpoint,
+                    self._params_key(params),
+                    float('inf') if fetched_before is None else fetched_before
+                )
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status_code, content_type, digest = row
+        with open(self._object_path(digest), 'rb') as f:
+            body = gzip.decompress(f.read())
+
+        headers = {'content-type': content_type} if content_type else {}
+        return httpx.Response(
+            status_code=status_code,
+            headers=headers,
+            content=body,
+            request=request
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._index.close()
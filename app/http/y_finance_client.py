@@ -1,5 +1,6 @@
 import logging
 import datetime as dt
+from typing import Optional
 
 from app import settings
 from app.http.http_client import HttpClient
@@ -8,6 +9,10 @@ from app.domain.world_index import WorldIndex
 from app.errors.y_finance import YFinanceRequestError
 
 class YFinanceClient(HttpClient):
+    _source = 'y_finance'
+    # The period moves with the date of the call, replay the latest recorded one
+    _unstored_params = frozenset({'period1', 'period2'})
+
     def __init__(self) -> None:
         super().__init__(url=settings.y_finance_base_url)
 
@@ -18,16 +23,20 @@ class YFinanceClient(HttpClient):
             WorldIndex.Nyse_Composite: '%5ENYA'
         }
 
-    async def get_world_index_time_series(self, index: WorldIndex):
+    async def get_world_index_time_series(self, index: WorldIndex, since: Optional[dt.date] = None):
         """
         Returns csv response of world index price series in 
         yahoo finance webiste
+        :since -> First date of the window, the last 5 years when None
         """
         today = dt.datetime.today() # Get today's date and time
-        five_years_ago = today - dt.timedelta(days=365*5) # Subtract 5 years' worth of days
+        if since is None:
+            start = today - dt.timedelta(days=365*5) # Subtract 5 years' worth of days
+        else:
+            start = dt.datetime(since.year, since.month, since.day)
         index_symbol = self._index_to_symbol_map.get(index)
         params = {
-            'period1': int(five_years_ago.timestamp()),
+            'period1': int(start.timestamp()),
             'period2': int(today.timestamp()),
             'interval': '1wk',
             'events': 'history',
@@ -3,6 +3,8 @@ from strawberry.fastapi import GraphQLRouter
 
 from app.graphql.api import schema
 from app import dependencies
+from app.cache import close_cache_backend
+from app.api.http_caching import NotModified, not_modified_handler
 from app.api.routers import (
     economic_indicators,
     world_indices,
@@ -10,12 +12,16 @@ from app.api.routers import (
     sectors,
     stocks,
     machine_learning,
-    chatbot
+    chatbot,
+    scheduler,
+    support
 )
 
 app = FastAPI()
 graphql_app = GraphQLRouter(schema)
 
+app.add_exception_handler(NotModified, not_modified_handler)
+
 app.include_router(graphql_app, prefix="/graphql")
 app.include_router(economic_indicators.router)
 app.include_router(world_indices.router)
@@ -24,7 +30,15 @@ app.include_router(sectors.router)
 app.include_router(stocks.router)
 app.include_router(machine_learning.router)
 app.include_router(chatbot.router)
+app.include_router(scheduler.router)
+app.include_router(support.router)
+
+@app.on_event("startup")
+def startup_event():
+    # Opening the pool applies the pending migrations
+    dependencies.get_connection_pool()
 
 @app.on_event("shutdown")
-def shutdown_event():
+async def shutdown_event():
+    await close_cache_backend()
     dependencies.close_db_conn()
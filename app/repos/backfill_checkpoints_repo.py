@@ -0,0 +1,32 @@
+from typing import Dict, Optional
+
+from app.domain.date import Date
+from app.repos.sql_repo import SqlRepo
+
+
+class BackfillCheckpointsRepo(SqlRepo):
+    """
+    Repo for backfill_checkpoints table. The table keeps the
+    outcome of every date a backfill job has processed.
+    """
+    DONE = 'done'
+    MISSING = 'missing'
+    FAILED = 'failed'
+
+    def save_checkpoint(self, job_name: str, date: Date, status: str, error: Optional[str] = None) -> None:
+        with self._db_conn as con:
+            con.execute(
+                "INSERT OR REPLACE INTO backfill_checkpoints VALUES(?,?,?,?,?,datetime('now'))",
+                (job_name, date.date_string, date.date_ts, status, error)
+            )
+
+    def get_checkpoints(self, job_name: str) -> Dict[str, str]:
+        """
+        Returns registered_date -> status for the dates of job_name
+        """
+        cur = self._db_conn.cursor()
+        result = cur.execute(
+            "SELECT registered_date, status FROM backfill_checkpoints WHERE job_name=?",
+            (job_name, )
+        )
+        return {row[0]: row[1] for row in result}
@@ -1,6 +1,9 @@
+from datetime import datetime
 from typing import Tuple, Any, Optional, List
 
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.data_freshness_repo import DataFreshnessRepo
 from app.domain.balance_sheet import BalanceSheet
 
 class BalanceSheetRepo(SqlRepo):
@@ -108,6 +111,13 @@ class BalanceSheetRepo(SqlRepo):
                 INSERT INTO balance_sheet VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', self._create_row_tuple_from_model(balance_sheet)
             )
+            DataVersionsRepo.bump_version(con, 'balance_sheet')
+            DataFreshnessRepo.mark_fresh(
+                con,
+                dataset='balance_sheet',
+                symbol=balance_sheet.symbol,
+                latest_date=datetime.strptime(balance_sheet.fiscal_date_ending, '%Y-%m-%d').date()
+            )
 
     def get_balance_sheets_for_symbol(
         self,
@@ -178,3 +188,44 @@ class BalanceSheetRepo(SqlRepo):
                 DELETE FROM balance_sheet WHERE symbol = ?
                 ''', (symbol, )
             )
+            DataVersionsRepo.bump_version(con, 'balance_sheet')
+            DataFreshnessRepo.clear(con, dataset='balance_sheet', symbol=symbol)
+
+    def replace_balance_sheets_of_symbol(self, symbol: str, balance_sheets: List[BalanceSheet]) -> None:
+        """
+        Replaces the balance sheet reports of symbol in a single transaction,
+        readers see either the old or the new reports
+        """
+        self.replace_balance_sheets_rows_of_symbol(
+            symbol,
+            [self._create_row_tuple_from_model(balance_sheet) for balance_sheet in balance_sheets]
+        )
+
+    def replace_balance_sheets_rows_of_symbol(self, symbol: str, rows: List[Tuple[Any]]) -> None:
+        """
+        Same as replace_balance_sheets_of_symbol with the rows of
+        _create_row_tuple_from_model, e.g. built by a parser in a worker process
+        """
+        with self._db_conn as con:
+            con.execute(
+                '''
+                DELETE FROM balance_sheet WHERE symbol = ?
+                ''', (symbol, )
+            )
+            con.executemany(
+                '''
+                INSERT INTO balance_sheet VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows
+            )
+            DataVersionsRepo.bump_version(con, 'balance_sheet')
+            DataFreshnessRepo.clear(con, dataset='balance_sheet', symbol=symbol)
+            if rows:
+                DataFreshnessRepo.mark_fresh(
+                    con,
+                    dataset='balance_sheet',
+                    symbol=symbol,
+                    latest_date=max(
+                        datetime.strptime(row[1], '%Y-%m-%d').date()
+                        for row in rows
+                    )
+                )
@@ -1,6 +1,9 @@
+from datetime import datetime
 from typing import Tuple, Any, Optional, List
 
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.data_freshness_repo import DataFreshnessRepo
 from app.domain.cash_flow import CashFlow
 
 class CashFlowRepo(SqlRepo):
@@ -90,6 +93,13 @@ class CashFlowRepo(SqlRepo):
                 INSERT INTO cash_flow VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', self._create_row_tuple_from_model(cash_flow)
             )
+            DataVersionsRepo.bump_version(con, 'cash_flow')
+            DataFreshnessRepo.mark_fresh(
+                con,
+                dataset='cash_flow',
+                symbol=cash_flow.symbol,
+                latest_date=datetime.strptime(cash_flow.fiscal_date_ending, '%Y-%m-%d').date()
+            )
 
     def get_cash_flows_for_symbol(
         self,
@@ -151,3 +161,44 @@ class CashFlowRepo(SqlRepo):
                 DELETE FROM cash_flow WHERE symbol = ?
                 ''', (symbol, )
             )
+            DataVersionsRepo.bump_version(con, 'cash_flow')
+            DataFreshnessRepo.clear(con, dataset='cash_flow', symbol=symbol)
+
+    def replace_cash_flows_of_symbol(self, symbol: str, cash_flows: List[CashFlow]) -> None:
+        """
+        Replaces the cash flow reports of symbol in a single transaction,
+        readers see either the old or the new reports
+        """
+        self.replace_cash_flows_rows_of_symbol(
+            symbol,
+            [self._create_row_tuple_from_model(cash_flow) for cash_flow in cash_flows]
+        )
+
+    def replace_cash_flows_rows_of_symbol(self, symbol: str, rows: List[Tuple[Any]]) -> None:
+        """
+        Same as replace_cash_flows_of_symbol with the rows of
+        _create_row_tuple_from_model, e.g. built by a parser in a worker process
+        """
+        with self._db_conn as con:
+            con.execute(
+                '''
+                DELETE FROM cash_flow WHERE symbol = ?
+                ''', (symbol, )
+            )
+            con.executemany(
+                '''
+                INSERT INTO cash_flow VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows
+            )
+            DataVersionsRepo.bump_version(con, 'cash_flow')
+            DataFreshnessRepo.clear(con, dataset='cash_flow', symbol=symbol)
+            if rows:
+                DataFreshnessRepo.mark_fresh(
+                    con,
+                    dataset='cash_flow',
+                    symbol=symbol,
+                    latest_date=max(
+                        datetime.strptime(row[1], '%Y-%m-%d').date()
+                        for row in rows
+                    )
+                )
@@ -8,6 +8,8 @@ from app.domain.price import Price
 from app.domain.percentage import Percentage
 from app.domain.symbol_appearances_count import SymbolAppearancesCount
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.snapshot_dates_repo import SnapshotDatesRepo
 from app.domain.composite_stock import CompositeStock
 from app.domain.date import Date
 
@@ -58,6 +60,8 @@ class CompositeStockRepo(SqlRepo):
                 f"INSERT INTO {self._table_name} VALUES(?,?,?,?,?,?,?,?,?,?,?,?)",
                 [self._create_row_tuple_from_model(composite_stock, date) for composite_stock in data]
             )
+			SnapshotDatesRepo.add_snapshot_date(con, self._table_name, date)
+			DataVersionsRepo.bump_version(con, self._table_name)
 
 	def get_comp_stocks_for_date(
 		self,
@@ -106,7 +110,8 @@ class CompositeStockRepo(SqlRepo):
 			FROM {self._table_name} 
 			WHERE registered_date=(
                 SELECT registered_date
-                FROM {self._table_name}
+                FROM snapshot_dates
+                WHERE table_name='{self._table_name}'
                 ORDER BY registered_date_ts DESC
                 LIMIT 1
             )
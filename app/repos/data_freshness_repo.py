@@ -0,0 +1,76 @@
+import sqlite3
+from datetime import date
+from typing import Dict, Optional
+
+from app.repos.sql_repo import SqlRepo
+
+
+class DataFreshnessRepo(SqlRepo):
+    """
+    Repo for data_freshness table. The table keeps the date of the most
+    recent data stored for each (dataset, symbol), the dataset is the
+    name of the table the data are stored in.
+    """
+    @classmethod
+    def mark_fresh(
+        cls,
+        con: sqlite3.Connection,
+        dataset: str,
+        symbol: str,
+        latest_date: date
+    ) -> None:
+        """
+        Records that data up to latest_date are stored for symbol, an older
+        date doesn't replace a newer one. Must be called with the connection
+        of the transaction that writes the data.
+        """
+        con.execute(
+            """INSERT INTO data_freshness VALUES(?, ?, ?, datetime('now'))
+            ON CONFLICT(dataset, symbol) DO UPDATE SET
+                latest_date=MAX(latest_date, excluded.latest_date),
+                updated_at=excluded.updated_at""",
+            (dataset, symbol, latest_date.isoformat())
+        )
+
+    @classmethod
+    def clear(cls, con: sqlite3.Connection, dataset: str, symbol: str) -> None:
+        """
+        Must be called with the connection of the transaction that
+        deletes the data of symbol
+        """
+        con.execute(
+            "DELETE FROM data_freshness WHERE dataset=? AND symbol=?",
+            (dataset, symbol)
+        )
+
+    def get_latest_dates(self, dataset: str) -> Dict[str, date]:
+        """
+        Returns symbol -> date of the most recent data for every
+        symbol of the dataset
+        """
+        cur = self._db_conn.cursor()
+        result = cur.execute(
+            "SELECT symbol, latest_date FROM data_freshness WHERE dataset=?",
+            (dataset, )
+        )
+        return {row[0]: date.fromisoformat(row[1]) for row in result}
+
+    def get_all_latest_dates(self) -> Dict[str, Dict[str, date]]:
+        """
+        Returns dataset -> symbol -> date of the most recent data
+        """
+        cur = self._db_conn.cursor()
+        result = cur.execute("SELECT dataset, symbol, latest_date FROM data_freshness")
+        latest_dates = {}
+        for row in result:
+            latest_dates.setdefault(row[0], {})[row[1]] = date.fromisoformat(row[2])
+
+        return latest_dates
+
+    def get_latest_date(self, dataset: str, symbol: str) -> Optional[date]:
+        cur = self._db_conn.cursor()
+        row = cur.execute(
+            "SELECT latest_date FROM data_freshness WHERE dataset=? AND symbol=?",
+            (dataset, symbol)
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
@@ -0,0 +1,56 @@
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, Tuple
+
+from app.domain.data_version import DataVersion
+from app.repos.sql_repo import SqlRepo
+
+
+class DataVersionsRepo(SqlRepo):
+    """
+    Repo for data_versions table. The table keeps a counter
+    for each table that is incremented every time its data change.
+    """
+    @classmethod
+    def _create_model_from_row(cls, row: Tuple[Any]) -> DataVersion:
+        return DataVersion(
+            table_name=row[0],
+            version=row[1],
+            updated_at=datetime.strptime(row[2], '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+        )
+
+    @classmethod
+    def bump_version(cls, con: sqlite3.Connection, table_name: str) -> None:
+        """
+        Increments the version of table_name. Must be called with the
+        connection of the transaction that changes the table so that
+        the new version is visible together with the new data.
+        """
+        con.execute(
+            """INSERT INTO data_versions VALUES(?, 1, datetime('now'))
+            ON CONFLICT(table_name) DO UPDATE SET
+                version=version + 1,
+                updated_at=excluded.updated_at""",
+            (table_name, )
+        )
+
+    def get_versions(self) -> Dict[str, int]:
+        cur = self._db_conn.cursor()
+        result = cur.execute("SELECT table_name, version FROM data_versions")
+        return {row[0]: row[1] for row in result}
+
+    def get_data_versions(self) -> Dict[str, DataVersion]:
+        cur = self._db_conn.cursor()
+        result = cur.execute("SELECT table_name, version, updated_at FROM data_versions")
+        return {row[0]: self._create_model_from_row(row) for row in result}
+
+    def get_version(self, table_name: str) -> int:
+        """
+        Returns the version of table_name, 0 if it was never written
+        """
+        cur = self._db_conn.cursor()
+        row = cur.execute(
+            "SELECT version FROM data_versions WHERE table_name=?",
+            (table_name, )
+        ).fetchone()
+        return row[0] if row else 0
@@ -1,6 +1,9 @@
+from datetime import datetime
 from typing import Tuple, Any, Optional, List
 
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.data_freshness_repo import DataFreshnessRepo
 from app.domain.earnings import Earnings
 
 class EarningsRepo(SqlRepo):
@@ -44,6 +47,13 @@ class EarningsRepo(SqlRepo):
                 INSERT INTO earnings VALUES (? ,? ,? ,?, ?, ?, ?)
                 ''', self._create_row_tuple_from_model(earnings)
             )
+            DataVersionsRepo.bump_version(con, 'earnings')
+            DataFreshnessRepo.mark_fresh(
+                con,
+                dataset='earnings',
+                symbol=earnings.symbol,
+                latest_date=datetime.strptime(earnings.fiscal_date_ending, '%Y-%m-%d').date()
+            )
 
     def get_earnings_for_symbol(
         self,
@@ -81,3 +91,44 @@ class EarningsRepo(SqlRepo):
                 DELETE FROM earnings WHERE symbol = ?
                 ''', (symbol, )
             )
+            DataVersionsRepo.bump_version(con, 'earnings')
+            DataFreshnessRepo.clear(con, dataset='earnings', symbol=symbol)
+
+    def replace_earnings_of_symbol(self, symbol: str, earnings: List[Earnings]) -> None:
+        """
+        Replaces the earnings reports of symbol in a single transaction,
+        readers see either the old or the new reports
+        """
+        self.replace_earnings_rows_of_symbol(
+            symbol,
+            [self._create_row_tuple_from_model(e) for e in earnings]
+        )
+
+    def replace_earnings_rows_of_symbol(self, symbol: str, rows: List[Tuple[Any]]) -> None:
+        """
+        Same as replace_earnings_of_symbol with the rows of
+        _create_row_tuple_from_model, e.g. built by a parser in a worker process
+        """
+        with self._db_conn as con:
+            con.execute(
+                '''
+                DELETE FROM earnings WHERE symbol = ?
+                ''', (symbol, )
+            )
+            con.executemany(
+                '''
+                INSERT INTO earnings VALUES (? ,? ,? ,?, ?, ?, ?)
+                ''', rows
+            )
+            DataVersionsRepo.bump_version(con, 'earnings')
+            DataFreshnessRepo.clear(con, dataset='earnings', symbol=symbol)
+            if rows:
+                DataFreshnessRepo.mark_fresh(
+                    con,
+                    dataset='earnings',
+                    symbol=symbol,
+                    latest_date=max(
+                        datetime.strptime(row[1], '%Y-%m-%d').date()
+                        for row in rows
+                    )
+                )
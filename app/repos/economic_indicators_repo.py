@@ -1,4 +1,4 @@
-from typing import Tuple, Any, List
+from typing import Tuple, Any, List, Optional
 import datetime as dt
 
 from app.domain.time_series import EconomicIndicatorTimeSeriesEntry
@@ -6,6 +6,7 @@ from app.domain.price import Price
 from app.domain.date import Date
 from app.domain.economic_indicator import EconomicIndicator
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
 
 class EconomicIndicatorTimeSeriesRepo(SqlRepo):
     """
@@ -52,6 +53,54 @@ class EconomicIndicatorTimeSeriesRepo(SqlRepo):
                     for time_serie in time_series
                 ]
             )
+            DataVersionsRepo.bump_version(con, 'economic_indicator_time_series')
+
+    def upsert_time_series_for_indicator(
+        self,
+        indicator: EconomicIndicator,
+        time_series: List[EconomicIndicatorTimeSeriesEntry]
+    ) -> int:
+        """
+        Inserts the new entries of the time series and updates the ones
+        that changed, the rest of the stored history is not touched.
+        Returns the number of rows that were inserted or updated.
+        """
+        with self._db_conn as con:
+            cur = con.executemany(
+                """INSERT INTO economic_indicator_time_series VALUES(?,?,?,?,?)
+                ON CONFLICT(indicator_name, registered_date_ts) DO UPDATE SET
+                    value=excluded.value,
+                    unit=excluded.unit,
+                    registered_date=excluded.registered_date
+                WHERE (value, unit) IS NOT (excluded.value, excluded.unit)""",
+                [
+                    self._create_row_tuple_from_model(indicator=indicator.value, time_serie=time_serie)
+                    for time_serie in time_series
+                ]
+            )
+            changed_rows = max(cur.rowcount, 0)
+            if changed_rows:
+                DataVersionsRepo.bump_version(con, 'economic_indicator_time_series')
+
+        return changed_rows
+
+    def get_latest_date_of_indicator(self, indicator: EconomicIndicator) -> Optional[dt.date]:
+        """
+        Returns the date of the newest stored entry of the indicator,
+        None when nothing is stored for it yet
+        """
+        cur = self._db_conn.cursor()
+        row = cur.execute(
+            """SELECT registered_date FROM economic_indicator_time_series
+            WHERE indicator_name=?
+            ORDER BY registered_date_ts DESC
+            LIMIT 1""",
+            (indicator.value, )
+        ).fetchone()
+        if row is None:
+            return None
+
+        return dt.datetime.strptime(row[0], "%d-%m-%Y").date()
 
     def get_indicator_time_series(self, indicator: EconomicIndicator) -> List[EconomicIndicatorTimeSeriesEntry]:
         cur = self._db_conn.cursor()
@@ -1,6 +1,9 @@
+from datetime import datetime
 from typing import Tuple, Any, Optional, List
 
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.data_freshness_repo import DataFreshnessRepo
 from app.domain.date import Date
 from app.domain.income_statement import IncomeStatement
 
@@ -77,13 +80,20 @@ class IncomeStatementRepo(SqlRepo):
     
     def add_income_statement(
         self,
-        income_statment: IncomeStatement
+        income_statement: IncomeStatement
     ):
         with self._db_conn as con:
             con.execute(
                 '''
                 INSERT INTO income_statement VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', self._create_row_tuple_from_model(income_statment)
+                ''', self._create_row_tuple_from_model(income_statement)
+            )
+            DataVersionsRepo.bump_version(con, 'income_statement')
+            DataFreshnessRepo.mark_fresh(
+                con,
+                dataset='income_statement',
+                symbol=income_statement.symbol,
+                latest_date=datetime.strptime(income_statement.fiscal_date_ending, '%Y-%m-%d').date()
             )
 
     def get_income_statements_for_symbol(
@@ -143,3 +153,44 @@ class IncomeStatementRepo(SqlRepo):
                 DELETE FROM income_statement WHERE symbol = ?
                 ''', (symbol, )
             )
+            DataVersionsRepo.bump_version(con, 'income_statement')
+            DataFreshnessRepo.clear(con, dataset='income_statement', symbol=symbol)
+
+    def replace_income_statements_of_symbol(self, symbol: str, income_statements: List[IncomeStatement]) -> None:
+        """
+        Replaces the income statement reports of symbol in a single transaction,
+        readers see either the old or the new reports
+        """
+        self.replace_income_statements_rows_of_symbol(
+            symbol,
+            [self._create_row_tuple_from_model(income_statement) for income_statement in income_statements]
+        )
+
+    def replace_income_statements_rows_of_symbol(self, symbol: str, rows: List[Tuple[Any]]) -> None:
+        """
+        Same as replace_income_statements_of_symbol with the rows of
+        _create_row_tuple_from_model, e.g. built by a parser in a worker process
+        """
+        with self._db_conn as con:
+            con.execute(
+                '''
+                DELETE FROM income_statement WHERE symbol = ?
+                ''', (symbol, )
+            )
+            con.executemany(
+                '''
+                INSERT INTO income_statement VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows
+            )
+            DataVersionsRepo.bump_version(con, 'income_statement')
+            DataFreshnessRepo.clear(con, dataset='income_statement', symbol=symbol)
+            if rows:
+                DataFreshnessRepo.mark_fresh(
+                    con,
+                    dataset='income_statement',
+                    symbol=symbol,
+                    latest_date=max(
+                        datetime.strptime(row[1], '%Y-%m-%d').date()
+                        for row in rows
+                    )
+                )
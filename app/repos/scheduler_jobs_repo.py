@@ -0,0 +1,263 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.domain.scheduler_job import SchedulerJob
+from app.repos.sql_repo import SqlRepo
+
+
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _format_time(time: datetime) -> str:
+    return time.astimezone(timezone.utc).strftime(_TIME_FORMAT)
+
+
+def _parse_time(time: Optional[str]) -> Optional[datetime]:
+    if time is None:
+        return None
+
+    return datetime.strptime(time, _TIME_FORMAT).replace(tzinfo=timezone.utc)
+
+
+class SchedulerJobsRepo(SqlRepo):
+    """
+    Repo for scheduler_jobs and scheduler_triggers tables
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    _COLUMNS = """id, dataset, params, provider, priority, status, attempts, max_attempts,
+        run_at, created_at, started_at, finished_at, error, result"""
+
+    @classmethod
+    def encode_params(cls, params: Optional[Dict[str, Any]]) -> str:
+        return json.dumps(params or {}, sort_keys=True)
+
+    @classmethod
+    def _create_model_from_row(cls, row: Tuple[Any]) -> SchedulerJob:
+        return SchedulerJob(
+            id=row[0],
+            dataset=row[1],
+            params=json.loads(row[2]),
+            provider=row[3],
+            priority=row[4],
+            status=row[5],
+            attempts=row[6],
+            max_attempts=row[7],
+            run_at=_parse_time(row[8]),
+            created_at=_parse_time(row[9]),
+            started_at=_parse_time(row[10]),
+            finished_at=_parse_time(row[11]),
+            error=row[12],
+            result=row[13]
+        )
+
+    def enqueue(
+        self,
+        dataset: str,
+        params: Optional[Dict[str, Any]],
+        provider: str,
+        priority: int,
+        max_attempts: int,
+        run_at: datetime,
+        now: datetime
+    ) -> Optional[int]:
+        """
+        Adds a pending job and returns its id. Returns None when an
+        identical job (same dataset and params) is already pending.
+        """
+        with self._db_conn as con:
+            cur = con.execute(
+                f"""INSERT OR IGNORE INTO scheduler_jobs ({self._COLUMNS})
+                VALUES(NULL, ?, ?, ?, ?, ?, 0, ?, ?, ?, NULL, NULL, NULL, NULL)""",
+                (
+                    dataset,
+                    self.encode_params(params),
+                    provider,
+                    priority,
+                    self.PENDING,
+                    max_attempts,
+                    _format_time(run_at),
+                    _format_time(now)
+                )
+            )
+            if cur.rowcount == 0:
+                return None
+
+            return cur.lastrowid
+
+    def enqueue_unless_active(
+        self,
+        dataset: str,
+        params: Optional[Dict[str, Any]],
+        provider: str,
+        priority: int,
+        max_attempts: int,
+        now: datetime
+    ) -> Tuple[SchedulerJob, bool]:
+        """
+        Returns the pending or running job of dataset with params, or
+        queues one when there is none. The flag is True when the job was
+        queued by this call.
+        """
+        with self._db_conn as con:
+            row = con.execute(
+                f"""SELECT {self._COLUMNS} FROM scheduler_jobs
+                WHERE dataset=? AND params=? AND status IN (?, ?)
+                ORDER BY id DESC LIMIT 1""",
+                (dataset, self.encode_params(params), self.PENDING, self.RUNNING)
+            ).fetchone()
+            if row is not None:
+                return self._create_model_from_row(row), False
+
+            job_id = self.enqueue(dataset, params, provider, priority, max_attempts, run_at=now, now=now)
+            if job_id is None:
+                # Queued by another process in the meantime
+                return self.get_pending_job(dataset, params), False
+
+            return self.get_job(job_id), True
+
+    def get_pending_job(self, dataset: str, params: Optional[Dict[str, Any]]) -> Optional[SchedulerJob]:
+        cur = self._db_conn.cursor()
+        row = cur.execute(
+            f"SELECT {self._COLUMNS} FROM scheduler_jobs WHERE dataset=? AND params=? AND status=?",
+            (dataset, self.encode_params(params), self.PENDING)
+        ).fetchone()
+        return self._create_model_from_row(row) if row else None
+
+    def get_due_jobs(self, now: datetime) -> List[SchedulerJob]:
+        """
+        Returns the pending jobs that can start at now, the ones
+        with higher priority first and then the oldest first
+        """
+        cur = self._db_conn.cursor()
+        result = cur.execute(
+            f"""SELECT {self._COLUMNS} FROM scheduler_jobs
+            WHERE status=? AND run_at<=?
+            ORDER BY priority DESC, run_at, id""",
+            (self.PENDING, _format_time(now))
+        )
+        return [self._create_model_from_row(row) for row in result]
+
+    def get_next_run_at(self) -> Optional[datetime]:
+        """
+        Returns the earliest run_at of the pending jobs
+        """
+        cur = self._db_conn.cursor()
+        row = cur.execute(
+            "SELECT MIN(run_at) FROM scheduler_jobs WHERE status=?",
+            (self.PENDING, )
+        ).fetchone()
+        return _parse_time(row[0])
+
+    def mark_running(self, job_id: int, now: datetime) -> bool:
+        """
+        Claims a pending job, returns False when it isn't pending anymore
+        """
+        with self._db_conn as con:
+            cur = con.execute(
+                """UPDATE scheduler_jobs SET status=?, attempts=attempts+1, started_at=?, finished_at=NULL
+                WHERE id=? AND status=?""",
+                (self.RUNNING, _format_time(now), job_id, self.PENDING)
+            )
+            return cur.rowcount == 1
+
+    def mark_done(self, job_id: int, now: datetime, result: Optional[str] = None) -> None:
+        with self._db_conn as con:
+            con.execute(
+                "UPDATE scheduler_jobs SET status=?, finished_at=?, error=NULL, result=? WHERE id=?",
+                (self.DONE, _format_time(now), result, job_id)
+            )
+
+    def mark_failed(self, job_id: int, now: datetime, error: str) -> None:
+        with self._db_conn as con:
+            con.execute(
+                "UPDATE scheduler_jobs SET status=?, finished_at=?, error=? WHERE id=?",
+                (self.FAILED, _format_time(now), error, job_id)
+            )
+
+    def mark_retry(self, job_id: int, now: datetime, error: str, run_at: datetime) -> bool:
+        """
+        Puts a failed attempt back in the queue to run again at run_at.
+        Returns False when an identical job was queued in the meantime,
+        the attempt is marked failed then and the queued job runs instead.
+        """
+        with self._db_conn as con:
+            cur = con.execute(
+                """UPDATE OR IGNORE scheduler_jobs SET status=?, finished_at=?, error=?, run_at=?
+                WHERE id=?""",
+                (self.PENDING, _format_time(now), error, _format_time(run_at), job_id)
+            )
+            if cur.rowcount == 1:
+                return True
+
+            self.mark_failed(job_id, now, error)
+            return False
+
+    def requeue_running(self, now: datetime) -> int:
+        """
+        Puts back in the queue the jobs left running by a scheduler that
+        stopped without finishing them. Returns the number of jobs.
+        """
+        with self._db_conn as con:
+            cur = con.execute(
+                """UPDATE OR IGNORE scheduler_jobs SET status=?, run_at=?, error='Interrupted'
+                WHERE status=?""",
+                (self.PENDING, _format_time(now), self.RUNNING)
+            )
+            requeued = cur.rowcount
+            # The rest have an identical job pending already
+            con.execute(
+                "UPDATE scheduler_jobs SET status=?, finished_at=?, error='Interrupted' WHERE status=?",
+                (self.FAILED, _format_time(now), self.RUNNING)
+            )
+
+        return requeued
+
+    def get_job(self, job_id: int) -> Optional[SchedulerJob]:
+        cur = self._db_conn.cursor()
+        row = cur.execute(f"SELECT {self._COLUMNS} FROM scheduler_jobs WHERE id=?", (job_id, )).fetchone()
+        return self._create_model_from_row(row) if row else None
+
+    def get_jobs(
+        self,
+        status: Optional[str] = None,
+        dataset: Optional[str] = None,
+        limit: int = 100
+    ) -> List[SchedulerJob]:
+        """
+        Returns the most recent jobs first
+        """
+        query = f"SELECT {self._COLUMNS} FROM scheduler_jobs WHERE TRUE"
+        query_params = []
+        if status is not None:
+            query += " AND status=?"
+            query_params.append(status)
+
+        if dataset is not None:
+            query += " AND dataset=?"
+            query_params.append(dataset)
+
+        query += " ORDER BY id DESC LIMIT ?"
+        query_params.append(limit)
+        cur = self._db_conn.cursor()
+        result = cur.execute(query, query_params)
+        return [self._create_model_from_row(row) for row in result]
+
+    def get_next_trigger_times(self) -> Dict[str, datetime]:
+        """
+        Returns dataset -> next time its cron trigger fires
+        """
+        cur = self._db_conn.cursor()
+        result = cur.execute("SELECT dataset, next_run_at FROM scheduler_triggers")
+        return {row[0]: _parse_time(row[1]) for row in result}
+
+    def set_next_trigger_time(self, dataset: str, next_run_at: datetime) -> None:
+        with self._db_conn as con:
+            con.execute(
+                "INSERT OR REPLACE INTO scheduler_triggers VALUES(?, ?)",
+                (dataset, _format_time(next_run_at))
+            )
@@ -0,0 +1,51 @@
+import sqlite3
+from typing import List, Optional
+
+from app.domain.date import Date
+from app.repos.sql_repo import SqlRepo
+
+
+class SnapshotDatesRepo(SqlRepo):
+    """
+    Repo for snapshot_dates table. The table keeps the dates
+    for which each ibd table has a snapshot.
+    """
+    @classmethod
+    def add_snapshot_date(
+        cls,
+        con: sqlite3.Connection,
+        table_name: str,
+        date: Date
+    ) -> None:
+        """
+        Registers a snapshot of table_name for date. Must be called with
+        the connection of the transaction that stores the snapshot so that
+        the catalog is updated atomically with the data.
+        """
+        con.execute(
+            "INSERT OR REPLACE INTO snapshot_dates VALUES(?,?,?)",
+            (table_name, date.date_string, date.date_ts)
+        )
+
+    def get_latest_snapshot_date(self, table_name: str) -> Optional[str]:
+        cur = self._db_conn.cursor()
+        query = """SELECT registered_date
+            FROM snapshot_dates
+            WHERE table_name=?
+            ORDER BY registered_date_ts DESC
+            LIMIT 1"""
+
+        query_params = (table_name, )
+        row = cur.execute(query, query_params).fetchone()
+        return row[0] if row else None
+
+    def get_snapshot_dates(self, table_name: str) -> List[str]:
+        cur = self._db_conn.cursor()
+        query = """SELECT registered_date
+            FROM snapshot_dates
+            WHERE table_name=?
+            ORDER BY registered_date_ts DESC"""
+
+        query_params = (table_name, )
+        result = cur.execute(query, query_params)
+        return [row[0] for row in result]
@@ -6,6 +6,8 @@ from app.domain.percentage import Percentage
 from app.domain.date import Date
 from app.domain.symbol_appearances_count import SymbolAppearancesCount
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.snapshot_dates_repo import SnapshotDatesRepo
 
 class StockLeadersRepo(SqlRepo):
     # Repos that inherit from this class must override table name
@@ -44,6 +46,8 @@ class StockLeadersRepo(SqlRepo):
                 f"INSERT INTO {self._table_name} VALUES(?,?,?,?,?,?,?)",
                 [self._create_row_tuple_from_model(stock_leader, date) for stock_leader in data]
             )
+            SnapshotDatesRepo.add_snapshot_date(con, self._table_name, date)
+            DataVersionsRepo.bump_version(con, self._table_name)
 
     def get_latest_stock_leaders(self) -> List[StockLeader]:
         cur = self._db_conn.cursor()
@@ -58,7 +62,8 @@ class StockLeadersRepo(SqlRepo):
             FROM {self._table_name} 
             WHERE registered_date=(
                 SELECT registered_date
-                FROM {self._table_name}
+                FROM snapshot_dates
+                WHERE table_name='{self._table_name}'
                 ORDER BY registered_date_ts DESC
                 LIMIT 1
             )"""
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Tuple, Any, Optional
 
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.data_freshness_repo import DataFreshnessRepo
 from app.domain.date import Date
 from app.domain.stock_overview import StockOverview
 
@@ -96,6 +98,41 @@ class StockOverviewRepo(SqlRepo):
                 INSERT INTO stock_overview VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ''', self._create_row_tuple_from_model(stock_overview, date)
             )
+            DataVersionsRepo.bump_version(con, 'stock_overview')
+            DataFreshnessRepo.mark_fresh(
+                con,
+                dataset='stock_overview',
+                symbol=stock_overview.symbol,
+                latest_date=datetime.fromtimestamp(date.date_ts).date()
+            )
+
+    def replace_stock_overview_for_symbol(
+        self,
+        date: Date,
+        stock_overview: StockOverview
+    ) -> None:
+        """
+        Replaces the overview rows of the symbol in a single transaction,
+        readers see either the old or the new overview
+        """
+        with self._db_conn as con:
+            con.execute(
+                '''
+                DELETE FROM stock_overview WHERE symbol = ?
+                ''', (stock_overview.symbol, )
+            )
+            con.execute(
+                '''
+                INSERT INTO stock_overview VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', self._create_row_tuple_from_model(stock_overview, date)
+            )
+            DataVersionsRepo.bump_version(con, 'stock_overview')
+            DataFreshnessRepo.mark_fresh(
+                con,
+                dataset='stock_overview',
+                symbol=stock_overview.symbol,
+                latest_date=datetime.fromtimestamp(date.date_ts).date()
+            )
 
     def get_stock_overview(
         self,
@@ -165,6 +202,8 @@ class StockOverviewRepo(SqlRepo):
                 DELETE FROM stock_overview WHERE symbol = ?
                 ''', (symbol, )
             )
+            DataVersionsRepo.bump_version(con, 'stock_overview')
+            DataFreshnessRepo.clear(con, dataset='stock_overview', symbol=symbol)
 
     def get_latest_registered_datetime_for_symbol(self, symbol: str) -> datetime:
         cur  = self._db_conn.cursor()
@@ -5,6 +5,8 @@ from app.domain.time_series import StockTimeSeriesEntry
 from app.domain.price import Price
 from app.domain.date import Date
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.data_freshness_repo import DataFreshnessRepo
 
 class StockTimeSeriesRepo(SqlRepo):
     """
@@ -55,6 +57,64 @@ class StockTimeSeriesRepo(SqlRepo):
                     for time_serie in time_series
                 ]
             )
+            DataVersionsRepo.bump_version(con, 'stock_time_series')
+            DataFreshnessRepo.clear(con, dataset='stock_time_series', symbol=symbol)
+            if time_series:
+                DataFreshnessRepo.mark_fresh(
+                    con,
+                    dataset='stock_time_series',
+                    symbol=symbol,
+                    latest_date=dt.datetime.fromtimestamp(
+                        max(time_serie.registered_date.date_ts for time_serie in time_series)
+                    ).date()
+                )
+
+    def upsert_time_series_for_symbol(self, symbol: str, time_series: List[StockTimeSeriesEntry]) -> int:
+        """
+        Inserts the new entries of the time series and updates the ones
+        that changed, the rest of the stored history is not touched.
+        Returns the number of rows that were inserted or updated.
+        """
+        return self.upsert_time_series_rows_for_symbol(
+            symbol,
+            [
+                self._create_row_tuple_from_model(symbol=symbol, time_serie=time_serie)
+                for time_serie in time_series
+            ]
+        )
+
+    def upsert_time_series_rows_for_symbol(self, symbol: str, rows: List[Tuple[Any]]) -> int:
+        """
+        Same as upsert_time_series_for_symbol with the rows of
+        _create_row_tuple_from_model, e.g. built by a parser in a worker process
+        """
+        with self._db_conn as con:
+            cur = con.executemany(
+                """INSERT INTO stock_time_series VALUES(?,?,?,?,?,?,?,?,?)
+                ON CONFLICT(symbol, registered_date_ts) DO UPDATE SET
+                    open_price=excluded.open_price,
+                    high_price=excluded.high_price,
+                    low_price=excluded.low_price,
+                    close_price=excluded.close_price,
+                    volume=excluded.volume,
+                    dividend_amount=excluded.dividend_amount,
+                    registered_date=excluded.registered_date
+                WHERE (open_price, high_price, low_price, close_price, volume, dividend_amount)
+                    IS NOT (excluded.open_price, excluded.high_price, excluded.low_price,
+                            excluded.close_price, excluded.volume, excluded.dividend_amount)""",
+                rows
+            )
+            changed_rows = max(cur.rowcount, 0)
+            if changed_rows:
+                DataVersionsRepo.bump_version(con, 'stock_time_series')
+                DataFreshnessRepo.mark_fresh(
+                    con,
+                    dataset='stock_time_series',
+                    symbol=symbol,
+                    latest_date=dt.datetime.fromtimestamp(max(row[8] for row in rows)).date()
+                )
+
+        return changed_rows
 
     def get_symbol_time_series(self, symbol: str) -> List[StockTimeSeriesEntry]:
         cur = self._db_conn.cursor()
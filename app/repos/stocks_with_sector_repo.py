@@ -12,6 +12,8 @@ from app.domain.sector_performance import SectorPerformance, SectorPriceChangePc
 from app.domain.sector import Sector
 from app.domain.smr_rating import SmrRating
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.snapshot_dates_repo import SnapshotDatesRepo
 
 
 class StocksWithSectorRepo(SqlRepo):
@@ -78,6 +80,8 @@ class StocksWithSectorRepo(SqlRepo):
                         for stock in sector_stocks
                     ]
                 )
+            SnapshotDatesRepo.add_snapshot_date(con, 'stocks_with_sector', date)
+            DataVersionsRepo.bump_version(con, 'stocks_with_sector')
 
     def get_sector_stocks(
         self,
@@ -100,7 +104,8 @@ class StocksWithSectorRepo(SqlRepo):
 			FROM stocks_with_sector 
 			WHERE sector_name=? AND registered_date=(
                 SELECT registered_date
-                FROM stocks_with_sector
+                FROM snapshot_dates
+                WHERE table_name='stocks_with_sector'
                 ORDER BY registered_date_ts DESC
                 LIMIT 1
             )
@@ -195,7 +200,8 @@ class StocksWithSectorRepo(SqlRepo):
 			FROM stocks_with_sector 
 			WHERE registered_date=(
                 SELECT registered_date
-                FROM stocks_with_sector
+                FROM snapshot_dates
+                WHERE table_name='stocks_with_sector'
                 ORDER BY registered_date_ts DESC
                 LIMIT 1
             )
@@ -226,7 +232,8 @@ class StocksWithSectorRepo(SqlRepo):
 			FROM stocks_with_sector 
 			WHERE registered_date=(
                 SELECT registered_date
-                FROM stocks_with_sector
+                FROM snapshot_dates
+                WHERE table_name='stocks_with_sector'
                 ORDER BY registered_date_ts DESC
                 LIMIT 1
             )
@@ -258,7 +265,8 @@ class StocksWithSectorRepo(SqlRepo):
 			WHERE acc_dis_rating='A+'
             AND registered_date=(
                 SELECT registered_date
-                FROM stocks_with_sector
+                FROM snapshot_dates
+                WHERE table_name='stocks_with_sector'
                 ORDER BY registered_date_ts DESC
                 LIMIT 1
             )
@@ -290,7 +298,8 @@ class StocksWithSectorRepo(SqlRepo):
 			WHERE acc_dis_rating='E'
             AND registered_date=(
                 SELECT registered_date
-                FROM stocks_with_sector
+                FROM snapshot_dates
+                WHERE table_name='stocks_with_sector'
                 ORDER BY registered_date_ts DESC
                 LIMIT 1
             )
@@ -321,7 +330,8 @@ class StocksWithSectorRepo(SqlRepo):
 			FROM stocks_with_sector 
 			WHERE registered_date=(
                 SELECT registered_date
-                FROM stocks_with_sector
+                FROM snapshot_dates
+                WHERE table_name='stocks_with_sector'
                 ORDER BY registered_date_ts DESC
                 LIMIT 1
             )
@@ -356,7 +366,8 @@ class StocksWithSectorRepo(SqlRepo):
 			FROM stocks_with_sector 
 			WHERE symbol=? AND registered_date=(
                 SELECT registered_date
-                FROM stocks_with_sector
+                FROM snapshot_dates
+                WHERE table_name='stocks_with_sector'
                 ORDER BY registered_date_ts DESC
                 LIMIT 1
             )
@@ -1,6 +1,7 @@
 from typing import Tuple, Any, List
 
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
 from app.domain.super_investor import (
     SuperInvestor,
     SuperInvestorPortfolio,
@@ -55,6 +56,7 @@ class SuperInvestorRepo(SqlRepo):
                     for portfolio_holding in portfolio_holdings
                 ]
             )
+            DataVersionsRepo.bump_version(con, 'super_investor_portfolio_holding')
     
     def delete_super_investor_portfolio_holdings(
         self,
@@ -62,6 +64,7 @@ class SuperInvestorRepo(SqlRepo):
     ):
         with self._db_conn as con:
             con.execute(f"DELETE FROM super_investor_portfolio_holding WHERE super_investor='{super_investor.value}'")
+            DataVersionsRepo.bump_version(con, 'super_investor_portfolio_holding')
     
     def get_super_investor_portfolio_holdings(
         self,
@@ -103,6 +106,7 @@ class SuperInvestorRepo(SqlRepo):
                     for sector_analysis_entry in portfolio_sector_analysis
                 ]
             )
+            DataVersionsRepo.bump_version(con, 'super_investor_portfolio_sector_analysis')
 
     def delete_super_investor_portfolio_sector_analysis(
         self,
@@ -110,6 +114,7 @@ class SuperInvestorRepo(SqlRepo):
     ):
         with self._db_conn as con:
             con.execute(f"DELETE FROM super_investor_portfolio_sector_analysis WHERE super_investor='{super_investor.value}'")
+            DataVersionsRepo.bump_version(con, 'super_investor_portfolio_sector_analysis')
     
     def get_super_investor_portfolio_sector_analysis(
         self,
@@ -157,6 +162,42 @@ class SuperInvestorRepo(SqlRepo):
         self.delete_super_investor_portfolio_holdings(super_investor)
         self.delete_super_investor_portfolio_sector_analysis(super_investor)
 
+    def replace_super_investor_portfolios(self, portfolios: List[SuperInvestorPortfolio]):
+        """
+        Replaces the holdings and the sector analysis of the super investors
+        of the portfolios in one transaction, readers see either the old
+        portfolios or all the new ones. Other super investors are not touched.
+        """
+        super_investors = [(portfolio.super_investor.value, ) for portfolio in portfolios]
+        with self._db_conn as con:
+            con.executemany("DELETE FROM super_investor_portfolio_holding WHERE super_investor=?", super_investors)
+            con.executemany("DELETE FROM super_investor_portfolio_sector_analysis WHERE super_investor=?", super_investors)
+            con.executemany(
+                "INSERT INTO super_investor_portfolio_holding VALUES(?, ?, ?, ?, ?, ?)",
+                [
+                    self._create_row_tuple_from_portfolio_holding_model(
+                        super_investor=portfolio.super_investor,
+                        portfolio_holding=portfolio_holding
+                    )
+                    for portfolio in portfolios
+                    for portfolio_holding in portfolio.holdings
+                ]
+            )
+            con.executemany(
+                "INSERT INTO super_investor_portfolio_sector_analysis VALUES(?, ?, ?)",
+                [
+                    (
+                        portfolio.super_investor.value,
+                        sector_analysis_entry.sector_name,
+                        sector_analysis_entry.sector_pct
+                    )
+                    for portfolio in portfolios
+                    for sector_analysis_entry in portfolio.sector_analysis
+                ]
+            )
+            DataVersionsRepo.bump_version(con, 'super_investor_portfolio_holding')
+            DataVersionsRepo.bump_version(con, 'super_investor_portfolio_sector_analysis')
+
     def add_super_investor_grand_portfolio(
         self,
         super_investor_grand_portfolio: SuperInvestorGrandPortfolio
@@ -173,10 +214,34 @@ class SuperInvestorRepo(SqlRepo):
                     for portfolio_entry in super_investor_grand_portfolio.portfolio
                 ]
             )
+            DataVersionsRepo.bump_version(con, 'super_investor_grand_portfolio')
+
+    def replace_super_investor_grand_portfolio(
+        self,
+        super_investor_grand_portfolio: SuperInvestorGrandPortfolio
+    ):
+        """
+        Deletes the stored grand portfolio and adds the new one in one transaction
+        """
+        with self._db_conn as con:
+            con.execute("DELETE FROM super_investor_grand_portfolio")
+            con.executemany(
+                "INSERT INTO super_investor_grand_portfolio VALUES(?, ?, ?)",
+                [
+                    (
+                        portfolio_entry.stock,
+                        portfolio_entry.symbol,
+                        portfolio_entry.ownership_count
+                    )
+                    for portfolio_entry in super_investor_grand_portfolio.portfolio
+                ]
+            )
+            DataVersionsRepo.bump_version(con, 'super_investor_grand_portfolio')
 
     def delete_super_investor_grand_portfolio(self):
         with self._db_conn as con:
             con.execute("DELETE FROM super_investor_grand_portfolio WHERE TRUE")
+            DataVersionsRepo.bump_version(con, 'super_investor_grand_portfolio')
 
     def get_super_investor_grand_portfolio(self) -> SuperInvestorGrandPortfolio:
         cur = self._db_conn.cursor()
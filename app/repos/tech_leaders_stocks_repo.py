@@ -9,6 +9,8 @@ from app.domain.percentage import Percentage
 from app.domain.date import Date
 from app.domain.symbol_appearances_count import SymbolAppearancesCount
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.snapshot_dates_repo import SnapshotDatesRepo
 
 
 class TechLeadersStocksRepo(SqlRepo):
@@ -60,6 +62,8 @@ class TechLeadersStocksRepo(SqlRepo):
                 f"INSERT INTO tech_leaders VALUES(?,?,?,?,?,?,?,?,?,?,?,?,?)",
                 [self._create_row_tuple_from_model(tech_leader, date) for tech_leader in data]
             )
+            SnapshotDatesRepo.add_snapshot_date(con, 'tech_leaders', date)
+            DataVersionsRepo.bump_version(con, 'tech_leaders')
 
     def get_tech_leaders_stocks_for_date(
         self,
@@ -108,7 +112,8 @@ class TechLeadersStocksRepo(SqlRepo):
                 FROM tech_leaders 
                 WHERE registered_date=(
                     SELECT registered_date
-                    FROM tech_leaders
+                    FROM snapshot_dates
+                    WHERE table_name='tech_leaders'
                     ORDER BY registered_date_ts DESC
                     LIMIT 1
                 )
@@ -1,4 +1,4 @@
-from typing import Tuple, Any, List
+from typing import Tuple, Any, List, Optional
 import datetime as dt
 
 from app.domain.time_series import IndexTimeSeriesEntry
@@ -6,6 +6,7 @@ from app.domain.price import Price
 from app.domain.date import Date
 from app.domain.world_index import WorldIndex
 from app.repos.sql_repo import SqlRepo
+from app.repos.data_versions_repo import DataVersionsRepo
 
 class WorldIndicesTimeSeriesRepo(SqlRepo):
     """
@@ -54,6 +55,55 @@ class WorldIndicesTimeSeriesRepo(SqlRepo):
                     for time_serie in time_series
                 ]
             )
+            DataVersionsRepo.bump_version(con, 'world_indices_time_series')
+
+    def upsert_time_series_for_index(self, index: WorldIndex, time_series: List[IndexTimeSeriesEntry]) -> int:
+        """
+        Inserts the new entries of the time series and updates the ones
+        that changed, the rest of the stored history is not touched.
+        Returns the number of rows that were inserted or updated.
+        """
+        with self._db_conn as con:
+            cur = con.executemany(
+                """INSERT INTO world_indices_time_series VALUES(?,?,?,?,?,?,?,?)
+                ON CONFLICT(index_name, registered_date_ts) DO UPDATE SET
+                    open_price=excluded.open_price,
+                    high_price=excluded.high_price,
+                    low_price=excluded.low_price,
+                    close_price=excluded.close_price,
+                    volume=excluded.volume,
+                    registered_date=excluded.registered_date
+                WHERE (open_price, high_price, low_price, close_price, volume)
+                    IS NOT (excluded.open_price, excluded.high_price, excluded.low_price,
+                            excluded.close_price, excluded.volume)""",
+                [
+                    self._create_row_tuple_from_model(index_name=index.value, time_serie=time_serie)
+                    for time_serie in time_series
+                ]
+            )
+            changed_rows = max(cur.rowcount, 0)
+            if changed_rows:
+                DataVersionsRepo.bump_version(con, 'world_indices_time_series')
+
+        return changed_rows
+
+    def get_latest_date_of_index(self, index: WorldIndex) -> Optional[dt.date]:
+        """
+        Returns the date of the newest stored entry of the index,
+        None when nothing is stored for it yet
+        """
+        cur = self._db_conn.cursor()
+        row = cur.execute(
+            """SELECT registered_date FROM world_indices_time_series
+            WHERE index_name=?
+            ORDER BY registered_date_ts DESC
+            LIMIT 1""",
+            (index.value, )
+        ).fetchone()
+        if row is None:
+            return None
+
+        return dt.datetime.strptime(row[0], "%d-%m-%Y").date()
 
     def get_index_time_series(self, index: WorldIndex) -> List[IndexTimeSeriesEntry]:
         cur = self._db_conn.cursor()
@@ -0,0 +1,120 @@
+import datetime as dt
+from typing import List, Set, Tuple
+
+from app.errors.scheduler import InvalidCronExpressionError
+
+
+# (name, min, max) of the five fields of a cron expression
+_FIELDS: List[Tuple[str, int, int]] = [
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day of month', 1, 31),
+    ('month', 1, 12),
+    ('day of week', 0, 6),
+]
+
+# Every valid expression matches within 4 years (29 February), an
+# expression like 30 February never does
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+def _parse_field(field: str, name: str, minimum: int, maximum: int) -> Set[int]:
+    values = set()
+    for part in field.split(','):
+        step = 1
+        if '/' in part:
+            part, step_string = part.split('/', 1)
+            if not step_string.isdigit() or int(step_string) == 0:
+                raise InvalidCronExpressionError(f'Invalid step in {name} field: {field}')
+            step = int(step_string)
+
+        if part == '*':
+            start, end = minimum, maximum
+        elif '-' in part:
+            start_string, end_string = part.split('-', 1)
+            if not start_string.isdigit() or not end_string.isdigit():
+                raise InvalidCronExpressionError(f'Invalid range in {name} field: {field}')
+            start, end = int(start_string), int(end_string)
+        elif part.isdigit():
+            start = int(part)
+            # 5/15 is every 15 starting at 5
+            end = maximum if step > 1 else start
+        else:
+            raise InvalidCronExpressionError(f'Invalid {name} field: {field}')
+
+        if name == 'day of week' and end == 7:
+            # 7 is Sunday too
+            values.add(0)
+            if start == 7:
+                continue
+            end = 6
+
+        if start < minimum or end > maximum or start > end:
+            raise InvalidCronExpressionError(f'{name} field out of range: {field}')
+
+        values.update(range(start, end + 1, step))
+
+    return values
+
+
+class CronTrigger:
+    """
+    A cron expression with the five standard fields, minute hour
+    day-of-month month day-of-week, each one a *, a number, a range
+    (a-b) or a list of them (a,b), optionally with a step (*/15).
+    Day of week 0 (or 7) is Sunday. Like cron, when both day of month
+    and day of week are restricted a day matching either one matches.
+    The times are evaluated in UTC.
+    """
+    def __init__(self, expression: str) -> None:
+        fields = expression.split()
+        if len(fields) != len(_FIELDS):
+            raise InvalidCronExpressionError(f'Expected 5 fields in cron expression: {expression}')
+
+        self._expression = expression
+        self._minutes, self._hours, self._days, self._months, self._weekdays = [
+            _parse_field(field, name, minimum, maximum)
+            for field, (name, minimum, maximum) in zip(fields, _FIELDS)
+        ]
+        self._any_day = fields[2] == '*'
+        self._any_weekday = fields[4] == '*'
+
+    @property
+    def expression(self) -> str:
+        return self._expression
+
+    def _matches_day(self, day: dt.datetime) -> bool:
+        if day.month not in self._months:
+            return False
+
+        # Python weekdays start on Monday, cron weekdays on Sunday
+        day_matches = day.day in self._days
+        weekday_matches = (day.weekday() + 1) % 7 in self._weekdays
+        if self._any_day or self._any_weekday:
+            return day_matches and weekday_matches
+
+        return day_matches or weekday_matches
+
+    def next_after(self, after: dt.datetime) -> dt.datetime:
+        """
+        Returns the first time matching the expression that is
+        strictly after the given (timezone aware) time
+        """
+        time = after.astimezone(dt.timezone.utc).replace(second=0, microsecond=0) + dt.timedelta(minutes=1)
+        last_day = time + dt.timedelta(days=_MAX_SEARCH_DAYS)
+        while time < last_day:
+            if not self._matches_day(time):
+                time = time.replace(hour=0, minute=0) + dt.timedelta(days=1)
+                continue
+
+            if time.hour not in self._hours:
+                time = time.replace(minute=0) + dt.timedelta(hours=1)
+                continue
+
+            if time.minute not in self._minutes:
+                time += dt.timedelta(minutes=1)
+                continue
+
+            return time
+
+        raise InvalidCronExpressionError(f'Cron expression never matches: {self._expression}')
@@ -0,0 +1,189 @@
+import datetime as dt
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app import settings
+from app.domain.world_index import WorldIndex
+from app.errors.scheduler import SchedulerError, UnknownJobError
+from app.scripts.scrape_and_store_economic_indicators import ECONOMIC_INDICATORS
+from app.scripts.update_stock_data import refresh_stock_data
+from app.services.dataroma_ingest import DataromaIngestService
+from app.services.ibd_backfill import IbdBackfillService
+from app.services.parse_pool import ParsePool
+from app.services.time_series import TimeSeriesService
+
+
+@dataclass(frozen=True)
+class JobContext:
+    # The writer connection of the scheduler
+    db_conn: Any
+    parse_pool: ParsePool
+
+
+@dataclass(frozen=True)
+class JobDefinition:
+    """
+    A dataset the scheduler knows how to refresh
+    :provider -> The host the job fetches from, the scheduler limits the
+    jobs running at a time per provider (scheduler_provider_concurrency)
+    :run -> Refreshes the dataset, an exception fails the attempt. The
+    returned report is kept as the result of the job.
+    :cron -> When the dataset is refreshed (UTC), None for the datasets
+    that are only queued on demand
+    :trigger_params -> Params of the job the cron trigger queues, from the
+    time the trigger fired
+    """
+    dataset: str
+    provider: str
+    run: Callable[[Dict[str, Any], JobContext], Awaitable[Any]]
+    cron: Optional[str] = None
+    trigger_params: Optional[Callable[[dt.datetime], Dict[str, Any]]] = None
+    priority: int = 0
+    max_attempts: int = settings.scheduler_max_attempts
+
+    @property
+    def schedule(self) -> Optional[str]:
+        return settings.scheduler_crons.get(self.dataset, self.cron)
+
+
+async def _ingest_ibd_tables(params: Dict[str, Any], context: JobContext) -> Any:
+    # The backfill skips the tables already stored, a retry
+    # fetches only the ones that failed. Ibd may not have published
+    # the tables of the date yet, a date without tables is retried too.
+    date = dt.date.fromisoformat(params['date'])
+    report = await IbdBackfillService.backfill(
+        date,
+        date,
+        job_name='scheduler',
+        include_weekends=True,
+        retry_missing=True,
+        db_conn=context.db_conn,
+        parse_pool=context.parse_pool
+    )
+    if report.failed:
+        raise SchedulerError(f'Failed to ingest the ibd tables of {date}')
+
+    return report
+
+
+async def _ingest_world_indices(params: Dict[str, Any], context: JobContext) -> Any:
+    changed_rows = 0
+    for index in WorldIndex:
+        changed_rows += await TimeSeriesService.scrape_and_store_index_time_series(index)
+
+    return f'{changed_rows} rows changed'
+
+
+async def _ingest_economic_indicators(params: Dict[str, Any], context: JobContext) -> Any:
+    changed_rows = 0
+    for indicator in ECONOMIC_INDICATORS:
+        changed_rows += await TimeSeriesService.scrape_and_store_economic_indicator_time_series(indicator)
+
+    return f'{changed_rows} rows changed'
+
+
+async def _ingest_super_investor_portfolios(params: Dict[str, Any], context: JobContext) -> Any:
+    report = await DataromaIngestService.ingest_super_investor_portfolios(
+        db_conn=context.db_conn,
+        parse_pool=context.parse_pool
+    )
+    if not report.stored:
+        raise SchedulerError(f'Failed to ingest the super investor portfolios: {report.failed}')
+
+    return report
+
+
+async def _ingest_super_investor_grand_portfolio(params: Dict[str, Any], context: JobContext) -> Any:
+    report = await DataromaIngestService.ingest_grand_portfolio(
+        db_conn=context.db_conn,
+        parse_pool=context.parse_pool
+    )
+    if report.failed:
+        raise SchedulerError(f'Failed to ingest the grand portfolio: {report.failed}')
+
+    return report
+
+
+async def _refresh_stock_data(params: Dict[str, Any], context: JobContext) -> Any:
+    return await refresh_stock_data(
+        symbols=params.get('symbols'),
+        concurrency=settings.alpha_vantage_concurrency,
+        parse_pool=context.parse_pool
+    )
+
+
+async def _ingest_symbol_data(params: Dict[str, Any], context: JobContext) -> Any:
+    # The batch refresh of one symbol, its requests go through
+    # the same rate limiter as the batch refresh
+    report = await refresh_stock_data(
+        symbols=[params['symbol']],
+        concurrency=1,
+        parse_pool=context.parse_pool
+    )
+    if report.failed:
+        raise SchedulerError(f"Failed to ingest {report.failed} datasets of {params['symbol']}")
+
+    return report
+
+
+JOB_DEFINITIONS: List[JobDefinition] = [
+    JobDefinition(
+        dataset='ibd_tables',
+        provider='ibd',
+        run=_ingest_ibd_tables,
+        # Ibd publishes the tables after the close
+        cron='30 23 * * 1-5',
+        trigger_params=lambda fired_at: {'date': fired_at.date().isoformat()},
+        priority=10
+    ),
+    JobDefinition(
+        dataset='world_indices',
+        provider='y_finance',
+        run=_ingest_world_indices,
+        cron='0 22 * * 1-5',
+        priority=5
+    ),
+    JobDefinition(
+        dataset='economic_indicators',
+        provider='alpha_vantage',
+        run=_ingest_economic_indicators,
+        cron='0 6 * * *',
+        priority=5
+    ),
+    JobDefinition(
+        dataset='super_investor_portfolios',
+        provider='dataroma',
+        run=_ingest_super_investor_portfolios,
+        cron='0 5 * * 1'
+    ),
+    JobDefinition(
+        dataset='super_investor_grand_portfolio',
+        provider='dataroma',
+        run=_ingest_super_investor_grand_portfolio,
+        cron='30 5 * * 1'
+    ),
+    JobDefinition(
+        dataset='stock_data',
+        provider='alpha_vantage',
+        run=_refresh_stock_data,
+        # Hours of alpha vantage requests, it skips the fresh datasets
+        cron='0 1 * * 6'
+    ),
+    JobDefinition(
+        dataset='symbol_data',
+        provider='alpha_vantage',
+        run=_ingest_symbol_data,
+        # Queued on demand by the add_symbol endpoint, someone is waiting for it
+        priority=20,
+        # An unknown symbol fails every time, don't spend the quota on it
+        max_attempts=2
+    ),
+]
+
+
+def get_job_definition(dataset: str) -> JobDefinition:
+    for definition in JOB_DEFINITIONS:
+        if definition.dataset == dataset:
+            return definition
+
+    raise UnknownJobError(f'No job definition for dataset {dataset}')
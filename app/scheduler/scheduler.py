@@ -0,0 +1,246 @@
+import asyncio
+import datetime as dt
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from app import dependencies, settings
+from app.domain.scheduler_job import SchedulerJob
+from app.errors.scheduler import UnknownJobError
+from app.repos.scheduler_jobs_repo import SchedulerJobsRepo
+from app.scheduler.cron import CronTrigger
+from app.scheduler.jobs import JOB_DEFINITIONS, JobContext, JobDefinition
+from app.services.parse_pool import ParsePool
+
+
+class Clock:
+    """
+    Time source of the scheduler, tests pass a fake
+    one that moves forward when it sleeps
+    """
+    def now(self) -> dt.datetime:
+        return dt.datetime.now(dt.timezone.utc)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+class Scheduler:
+    """
+    Runs the jobs of the scheduler_jobs table. The cron trigger of every
+    job definition queues a job when it fires, jobs can also be queued on
+    demand with enqueue. An identical job (same dataset and params) is not
+    queued twice and doesn't start while another one runs. Due jobs start
+    by priority, at most max_running_jobs at a time and at most
+    scheduler_provider_concurrency per provider. A failed attempt runs
+    again after an exponential backoff, up to the max attempts of its
+    definition.
+    """
+    def __init__(
+        self,
+        definitions: List[JobDefinition] = JOB_DEFINITIONS,
+        db_conn = None,
+        parse_pool: Optional[ParsePool] = None,
+        clock: Optional[Clock] = None,
+        max_running_jobs: int = settings.scheduler_max_running_jobs,
+        provider_concurrency: Optional[Dict[str, int]] = None
+    ) -> None:
+        if db_conn is None:
+            db_conn = dependencies.get_db_conn()
+
+        self._definitions = {definition.dataset: definition for definition in definitions}
+        self._triggers = {
+            definition.dataset: CronTrigger(definition.schedule)
+            for definition in definitions
+            if definition.schedule
+        }
+        self._repo = SchedulerJobsRepo(db_conn)
+        self._context = JobContext(
+            db_conn=db_conn,
+            parse_pool=parse_pool if parse_pool is not None else ParsePool(max_workers=0)
+        )
+        self._clock = clock if clock is not None else Clock()
+        self._max_running_jobs = max_running_jobs
+        self._provider_concurrency = (
+            provider_concurrency if provider_concurrency is not None else settings.scheduler_provider_concurrency
+        )
+        # Job id -> task running it
+        self._running: Dict[int, asyncio.Task] = {}
+        self._running_keys: Set[Tuple[str, str]] = set()
+        self._running_by_provider: Dict[str, int] = {}
+
+    def _get_definition(self, dataset: str) -> JobDefinition:
+        definition = self._definitions.get(dataset)
+        if definition is None:
+            raise UnknownJobError(f'No job definition for dataset {dataset}')
+
+        return definition
+
+    def enqueue(
+        self,
+        dataset: str,
+        params: Optional[Dict] = None,
+        priority: Optional[int] = None,
+        run_at: Optional[dt.datetime] = None
+    ) -> Optional[int]:
+        """
+        Queues a job of dataset and returns its id,
+        None when an identical job is already pending
+        """
+        definition = self._get_definition(dataset)
+        now = self._clock.now()
+        return self._repo.enqueue(
+            dataset=dataset,
+            params=params,
+            provider=definition.provider,
+            priority=definition.priority if priority is None else priority,
+            max_attempts=definition.max_attempts,
+            run_at=run_at or now,
+            now=now
+        )
+
+    def fire_due_triggers(self) -> List[int]:
+        """
+        Queues a job for every cron trigger that fired. The runs missed
+        while the scheduler was stopped are queued one per fire time when
+        the job params depend on it (e.g. the date of the ibd tables),
+        once otherwise. Returns the ids of the queued jobs.
+        """
+        now = self._clock.now()
+        next_trigger_times = self._repo.get_next_trigger_times()
+        job_ids = []
+        for dataset, trigger in self._triggers.items():
+            next_run_at = next_trigger_times.get(dataset)
+            if next_run_at is None:
+                # First start, the trigger fires from now on
+                self._repo.set_next_trigger_time(dataset, trigger.next_after(now))
+                continue
+
+            if next_run_at > now:
+                continue
+
+            definition = self._definitions[dataset]
+            if definition.trigger_params:
+                fired_at = next_run_at
+                params_list = []
+                while fired_at <= now:
+                    params_list.append(definition.trigger_params(fired_at))
+                    fired_at = trigger.next_after(fired_at)
+            else:
+                params_list = [None]
+
+            for params in params_list:
+                job_id = self.enqueue(dataset, params)
+                if job_id is not None:
+                    job_ids.append(job_id)
+            self._repo.set_next_trigger_time(dataset, trigger.next_after(now))
+
+        return job_ids
+
+    def _can_start(self, job: SchedulerJob) -> bool:
+        if len(self._running) >= self._max_running_jobs:
+            return False
+
+        if (job.dataset, SchedulerJobsRepo.encode_params(job.params)) in self._running_keys:
+            return False
+
+        provider_limit = self._provider_concurrency.get(job.provider, 1)
+        return self._running_by_provider.get(job.provider, 0) < provider_limit
+
+    def _retry_delay_seconds(self, attempts: int) -> float:
+        return min(
+            settings.scheduler_retry_backoff_seconds * 2 ** (attempts - 1),
+            settings.scheduler_retry_backoff_max_seconds
+        )
+
+    async def _run_job(self, job: SchedulerJob) -> None:
+        key = (job.dataset, SchedulerJobsRepo.encode_params(job.params))
+        attempts = job.attempts + 1
+        try:
+            definition = self._get_definition(job.dataset)
+            logging.info(f"Starting job {job.id} ({job.dataset}), attempt {attempts}")
+            result = await definition.run(job.params, self._context)
+        except Exception as err:
+            now = self._clock.now()
+            error = f'{type(err).__name__}: {err}'
+            logging.error(f"Job {job.id} ({job.dataset}) failed with error: {error}")
+            if attempts < job.max_attempts:
+                run_at = now + dt.timedelta(seconds=self._retry_delay_seconds(attempts))
+                await asyncio.to_thread(self._repo.mark_retry, job.id, now, error, run_at)
+            else:
+                await asyncio.to_thread(self._repo.mark_failed, job.id, now, error)
+        else:
+            await asyncio.to_thread(
+                self._repo.mark_done,
+                job.id,
+                self._clock.now(),
+                None if result is None else str(result)
+            )
+        finally:
+            del self._running[job.id]
+            self._running_keys.discard(key)
+            self._running_by_provider[job.provider] -= 1
+
+    async def tick(self) -> List[int]:
+        """
+        Fires the due triggers and starts the due jobs that fit in the
+        limits. Returns the ids of the jobs that were started.
+        """
+        await asyncio.to_thread(self.fire_due_triggers)
+        now = self._clock.now()
+        due_jobs = await asyncio.to_thread(self._repo.get_due_jobs, now)
+        started = []
+        for job in due_jobs:
+            if not self._can_start(job):
+                continue
+
+            claimed = await asyncio.to_thread(self._repo.mark_running, job.id, now)
+            if not claimed:
+                continue
+
+            self._running_keys.add((job.dataset, SchedulerJobsRepo.encode_params(job.params)))
+            self._running_by_provider[job.provider] = self._running_by_provider.get(job.provider, 0) + 1
+            self._running[job.id] = asyncio.create_task(self._run_job(job))
+            started.append(job.id)
+
+        return started
+
+    async def wait_running_jobs(self) -> None:
+        while self._running:
+            await asyncio.gather(*list(self._running.values()), return_exceptions=True)
+
+    def _seconds_until_next_check(self) -> float:
+        now = self._clock.now()
+        next_times = list(self._repo.get_next_trigger_times().values())
+        next_run_at = self._repo.get_next_run_at()
+        if next_run_at is not None:
+            next_times.append(next_run_at)
+
+        seconds = settings.scheduler_poll_seconds
+        for next_time in next_times:
+            # A due job that is waiting for a limit starts when a running job finishes
+            if next_time > now:
+                seconds = min(seconds, (next_time - now).total_seconds())
+
+        return seconds
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """
+        Runs the jobs until stop is set, then waits for the running ones.
+        Jobs left running by a previous scheduler are queued again.
+        """
+        requeued = await asyncio.to_thread(self._repo.requeue_running, self._clock.now())
+        if requeued:
+            logging.info(f"Queued again {requeued} jobs interrupted by the previous run")
+
+        while not stop.is_set():
+            await self.tick()
+            seconds = await asyncio.to_thread(self._seconds_until_next_check)
+            # A finished job may free a slot for a pending one
+            running = list(self._running.values())
+            sleep = asyncio.ensure_future(self._clock.sleep(seconds))
+            stopped = asyncio.ensure_future(stop.wait())
+            await asyncio.wait([sleep, stopped, *running], return_when=asyncio.FIRST_COMPLETED)
+            sleep.cancel()
+            stopped.cancel()
+
+        await self.wait_running_jobs()
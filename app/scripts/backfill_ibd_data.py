@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+import datetime as dt
+import logging
+from typing import List, Optional
+
+from app import settings
+from app.http.http_client import HttpClient
+from app.services.ibd_backfill import IbdBackfillReport, IbdBackfillService
+from app.services.ibd_ingest import IBD_TABLES
+from app.services.parse_pool import ParsePool
+
+
+async def backfill_ibd_data(
+    start: dt.date,
+    end: dt.date,
+    table_names: Optional[List[str]] = None,
+    job_name: str = 'ibd_backfill',
+    concurrency: int = settings.ibd_backfill_concurrency,
+    include_weekends: bool = False,
+    parse_workers: Optional[int] = settings.parse_pool_workers
+) -> IbdBackfillReport:
+    tables = IBD_TABLES
+    if table_names:
+        tables = [table for table in IBD_TABLES if table.name in table_names]
+
+    try:
+        with ParsePool(max_workers=parse_workers) as parse_pool:
+            return await IbdBackfillService.backfill(
+                start,
+                end,
+                tables=tables,
+                job_name=job_name,
+                concurrency=concurrency,
+                include_weekends=include_weekends,
+                parse_pool=parse_pool
+            )
+    finally:
+        HttpClient.log_stats()
+        await HttpClient.close_all()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(
+        description='Ingests the ibd tables of a date range, run it again with the same --job to resume'
+    )
+    parser.add_argument('start', type=dt.date.fromisoformat, help='e.g. 2023-01-02')
+    parser.add_argument('end', type=dt.date.fromisoformat, help='e.g. 2023-12-29')
+    parser.add_argument('--tables', nargs='+', choices=[table.name for table in IBD_TABLES])
+    parser.add_argument('--job', default='ibd_backfill', help='name the progress is checkpointed under')
+    parser.add_argument('--concurrency', type=int, default=settings.ibd_backfill_concurrency)
+    parser.add_argument('--include-weekends', action='store_true')
+    parser.add_argument('--parse-workers', type=int, default=settings.parse_pool_workers, help='0 parses in a thread')
+    args = parser.parse_args()
+
+    print(asyncio.run(backfill_ibd_data(
+        args.start,
+        args.end,
+        table_names=args.tables,
+        job_name=args.job,
+        concurrency=args.concurrency,
+        include_weekends=args.include_weekends,
+        parse_workers=args.parse_workers
+    )))
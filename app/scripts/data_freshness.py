@@ -0,0 +1,31 @@
+import datetime as dt
+from typing import Optional
+
+# How old (in months) the latest stored data of a dataset can be before
+# we fetch it again. Weekly time series are checked in weeks instead.
+MAX_AGE_MONTHS = {
+    'balance_sheet': 3,
+    'cash_flow': 3,
+    'income_statement': 3,
+    'earnings': 3,
+    'stock_overview': 1,
+}
+
+
+def is_fresh(dataset: str, latest_date: Optional[dt.date], today: Optional[dt.date] = None) -> bool:
+    """
+    :latest_date -> Date of the most recent data we have for a symbol
+    (see DataFreshnessRepo), None when we have nothing
+    """
+    if latest_date is None:
+        return False
+
+    if today is None:
+        today = dt.date.today()
+
+    if dataset == 'stock_time_series':
+        weeks_difference = (today - latest_date).days // 7
+        return weeks_difference < 1
+
+    months_difference = (today.year - latest_date.year) * 12 + (today.month - latest_date.month)
+    return months_difference <= MAX_AGE_MONTHS[dataset]
@@ -0,0 +1,167 @@
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, ContextManager, Iterable, List, Optional, Tuple
+
+from app.services.parse_pool import ParsePool
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    A provider payload that is refreshed per symbol
+    :is_fresh -> Returns True when the stored data is recent enough
+    and the fetch can be skipped
+    :parse -> Runs in the ParsePool of the refresh, see ParsePool for
+    what a parser running in a worker process can take and return
+    """
+    name: str
+    is_fresh: Callable[[str], bool]
+    fetch: Callable[[str], Awaitable[Any]]
+    parse: Callable[[str, Any], Any]
+    store: Callable[[str, Any], None]
+
+
+@dataclass
+class RefreshReport:
+    symbols: int = 0
+    fetched: int = 0
+    stored: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+
+    def __str__(self) -> str:
+        elapsed = max(self.elapsed_seconds, 1e-9)
+        return (
+            f'Refreshed {self.symbols} symbols in {self.elapsed_seconds:.1f}s: '
+            f'{self.fetched} fetched, {self.stored} stored, {self.skipped} fresh, {self.failed} failed '
+            f'({self.symbols / elapsed:.2f} symbols/s, {self.stored / elapsed:.2f} payloads/s)'
+        )
+
+
+# Tells the writer that every fetcher is done
+_DONE = object()
+
+
+async def refresh_symbols(
+    symbols: Iterable[str],
+    datasets: List[Dataset],
+    concurrency: int = 8,
+    queue_size: int = 64,
+    batch_size: int = 1,
+    transaction: Callable[[], ContextManager] = contextlib.nullcontext,
+    parse_pool: Optional[ParsePool] = None,
+    clock: Callable[[], float] = time.perf_counter
+) -> RefreshReport:
+    """
+    Refreshes the datasets of every symbol on the running event loop.
+    concurrency symbols are fetched at a time (the datasets of a symbol
+    concurrently). Every payload is parsed in parse_pool (a thread when
+    not given) as soon as it's fetched, so parsing overlaps the other
+    fetches, and the parsed data go through a bounded queue to a single
+    writer that stores them in a worker thread. A full queue makes the
+    fetchers wait, so a slow database can't pile up responses.
+
+    The writer stores up to batch_size queued payloads inside one
+    transaction() block. When a batch fails its payloads are stored
+    one by one, so the stores must be idempotent (replace, not append).
+    """
+    if parse_pool is None:
+        parse_pool = ParsePool(max_workers=0)
+
+    report = RefreshReport()
+    started_at = clock()
+    pending_symbols: asyncio.Queue = asyncio.Queue()
+    for symbol in symbols:
+        pending_symbols.put_nowait(symbol)
+    payloads: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    async def fetch(symbol: str, dataset: Dataset) -> None:
+        try:
+            json_response = await dataset.fetch(symbol)
+        except Exception as err:
+            report.failed += 1
+            logging.error(f'Failed to fetch {dataset.name} for {symbol} with error: {str(err)}')
+            return
+
+        report.fetched += 1
+        try:
+            data = await parse_pool.run(dataset.parse, symbol, json_response)
+        except Exception as err:
+            report.failed += 1
+            logging.error(f'Failed to parse {dataset.name} for {symbol} with error: {str(err)}')
+            return
+
+        await payloads.put((symbol, dataset, data))
+
+    async def fetcher() -> None:
+        while not pending_symbols.empty():
+            symbol = pending_symbols.get_nowait()
+            report.symbols += 1
+            stale_datasets = []
+            for dataset in datasets:
+                if dataset.is_fresh(symbol):
+                    report.skipped += 1
+                else:
+                    stale_datasets.append(dataset)
+
+            await asyncio.gather(*[fetch(symbol, dataset) for dataset in stale_datasets])
+
+    def store_batch(batch: List[Tuple[str, Dataset, Any]]) -> int:
+        """
+        Returns the number of payloads that were stored
+        """
+        try:
+            with transaction():
+                for symbol, dataset, data in batch:
+                    dataset.store(symbol, data)
+            return len(batch)
+        except Exception:
+            if len(batch) == 1:
+                raise
+
+        # A bad payload rolled back the whole batch, keep the rest
+        stored = 0
+        for item in batch:
+            try:
+                stored += store_batch([item])
+            except Exception as err:
+                symbol, dataset, _ = item
+                logging.error(f'Failed to store {dataset.name} for {symbol} with error: {str(err)}')
+        return stored
+
+    async def writer() -> None:
+        done = False
+        while not done:
+            batch = [await payloads.get()]
+            while len(batch) < batch_size and not payloads.empty():
+                batch.append(payloads.get_nowait())
+            # Nothing is queued after _DONE
+            if batch[-1] is _DONE:
+                batch.pop()
+                done = True
+            if not batch:
+                continue
+
+            try:
+                stored = await asyncio.to_thread(store_batch, batch)
+            except Exception as err:
+                stored = 0
+                symbol, dataset, _ = batch[0]
+                logging.error(f'Failed to store {dataset.name} for {symbol} with error: {str(err)}')
+
+            report.stored += stored
+            report.failed += len(batch) - stored
+
+    writer_task = asyncio.create_task(writer())
+    try:
+        await asyncio.gather(*[fetcher() for _ in range(concurrency)])
+    finally:
+        await payloads.put(_DONE)
+        await writer_task
+
+    report.elapsed_seconds = clock() - started_at
+    return report
@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import datetime as dt
+import logging
+from typing import List, Optional
+
+from app import settings
+from app.http.http_client import HttpClient
+from app.http.response_store import ResponseStore
+from app.scripts.scrape_and_store_ibd_data import scrape_and_store_data
+from app.services.ibd_ingest import IbdIngestReport
+from app.services.parse_pool import ParsePool
+
+
+async def replay_ibd_data(
+    start: dt.date,
+    end: dt.date,
+    store_path: str = settings.response_store_path,
+    parse_workers: Optional[int] = settings.parse_pool_workers
+) -> List[IbdIngestReport]:
+    """
+    Re-ingests the ibd tables of every date in [start, end] from the
+    recorded responses, nothing is fetched from investors.com. Parsing is
+    the bottleneck then, the pages are parsed by parse_workers processes.
+    The rows that are already stored for a date are replaced.
+    """
+    store = ResponseStore(store_path, mode=ResponseStore.REPLAY)
+    HttpClient.use_response_store(store)
+    reports = []
+    try:
+        with ParsePool(max_workers=parse_workers) as parse_pool:
+            day = start
+            while day <= end:
+                reports.append(await scrape_and_store_data(day.day, day.month, day.year, parse_pool, replace=True))
+                day += dt.timedelta(days=1)
+    finally:
+        HttpClient.use_response_store(None)
+        store.close()
+
+    return reports
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser()
+    parser.add_argument('start', type=dt.date.fromisoformat, help='e.g. 2024-01-02')
+    parser.add_argument('end', type=dt.date.fromisoformat, help='e.g. 2024-03-29')
+    parser.add_argument('--store-path', default=settings.response_store_path)
+    parser.add_argument('--parse-workers', type=int, default=settings.parse_pool_workers, help='0 parses in a thread')
+    args = parser.parse_args()
+
+    asyncio.run(replay_ibd_data(args.start, args.end, args.store_path, args.parse_workers))
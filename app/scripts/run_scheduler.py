@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+import logging
+import signal
+from typing import Optional
+
+from app import dependencies, settings
+from app.http.http_client import HttpClient
+from app.scheduler.scheduler import Scheduler
+from app.services.parse_pool import ParsePool
+
+
+async def run_scheduler(parse_workers: Optional[int] = settings.parse_pool_workers) -> None:
+    """
+    Runs the ingest scheduler until SIGINT or SIGTERM, the jobs
+    that are running then are waited for
+    """
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        with ParsePool(max_workers=parse_workers) as parse_pool:
+            await Scheduler(parse_pool=parse_pool).run(stop)
+    finally:
+        HttpClient.log_stats()
+        await HttpClient.close_all()
+        # Logs the stats of the connection pool
+        dependencies.close_db_conn()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description='Runs the ingest jobs of every dataset on their schedule')
+    parser.add_argument('--parse-workers', type=int, default=settings.parse_pool_workers, help='0 parses in a thread')
+    args = parser.parse_args()
+
+    asyncio.run(run_scheduler(args.parse_workers))
@@ -1,4 +1,5 @@
-import asyncio
+import json
+from typing import Any, Dict, List, Tuple
 
 from app.repos.balance_sheet_repo import BalanceSheetRepo
 from app.http.alpha_vantage_client import AlphaVantageClient
@@ -16,16 +17,9 @@ def try_convert_to_float(value):
         return None
 
 
-def fetch_and_store_balance_sheets_for_symbol(symbol: str):
-    alpha_vantage_client = AlphaVantageClient()
-    json_response = asyncio.run(alpha_vantage_client.get_company_balance_sheets(symbol))
-
-    repo = BalanceSheetRepo()
-    # Delete existing rows to avoid duplication
-    repo.delete_balance_sheets_of_symbol(symbol)
-    
-    quarterly_reports = json_response['quarterlyReports']
-    for report in quarterly_reports:
+def parse_balance_sheets(symbol: str, json_response: Dict[str, Any]) -> List[BalanceSheet]:
+    balance_sheets = []
+    for report in json_response['quarterlyReports']:
         balance_sheet = BalanceSheet(
             symbol=symbol,
             fiscal_date_ending=report['fiscalDateEnding'],
@@ -67,5 +61,30 @@ def fetch_and_store_balance_sheets_for_symbol(symbol: str):
             common_stock=try_convert_to_float(report['commonStock']),
             common_stock_shares_outstanding=try_convert_to_float(report['commonStockSharesOutstanding']),
         )
+        balance_sheets.append(balance_sheet)
+
+    return balance_sheets
+
+
+def store_balance_sheets_for_symbol(symbol: str, balance_sheets: List[BalanceSheet]) -> None:
+    BalanceSheetRepo().replace_balance_sheets_of_symbol(symbol, balance_sheets)
+
 
-        repo.add_balance_sheet(balance_sheet)
+def parse_balance_sheets_rows(symbol: str, content: bytes) -> List[Tuple[Any]]:
+    """
+    parse_balance_sheets of the raw body into rows of BalanceSheetRepo, runs in a ParsePool worker
+    """
+    return [
+        BalanceSheetRepo._create_row_tuple_from_model(balance_sheet)
+        for balance_sheet in parse_balance_sheets(symbol, json.loads(content))
+    ]
+
+
+def store_balance_sheets_rows_for_symbol(symbol: str, rows: List[Tuple[Any]]) -> None:
+    BalanceSheetRepo().replace_balance_sheets_rows_of_symbol(symbol, rows)
+
+
+async def fetch_and_store_balance_sheets_for_symbol(symbol: str):
+    alpha_vantage_client = AlphaVantageClient()
+    json_response = await alpha_vantage_client.get_company_balance_sheets(symbol)
+    store_balance_sheets_for_symbol(symbol, parse_balance_sheets(symbol, json_response))
@@ -1,4 +1,5 @@
-import asyncio
+import json
+from typing import Any, Dict, List, Tuple
 
 from app.repos.cash_flow_repo import CashFlowRepo
 from app.http.alpha_vantage_client import AlphaVantageClient
@@ -16,16 +17,9 @@ def try_convert_to_float(value):
         return None
 
 
-def fetch_and_store_cash_flows_for_symbol(symbol: str):
-    alpha_vantage_client = AlphaVantageClient()
-    json_response = asyncio.run(alpha_vantage_client.get_company_cash_flows(symbol))
-
-    repo = CashFlowRepo()
-    # Delete existing rows to avoid duplication
-    repo.delete_cash_flows_of_symbol(symbol)
-    
-    quarterly_reports = json_response['quarterlyReports']
-    for report in quarterly_reports:
+def parse_cash_flows(symbol: str, json_response: Dict[str, Any]) -> List[CashFlow]:
+    cash_flows = []
+    for report in json_response['quarterlyReports']:
         cash_flow = CashFlow(
             symbol=symbol,
             fiscal_date_ending=report['fiscalDateEnding'],
@@ -58,5 +52,30 @@ def fetch_and_store_cash_flows_for_symbol(symbol: str):
             change_in_exchange_rate=try_convert_to_float(report['changeInExchangeRate']),
             net_income=try_convert_to_float(report['netIncome']),
         )
+        cash_flows.append(cash_flow)
+
+    return cash_flows
+
+
+def store_cash_flows_for_symbol(symbol: str, cash_flows: List[CashFlow]) -> None:
+    CashFlowRepo().replace_cash_flows_of_symbol(symbol, cash_flows)
+
 
-        repo.add_cash_flow(cash_flow)
+def parse_cash_flows_rows(symbol: str, content: bytes) -> List[Tuple[Any]]:
+    """
+    parse_cash_flows of the raw body into rows of CashFlowRepo, runs in a ParsePool worker
+    """
+    return [
+        CashFlowRepo._create_row_tuple_from_model(cash_flow)
+        for cash_flow in parse_cash_flows(symbol, json.loads(content))
+    ]
+
+
+def store_cash_flows_rows_for_symbol(symbol: str, rows: List[Tuple[Any]]) -> None:
+    CashFlowRepo().replace_cash_flows_rows_of_symbol(symbol, rows)
+
+
+async def fetch_and_store_cash_flows_for_symbol(symbol: str):
+    alpha_vantage_client = AlphaVantageClient()
+    json_response = await alpha_vantage_client.get_company_cash_flows(symbol)
+    store_cash_flows_for_symbol(symbol, parse_cash_flows(symbol, json_response))
@@ -1,27 +1,33 @@
-from app.domain.super_investor import SuperInvestor
-from app.repos.super_investor import SuperInvestorRepo
-from app.services.dataroma_scrapers.portfolio import SuperInvestorPortfolioScraper
-from app.services.dataroma_scrapers.grand_portfolio import SuperInvestorGrandPortfolioScraper
+import logging
+from typing import Optional
 
-async def scrape_and_store_super_investor_portfolios():
-    scraper = SuperInvestorPortfolioScraper()
-    repo = SuperInvestorRepo()
-    for super_investor in SuperInvestor:
-        portfolio = await scraper.scrape_super_investor_portfolio(super_investor)
-        # Delete existing portfolio from the database
-        repo.delete_super_investor_portfolio(
-            super_investor=super_investor
-        )
-        # Add the updated one
-        repo.add_super_investor_portfolio(
-            super_investor_portfolio=portfolio
-        )
+from app.services.dataroma_ingest import DataromaIngestReport, DataromaIngestService
+from app.services.parse_pool import ParsePool
+from app.http.http_client import HttpClient
 
-async def scrape_and_store_super_investor_grand_portfolio():
-    scraper = SuperInvestorGrandPortfolioScraper()
-    repo = SuperInvestorRepo()
-    grand_portfolio = await scraper.scrape_super_investor_grand_portfolio()
-    # Delete existing rows
-    repo.delete_super_investor_grand_portfolio()
-    # Add the updated one
-    repo.add_super_investor_grand_portfolio(grand_portfolio)
+async def scrape_and_store_super_investor_portfolios(parse_pool: Optional[ParsePool] = None) -> DataromaIngestReport:
+    try:
+        report = await DataromaIngestService.ingest_super_investor_portfolios(parse_pool=parse_pool)
+    finally:
+        # Reuse the pooled connections for the whole run, close them at the end
+        await HttpClient.close_all()
+
+    logging.info(
+        f"Stored {len(report.stored)} super investor portfolios in {report.elapsed_seconds:.1f}s, "
+        f"failed: {list(report.failed)}"
+    )
+    return report
+
+
+async def scrape_and_store_super_investor_grand_portfolio(parse_pool: Optional[ParsePool] = None) -> DataromaIngestReport:
+    try:
+        report = await DataromaIngestService.ingest_grand_portfolio(parse_pool=parse_pool)
+    finally:
+        # Reuse the pooled connections for the whole run, close them at the end
+        await HttpClient.close_all()
+
+    logging.info(
+        f"Stored {len(report.stored)} grand portfolio pages in {report.elapsed_seconds:.1f}s, "
+        f"failed: {list(report.failed)}"
+    )
+    return report
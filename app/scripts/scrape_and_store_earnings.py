@@ -1,6 +1,9 @@
-import asyncio
+import json
+from typing import Any, Dict, List, Tuple
 
 from app.repos.earnings_repo import EarningsRepo
+from app.repos.data_freshness_repo import DataFreshnessRepo
+from app.scripts.data_freshness import is_fresh
 from app.http.alpha_vantage_client import AlphaVantageClient
 from app.domain.earnings import Earnings
 
@@ -16,16 +19,13 @@ def try_convert_to_float(value):
         return None
 
 
-def fetch_and_store_earnings_for_symbol(symbol: str):
-    alpha_vantage_client = AlphaVantageClient()
-    json_response = asyncio.run(alpha_vantage_client.get_company_earnings(symbol))
-
-    repo = EarningsRepo()
-    # Delete existing rows to avoid duplication
-    repo.delete_earnings_of_symbol(symbol)
-    
-    quarterly_earnings = json_response['quarterlyEarnings']
-    for earnings in quarterly_earnings:
+def have_latest_earnings(symbol: str, freshness_repo: DataFreshnessRepo) -> bool:
+    return is_fresh('earnings', freshness_repo.get_latest_date('earnings', symbol))
+
+
+def parse_earnings(symbol: str, json_response: Dict[str, Any]) -> List[Earnings]:
+    earnings_list = []
+    for earnings in json_response['quarterlyEarnings']:
         e = Earnings(
             symbol=symbol,
             fiscal_date_ending=earnings['fiscalDateEnding'],
@@ -35,5 +35,30 @@ def fetch_and_store_earnings_for_symbol(symbol: str):
             surprise=try_convert_to_float(earnings['surprise']),
             surprise_percentage=try_convert_to_float(earnings['surprisePercentage'])
         )
+        earnings_list.append(e)
+
+    return earnings_list
+
+
+def store_earnings_for_symbol(symbol: str, earnings_list: List[Earnings]) -> None:
+    EarningsRepo().replace_earnings_of_symbol(symbol, earnings_list)
 
-        repo.add_earnings(earnings=e)
+
+def parse_earnings_rows(symbol: str, content: bytes) -> List[Tuple[Any]]:
+    """
+    parse_earnings of the raw body into rows of EarningsRepo, runs in a ParsePool worker
+    """
+    return [
+        EarningsRepo._create_row_tuple_from_model(e)
+        for e in parse_earnings(symbol, json.loads(content))
+    ]
+
+
+def store_earnings_rows_for_symbol(symbol: str, rows: List[Tuple[Any]]) -> None:
+    EarningsRepo().replace_earnings_rows_of_symbol(symbol, rows)
+
+
+async def fetch_and_store_earnings_for_symbol(symbol: str):
+    alpha_vantage_client = AlphaVantageClient()
+    json_response = await alpha_vantage_client.get_company_earnings(symbol)
+    store_earnings_for_symbol(symbol, parse_earnings(symbol, json_response))
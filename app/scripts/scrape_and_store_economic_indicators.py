@@ -2,34 +2,37 @@ import time
 
 from app.services.time_series import TimeSeriesService
 from app.domain.economic_indicator import EconomicIndicator
+from app.http.http_client import HttpClient
+
+# Inflation is left out
+ECONOMIC_INDICATORS = [
+    EconomicIndicator.Interest_Rate,
+    EconomicIndicator.Treasury_Yield,
+    EconomicIndicator.Unemployment,
+    EconomicIndicator.Global_Commodities_Index,
+    EconomicIndicator.Crude_Oil,
+    EconomicIndicator.Natural_Gas,
+    EconomicIndicator.Copper,
+    EconomicIndicator.Aluminum,
+    EconomicIndicator.Wheat,
+    EconomicIndicator.Corn,
+    EconomicIndicator.Cotton,
+    EconomicIndicator.Sugar,
+    EconomicIndicator.Coffee,
+    EconomicIndicator.Real_GDP,
+]
+
+
+async def _scrape_and_store_economic_indicators_time_series():
+    for i, indicator in enumerate(ECONOMIC_INDICATORS):
+        if i > 0:
+            time.sleep(1)
+        await TimeSeriesService.scrape_and_store_economic_indicator_time_series(indicator)
+
 
 async def scrape_and_store_economic_indicators_time_series():
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Interest_Rate)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Treasury_Yield)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Unemployment)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Global_Commodities_Index)
-    # time.sleep(1)
-    # await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Inflation)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Crude_Oil)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Natural_Gas)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Copper)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Aluminum)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Wheat)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Corn)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Cotton)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Sugar)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Coffee)
-    time.sleep(1)
-    await TimeSeriesService.scrape_and_store_economic_indicator_time_series(EconomicIndicator.Real_GDP)
+    try:
+        await _scrape_and_store_economic_indicators_time_series()
+    finally:
+        # Reuse the pooled connections for the whole run, close them at the end
+        await HttpClient.close_all()
@@ -1,4 +1,5 @@
-import asyncio
+import json
+from typing import Any, Dict, List, Tuple
 
 from app.repos.income_statement_repo import IncomeStatementRepo
 from app.http.alpha_vantage_client import AlphaVantageClient
@@ -16,16 +17,9 @@ def try_convert_to_float(value):
         return None
 
 
-def fetch_and_store_income_statements_for_symbol(symbol: str):
-    alpha_vantage_client = AlphaVantageClient()
-    json_response = asyncio.run(alpha_vantage_client.get_company_income_statements(symbol))
-
-    repo = IncomeStatementRepo()
-    # Delete existing rows to avoid duplication
-    repo.delete_income_statements_of_symbol(symbol)
-    
-    quarterly_reports = json_response['quarterlyReports']
-    for report in quarterly_reports:
+def parse_income_statements(symbol: str, json_response: Dict[str, Any]) -> List[IncomeStatement]:
+    income_statements = []
+    for report in json_response['quarterlyReports']:
         income_statement = IncomeStatement(
             symbol=symbol,
             fiscal_date_ending=report['fiscalDateEnding'],
@@ -55,5 +49,30 @@ def fetch_and_store_income_statements_for_symbol(symbol: str):
             ebitda=try_convert_to_float(report['ebitda']),
             net_income=try_convert_to_float(report['netIncome']),
         )
+        income_statements.append(income_statement)
+
+    return income_statements
+
+
+def store_income_statements_for_symbol(symbol: str, income_statements: List[IncomeStatement]) -> None:
+    IncomeStatementRepo().replace_income_statements_of_symbol(symbol, income_statements)
+
 
-        repo.add_income_statement(income_statement)
+def parse_income_statements_rows(symbol: str, content: bytes) -> List[Tuple[Any]]:
+    """
+    parse_income_statements of the raw body into rows of IncomeStatementRepo, runs in a ParsePool worker
+    """
+    return [
+        IncomeStatementRepo._create_row_tuple_from_model(income_statement)
+        for income_statement in parse_income_statements(symbol, json.loads(content))
+    ]
+
+
+def store_income_statements_rows_for_symbol(symbol: str, rows: List[Tuple[Any]]) -> None:
+    IncomeStatementRepo().replace_income_statements_rows_of_symbol(symbol, rows)
+
+
+async def fetch_and_store_income_statements_for_symbol(symbol: str):
+    alpha_vantage_client = AlphaVantageClient()
+    json_response = await alpha_vantage_client.get_company_income_statements(symbol)
+    store_income_statements_for_symbol(symbol, parse_income_statements(symbol, json_response))
@@ -1,5 +1,6 @@
 from datetime import datetime
-import asyncio
+import json
+from typing import Any, Dict
 
 from app.repos.stock_overview_repo import StockOverviewRepo
 from app.http.alpha_vantage_client import AlphaVantageClient
@@ -18,18 +19,8 @@ def try_convert_to_float(value):
         return None
 
 
-def fetch_and_store_stock_overview_for_symbol(symbol: str):
-    now = datetime.now()
-
-    stock_overview_repo = StockOverviewRepo()
-    av_client = AlphaVantageClient()
-
-    # Delete existing rows to avoid duplication
-    stock_overview_repo.delete_stock_overview_for_symbol(symbol)
-
-    company_info = asyncio.run(av_client.get_company_overview(symbol))
-
-    stock_overview = StockOverview(
+def parse_stock_overview(symbol: str, company_info: Dict[str, Any]) -> StockOverview:
+    return StockOverview(
         symbol=symbol,
         sector=company_info.get('Sector') if company_info.get('Sector') else '',
         industry=company_info.get('Industry'),
@@ -62,7 +53,23 @@ def fetch_and_store_stock_overview_for_symbol(symbol: str):
         outstanding_shares=try_convert_to_float(company_info.get('SharesOutstanding'))
     )
 
-    stock_overview_repo.add_stock_overview_for_date(
+
+def parse_stock_overview_content(symbol: str, content: bytes) -> StockOverview:
+    """
+    parse_stock_overview of the raw body, runs in a ParsePool worker
+    """
+    return parse_stock_overview(symbol, json.loads(content))
+
+
+def store_stock_overview_for_symbol(symbol: str, stock_overview: StockOverview) -> None:
+    now = datetime.now()
+    StockOverviewRepo().replace_stock_overview_for_symbol(
         date=Date(day=now.day, month=now.month, year=now.year),
         stock_overview=stock_overview
     )
+
+
+async def fetch_and_store_stock_overview_for_symbol(symbol: str):
+    av_client = AlphaVantageClient()
+    company_info = await av_client.get_company_overview(symbol)
+    store_stock_overview_for_symbol(symbol, parse_stock_overview(symbol, company_info))
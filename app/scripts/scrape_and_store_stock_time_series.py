@@ -1,7 +1,31 @@
-import datetime as dt
+import json
+from typing import Any, List, Tuple
 
 from app.services.time_series import TimeSeriesService
+from app.services.alpha_vantage_scrapers.stock_time_series import StockTimeSeriesScraper
+from app.repos.data_freshness_repo import DataFreshnessRepo
 from app.repos.stock_time_series_repo import StockTimeSeriesRepo
+from app.scripts.data_freshness import is_fresh
+
+
+def have_latest_stock_time_series(symbol: str, freshness_repo: DataFreshnessRepo) -> bool:
+    return is_fresh('stock_time_series', freshness_repo.get_latest_date('stock_time_series', symbol))
+
+
+def parse_stock_time_series_rows(symbol: str, content: bytes) -> List[Tuple[Any]]:
+    """
+    Weekly time series of the raw body into rows of StockTimeSeriesRepo,
+    runs in a ParsePool worker
+    """
+    return [
+        StockTimeSeriesRepo._create_row_tuple_from_model(symbol=symbol, time_serie=time_serie)
+        for time_serie in StockTimeSeriesScraper.parse_stock_time_series(symbol, json.loads(content))
+    ]
+
+
+def store_stock_time_series_rows_for_symbol(symbol: str, rows: List[Tuple[Any]]) -> None:
+    StockTimeSeriesRepo().upsert_time_series_rows_for_symbol(symbol, rows)
+
 
 async def fetch_and_store_stock_time_series(symbol: str) -> int:
     """
@@ -12,16 +36,8 @@ async def fetch_and_store_stock_time_series(symbol: str) -> int:
     Returns 1 in case a call to provider was made, 0 otherwise
     """
     # Check that we don't already have latest prices to avoid extra calls
-    time_series_repo = StockTimeSeriesRepo()
-    time_series = time_series_repo.get_symbol_time_series(symbol)
-
-    if time_series:
-        latest_timestamp = time_series[0].registered_date.date_ts
-        latest_time_series_date = dt.datetime.fromtimestamp(latest_timestamp)
-        current_date = dt.datetime.now()
-        weeks_difference = (current_date - latest_time_series_date).days // 7
-        if weeks_difference < 1:
-            return 0
+    if have_latest_stock_time_series(symbol, DataFreshnessRepo()):
+        return 0
 
     print("Fetching time series for:", symbol)
     await TimeSeriesService.scrape_and_store_stock_time_series(symbol)
@@ -3,8 +3,9 @@ import time
 from app.domain.world_index import WorldIndex
 
 from app.services.time_series import TimeSeriesService
+from app.http.http_client import HttpClient
 
-async def scrape_and_store_world_indices_time_series():
+async def _scrape_and_store_world_indices_time_series():
     await TimeSeriesService.scrape_and_store_index_time_series(WorldIndex.S_P_500)
     time.sleep(3)
     await TimeSeriesService.scrape_and_store_index_time_series(WorldIndex.Dow_Jones_Ind_Avg)
@@ -12,4 +13,12 @@ async def scrape_and_store_world_indices_time_series():
     await TimeSeriesService.scrape_and_store_index_time_series(WorldIndex.Nasdaq_Composite)
     time.sleep(3)
     await TimeSeriesService.scrape_and_store_index_time_series(WorldIndex.Nyse_Composite)
-    
\ No newline at end of file
+    
+
+
+async def scrape_and_store_world_indices_time_series():
+    try:
+        await _scrape_and_store_world_indices_time_series()
+    finally:
+        # Reuse the pooled connections for the whole run, close them at the end
+        await HttpClient.close_all()
@@ -1,16 +1,23 @@
+import argparse
 import asyncio
-import time
-from typing import List
-import pickle
+import csv
+import datetime as dt
+from typing import Callable, Dict, List, Optional
 
-import pandas as pd
-
-from app.scripts.scrape_and_store_fundamental_data import fetch_and_store_fundamental_data_for_symbol
-from app.scripts.scrape_and_store_stock_time_series import fetch_and_store_stock_time_series
-from app.scripts.scrape_and_store_earnings import fetch_and_store_earnings_for_symbol
+from app import settings
 from app.dependencies import get_db_conn
-
-REQUESTS_PER_MINUTE_LIMIT = 70  # Provider limitation
+from app.http.alpha_vantage_client import AlphaVantageClient
+from app.http.http_client import HttpClient
+from app.repos.data_freshness_repo import DataFreshnessRepo
+from app.scripts.data_freshness import is_fresh
+from app.scripts.refresh_pipeline import Dataset, RefreshReport, refresh_symbols
+from app.scripts.scrape_and_store_balance_sheets import parse_balance_sheets_rows, store_balance_sheets_rows_for_symbol
+from app.scripts.scrape_and_store_cash_flows import parse_cash_flows_rows, store_cash_flows_rows_for_symbol
+from app.scripts.scrape_and_store_earnings import parse_earnings_rows, store_earnings_rows_for_symbol
+from app.scripts.scrape_and_store_income_statements import parse_income_statements_rows, store_income_statements_rows_for_symbol
+from app.scripts.scrape_and_store_stock_overview import parse_stock_overview_content, store_stock_overview_for_symbol
+from app.scripts.scrape_and_store_stock_time_series import parse_stock_time_series_rows, store_stock_time_series_rows_for_symbol
+from app.services.parse_pool import ParsePool
 
 
 def get_symbols() -> List[str]:
@@ -21,27 +28,120 @@ def get_symbols() -> List[str]:
     ]
 
 
-def update_stock_data():
-    api_calls_count = 0
+def get_symbols_from_csv(path: str) -> List[str]:
+    with open(path, newline='') as f:
+        rows = csv.reader(f)
+        next(rows)  # Header
+        return [row[0] for row in rows if row]
+
+
+def _is_fresh_checker(dataset: str, latest_dates: Dict[str, Dict[str, dt.date]]) -> Callable[[str], bool]:
+    dataset_latest_dates = latest_dates.get(dataset, {})
+    return lambda symbol: is_fresh(dataset, dataset_latest_dates.get(symbol))
+
+
+def get_datasets(av_client: AlphaVantageClient) -> List[Dataset]:
+    """
+    av_client should return the raw bodies (decode_json=False), the
+    parsers decode them and build the rows of the repos in the ParsePool
+    """
+    # The freshness of every symbol in one query, instead of a query per symbol and dataset
+    latest_dates = DataFreshnessRepo().get_all_latest_dates()
+    return [
+        Dataset(
+            name='balance sheets',
+            is_fresh=_is_fresh_checker('balance_sheet', latest_dates),
+            fetch=av_client.get_company_balance_sheets,
+            parse=parse_balance_sheets_rows,
+            store=store_balance_sheets_rows_for_symbol
+        ),
+        Dataset(
+            name='cash flows',
+            is_fresh=_is_fresh_checker('cash_flow', latest_dates),
+            fetch=av_client.get_company_cash_flows,
+            parse=parse_cash_flows_rows,
+            store=store_cash_flows_rows_for_symbol
+        ),
+        Dataset(
+            name='income statements',
+            is_fresh=_is_fresh_checker('income_statement', latest_dates),
+            fetch=av_client.get_company_income_statements,
+            parse=parse_income_statements_rows,
+            store=store_income_statements_rows_for_symbol
+        ),
+        Dataset(
+            name='stock overview',
+            is_fresh=_is_fresh_checker('stock_overview', latest_dates),
+            fetch=av_client.get_company_overview,
+            parse=parse_stock_overview_content,
+            store=store_stock_overview_for_symbol
+        ),
+        Dataset(
+            name='earnings',
+            is_fresh=_is_fresh_checker('earnings', latest_dates),
+            fetch=av_client.get_company_earnings,
+            parse=parse_earnings_rows,
+            store=store_earnings_rows_for_symbol
+        ),
+        Dataset(
+            name='weekly time series',
+            is_fresh=_is_fresh_checker('stock_time_series', latest_dates),
+            fetch=av_client.get_company_time_series,
+            parse=parse_stock_time_series_rows,
+            store=store_stock_time_series_rows_for_symbol
+        ),
+    ]
+
+
+async def refresh_stock_data(
+    symbols: Optional[List[str]],
+    concurrency: int,
+    parse_pool: ParsePool
+) -> RefreshReport:
+    """
+    The work of update_stock_data, the http clients are left open
+    for the process that calls it
+    """
+    if symbols is None:
+        symbols = get_symbols()
+
+    return await refresh_symbols(
+        symbols=symbols,
+        datasets=get_datasets(AlphaVantageClient(decode_json=False)),
+        concurrency=concurrency,
+        queue_size=settings.refresh_queue_size,
+        batch_size=settings.refresh_batch_size,
+        # The repos nest their transactions in the writer's, a batch is one commit
+        transaction=get_db_conn,
+        parse_pool=parse_pool
+    )
+
 
-    for symbol in get_symbols():
-        calls_needed = fetch_and_store_fundamental_data_for_symbol(symbol, dry_run=True)    # Returns the number of calls fetch_and_store_fundamental_data_for_symbol will make without actually making them
-        if api_calls_count + calls_needed > REQUESTS_PER_MINUTE_LIMIT:
-            time.sleep(65)
-            api_calls_count = 0
+async def update_stock_data(
+    symbols: Optional[List[str]] = None,
+    concurrency: int = settings.alpha_vantage_concurrency,
+    parse_workers: Optional[int] = settings.parse_pool_workers
+) -> RefreshReport:
+    """
+    Refreshes the fundamentals, earnings and weekly time series of the
+    symbols on one event loop. The provider limit (requests per minute)
+    is enforced by the rate limiter of AlphaVantageClient, the responses
+    are parsed by parse_workers processes (see ParsePool).
+    """
+    try:
+        with ParsePool(max_workers=parse_workers) as parse_pool:
+            return await refresh_stock_data(symbols, concurrency, parse_pool)
+    finally:
+        HttpClient.log_stats()
+        await HttpClient.close_all()
 
-        try:
-            api_calls_made = fetch_and_store_fundamental_data_for_symbol(symbol)
-            api_calls_count += api_calls_made
 
-            if api_calls_count + 1 > REQUESTS_PER_MINUTE_LIMIT:
-                time.sleep(65)
-                api_calls_count = 0
-            
-            if asyncio.run(fetch_and_store_stock_time_series(symbol)):
-                api_calls_count += 1
-        except Exception as err:
-            api_calls_count += 1    # At least one api call was made in the block above
-            print(f'Failed to fetch data for: {symbol} with error : {str(err)}')
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--symbols-file', help='csv with a header and a symbol per row, e.g. app/database/symbols.csv')
+    parser.add_argument('--concurrency', type=int, default=settings.alpha_vantage_concurrency)
+    parser.add_argument('--parse-workers', type=int, default=settings.parse_pool_workers, help='0 parses in a thread')
+    args = parser.parse_args()
 
-update_stock_data()
+    symbols = get_symbols_from_csv(args.symbols_file) if args.symbols_file else None
+    print(asyncio.run(update_stock_data(symbols, args.concurrency, args.parse_workers)))
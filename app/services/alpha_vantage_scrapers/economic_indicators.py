@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 import datetime as dt
 
 from app.http import alpha_vantage_client
@@ -10,10 +10,15 @@ from app.errors.alpha_vantage import AlphaVantageParsingError
 
 class EconomicIndicatorScraper:
     @classmethod
-    def _convert_json_to_domain_model(cls, json) -> List[EconomicIndicatorTimeSeriesEntry]:
+    def _convert_json_to_domain_model(cls, json, since: Optional[dt.date] = None) -> List[EconomicIndicatorTimeSeriesEntry]:
         unit = json['unit']
+        # The dates are yyyy-mm-dd strings, so they compare like dates
+        since_string = since.isoformat() if since is not None else None
         time_series = []
         for entry in json['data']:
+            if since_string is not None and entry['date'] < since_string:
+                continue
+
             # Convert datetime string to object
             date_time_obj = dt.datetime.strptime(entry['date'], '%Y-%m-%d')
             
@@ -35,12 +40,17 @@ class EconomicIndicatorScraper:
         return time_series
 
     @classmethod
-    async def scrape_economic_indicator_time_series(cls, indicator: EconomicIndicator):
+    async def scrape_economic_indicator_time_series(cls, indicator: EconomicIndicator, since: Optional[dt.date] = None):
+        """
+        :since -> Entries older than this date are left out. Alpha vantage
+        always returns the whole history of an indicator, the older entries
+        are skipped before they are parsed.
+        """
         af_client = alpha_vantage_client.AlphaVantageClient()
         json_response = await af_client.get_economic_indicator_time_series(indicator)
 
         try:
-            time_series = cls._convert_json_to_domain_model(json_response)
+            time_series = cls._convert_json_to_domain_model(json_response, since)
         except Exception as err:
             raise AlphaVantageParsingError(f'Failed to parse response for {indicator.value} time series with error: {str(err)}')
         
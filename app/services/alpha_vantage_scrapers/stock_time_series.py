@@ -35,13 +35,16 @@ class StockTimeSeriesScraper:
         return time_series
     
     @classmethod
-    async def scrape_stock_time_series(cls, symbol: str) -> List[StockTimeSeriesEntry]:
-        av_client = alpha_vantage_client.AlphaVantageClient()
-        json_response = await av_client.get_company_time_series(symbol)
-
+    def parse_stock_time_series(cls, symbol: str, json_response: Dict[str, Any]) -> List[StockTimeSeriesEntry]:
         try:
             time_series = cls._convert_json_to_domain_model(json_response)
         except Exception as err:
             raise AlphaVantageParsingError(f'Failed to parse response for {symbol} time series with error: {str(err)}')
         
         return time_series
+
+    @classmethod
+    async def scrape_stock_time_series(cls, symbol: str) -> List[StockTimeSeriesEntry]:
+        av_client = alpha_vantage_client.AlphaVantageClient()
+        json_response = await av_client.get_company_time_series(symbol)
+        return cls.parse_stock_time_series(symbol, json_response)
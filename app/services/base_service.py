@@ -1,5 +1,50 @@
-from functools import lru_cache, wraps
-from datetime import datetime, timedelta
+import asyncio
+from typing import Any, Callable, TypeVar
+
+from app import dependencies
+from app.database.connection_pool import ConnectionPool
+
+T = TypeVar('T')
+
+
+async def _acquire_connection(pool: ConnectionPool):
+    acquire = asyncio.ensure_future(asyncio.to_thread(pool.acquire))
+    try:
+        return await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # The connection is still handed out, give it back once it is
+        acquire.add_done_callback(
+            lambda future: future.exception() is None and pool.release(future.result())
+        )
+        raise
+
+
+async def run_query(query: Callable[..., T], *args: Any, db_session = None) -> T:
+    """
+    Runs query(db_session, *args) in the database executor so the
+    event loop stays free while sqlite is working. When no db_session
+    is given a read only connection is taken from the pool for the
+    duration of the query. The connection is taken before the query
+    is handed to the executor, so a worker never waits for the pool
+    while the connections are held by callers waiting for a worker.
+    """
+    executor = dependencies.get_db_executor()
+    if db_session is not None:
+        return await executor.run(query, db_session, *args)
+
+    pool = dependencies.get_connection_pool()
+    conn = await _acquire_connection(pool)
+
+    def run() -> T:
+        try:
+            return query(conn, *args)
+        finally:
+            pool.release(conn)
+
+    # Shielded so the connection is released even when the
+    # caller is cancelled before the query starts
+    return await asyncio.shield(executor.run(run))
+
 
 class BaseService:
     def __init__(self, db_session = None) -> None:
@@ -8,21 +53,6 @@ class BaseService:
         """
         self._db_session = db_session
 
+    async def _run_query(self, query: Callable[..., T], *args: Any) -> T:
+        return await run_query(query, *args, db_session=self._db_session)
 
-def timed_lru_cache(minutes: int, maxsize: int = 128):
-    def wrapper_cache(func):
-        func = lru_cache(maxsize=maxsize)(func)
-        func.lifetime = timedelta(minutes=minutes)
-        func.expiration = datetime.utcnow() + func.lifetime
-
-        @wraps(func)
-        def wrapped_func(*args, **kwargs):
-            if datetime.utcnow() >= func.expiration:
-                func.cache_clear()
-                func.expiration = datetime.utcnow() + func.lifetime
-
-            return func(*args, **kwargs)
-
-        return wrapped_func
-
-    return wrapper_cache
\ No newline at end of file
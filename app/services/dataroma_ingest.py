@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app import dependencies, settings
+from app.domain.super_investor import SuperInvestor, SuperInvestorGrandPortfolio
+from app.http.dataroma_client import DataromaClient
+from app.repos.super_investor import SuperInvestorRepo
+from app.services.dataroma_scrapers.grand_portfolio import SuperInvestorGrandPortfolioScraper
+from app.services.dataroma_scrapers.portfolio import SuperInvestorPortfolioScraper
+from app.services.parse_pool import ParsePool
+
+
+@dataclass
+class DataromaIngestReport:
+    # Super investors, or grand portfolio pages, that were stored
+    stored: List[str] = field(default_factory=list)
+    # Super investor or page -> error
+    failed: Dict[str, str] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+
+
+class DataromaIngestService:
+    @classmethod
+    async def _fetch_and_parse_all(
+        cls,
+        names: List[str],
+        fetch_and_parse: Callable[[str], Awaitable[Any]],
+        concurrency: int,
+        report: DataromaIngestReport
+    ) -> Dict[str, Any]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(name: str) -> Any:
+            async with semaphore:
+                return await fetch_and_parse(name)
+
+        results = await asyncio.gather(*[run(name) for name in names], return_exceptions=True)
+        parsed = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logging.error(f"Failed to scrape dataroma {name} with error: {str(result)}")
+                report.failed[name] = str(result)
+            else:
+                parsed[name] = result
+
+        return parsed
+
+    @classmethod
+    async def ingest_super_investor_portfolios(
+        cls,
+        super_investors: Optional[List[SuperInvestor]] = None,
+        concurrency: int = settings.dataroma_concurrency,
+        db_conn = None,
+        parse_pool: Optional[ParsePool] = None
+    ) -> DataromaIngestReport:
+        """
+        Fetches the portfolios of the super investors concurrently (at most
+        concurrency at a time, DataromaClient spaces out the requests), parses
+        them in parse_pool (worker threads when not given) and swaps in the ones
+        that were scraped successfully in a single transaction. A super investor
+        that failed keeps its stored portfolio.
+        """
+        if super_investors is None:
+            super_investors = list(SuperInvestor)
+
+        if db_conn is None:
+            db_conn = dependencies.get_db_conn()
+
+        if parse_pool is None:
+            parse_pool = ParsePool(max_workers=0)
+
+        started_at = time.perf_counter()
+        report = DataromaIngestReport()
+        dataroma_client = DataromaClient()
+        super_investors_by_name = {super_investor.value: super_investor for super_investor in super_investors}
+
+        async def fetch_and_parse(name: str) -> Any:
+            super_investor = super_investors_by_name[name]
+            html_response = await dataroma_client.get_superinvestor_portfolio(super_investor)
+            return await parse_pool.run(
+                SuperInvestorPortfolioScraper.parse_super_investor_portfolio,
+                super_investor,
+                html_response
+            )
+
+        portfolios = await cls._fetch_and_parse_all(
+            list(super_investors_by_name),
+            fetch_and_parse,
+            concurrency,
+            report
+        )
+        if portfolios:
+            await asyncio.to_thread(
+                SuperInvestorRepo(db_conn).replace_super_investor_portfolios,
+                list(portfolios.values())
+            )
+
+        report.stored = list(portfolios)
+        report.elapsed_seconds = time.perf_counter() - started_at
+        return report
+
+    @classmethod
+    async def ingest_grand_portfolio(
+        cls,
+        pages: int = settings.dataroma_grand_portfolio_pages,
+        concurrency: int = settings.dataroma_concurrency,
+        db_conn = None,
+        parse_pool: Optional[ParsePool] = None
+    ) -> DataromaIngestReport:
+        """
+        Fetches and parses the pages of the grand portfolio like
+        ingest_super_investor_portfolios. The grand portfolio is replaced
+        only when every page was scraped, a partial one is never stored.
+        """
+        if db_conn is None:
+            db_conn = dependencies.get_db_conn()
+
+        if parse_pool is None:
+            parse_pool = ParsePool(max_workers=0)
+
+        started_at = time.perf_counter()
+        report = DataromaIngestReport()
+        dataroma_client = DataromaClient()
+        page_names = [f'grand portfolio page {page_num}' for page_num in range(1, pages + 1)]
+
+        async def fetch_and_parse(name: str) -> Any:
+            page_num = page_names.index(name) + 1
+            html_response = await dataroma_client.get_superinvestor_grand_portfolio(page_num=page_num)
+            return await parse_pool.run(SuperInvestorGrandPortfolioScraper.parse_grand_portfolio_page, html_response)
+
+        page_entries = await cls._fetch_and_parse_all(page_names, fetch_and_parse, concurrency, report)
+        if not report.failed:
+            grand_portfolio = SuperInvestorGrandPortfolio(
+                portfolio=[entry for name in page_names for entry in page_entries[name]]
+            )
+            await asyncio.to_thread(
+                SuperInvestorRepo(db_conn).replace_super_investor_grand_portfolio,
+                grand_portfolio
+            )
+            report.stored = page_names
+
+        report.elapsed_seconds = time.perf_counter() - started_at
+        return report
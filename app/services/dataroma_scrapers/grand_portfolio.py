@@ -1,5 +1,8 @@
+import asyncio
+
 import pandas as pd
 
+from app import settings
 from app.http.dataroma_client import DataromaClient
 from app.domain.super_investor import (
     SuperInvestorGrandPortfolioEntry,
@@ -21,17 +24,28 @@ class SuperInvestorGrandPortfolioScraper:
         ]
 
     @classmethod
-    async def scrape_super_investor_grand_portfolio(cls) -> SuperInvestorGrandPortfolio:
+    def parse_grand_portfolio_page(cls, html_response: bytes) -> list[SuperInvestorGrandPortfolioEntry]:
+        """
+        Parses one page of the grand portfolio, it runs in a ParsePool
+        """
+        tables = pd.read_html(html_response)
+        return cls._scrape_grand_portfolio(tables[0])
+
+    @classmethod
+    async def scrape_super_investor_grand_portfolio(
+        cls,
+        pages: int = settings.dataroma_grand_portfolio_pages
+    ) -> SuperInvestorGrandPortfolio:
         dataroma_client = DataromaClient()
+        # DataromaClient spaces out the requests
+        html_responses = await asyncio.gather(*[
+            dataroma_client.get_superinvestor_grand_portfolio(page_num=page_num)
+            for page_num in range(1, pages + 1)
+        ])
         grand_portfolio_entries = []
-        for i in range(1, 11):
-            html_response = await dataroma_client.get_superinvestor_grand_portfolio(
-                page_num=i
-            )
-            tables = pd.read_html(html_response)
-            page_portfolio_entries = cls._scrape_grand_portfolio(tables[0])
-            grand_portfolio_entries += page_portfolio_entries
-        
+        for html_response in html_responses:
+            grand_portfolio_entries += cls.parse_grand_portfolio_page(html_response)
+
         return SuperInvestorGrandPortfolio(
             portfolio=grand_portfolio_entries
         )
\ No newline at end of file
@@ -46,7 +46,13 @@ class SuperInvestorPortfolioScraper:
         html_response = await dataroma_client.get_superinvestor_portfolio(
             super_investor=super_investor
         )
+        return cls.parse_super_investor_portfolio(super_investor, html_response)
 
+    @classmethod
+    def parse_super_investor_portfolio(cls, super_investor: SuperInvestor, html_response: bytes) -> SuperInvestorPortfolio:
+        """
+        Parses the holdings page of a super investor, it runs in a ParsePool
+        """
         tables = pd.read_html(html_response)
         portfolio_holdings = cls._scrape_portfolio_holdings(tables[0])
         sector_analysis = cls._scrape_portfolio_sector_analysis(tables[1])
@@ -6,6 +6,7 @@ from app.services.ibd_scrapers.stock_leaders import StockLeadersScraper
 from app.repos.dividend_leaders_repo import DividendLeadersRepo
 from app.domain.date import Date
 from app.domain.stock_leader import StockLeader
+from app.cache import cached
 from app.services.base_service import BaseService
 
 class DividendLeadersService(BaseService):
@@ -52,5 +53,8 @@ class DividendLeadersService(BaseService):
 
         return dividend_leaders
 
-    def get_latest_dividend_leaders(self) -> List[StockLeader]:
-        return DividendLeadersRepo(self._db_session).get_latest_stock_leaders()
+    @cached(tables=['dividend_leaders'])
+    async def get_latest_dividend_leaders(self) -> List[StockLeader]:
+        return await self._run_query(
+            lambda db_session: DividendLeadersRepo(db_session).get_latest_stock_leaders()
+        )
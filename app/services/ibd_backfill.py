@@ -0,0 +1,168 @@
+import asyncio
+import datetime as dt
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+
+from app import dependencies, settings
+from app.domain.date import Date
+from app.repos.backfill_checkpoints_repo import BackfillCheckpointsRepo
+from app.repos.snapshot_dates_repo import SnapshotDatesRepo
+from app.services.ibd_ingest import IBD_TABLES, IbdIngestService, IbdTable
+from app.services.parse_pool import ParsePool
+
+
+@dataclass
+class IbdBackfillReport:
+    dates: int = 0
+    ingested: int = 0
+    # Already in the snapshot catalog or checkpointed by an earlier run
+    skipped: int = 0
+    # Dates ibd didn't publish, e.g. market holidays
+    missing: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def dates_per_minute(self) -> float:
+        processed = self.ingested + self.missing + self.failed
+        return processed / max(self.elapsed_seconds, 1e-9) * 60
+
+    def __str__(self) -> str:
+        return (
+            f'Backfilled {self.dates} dates in {self.elapsed_seconds:.1f}s: '
+            f'{self.ingested} ingested, {self.skipped} skipped, {self.missing} missing, {self.failed} failed '
+            f'({self.dates_per_minute:.1f} dates/min)'
+        )
+
+
+class IbdBackfillService:
+    @classmethod
+    def _dates(cls, start: dt.date, end: dt.date, include_weekends: bool) -> List[dt.date]:
+        dates = []
+        day = start
+        while day <= end:
+            # Ibd publishes the tables on trading days
+            if include_weekends or day.weekday() < 5:
+                dates.append(day)
+            day += dt.timedelta(days=1)
+
+        return dates
+
+    @classmethod
+    def _pending_tables(cls, date: Date, tables: List[IbdTable], catalog: Dict[str, Set[str]]) -> List[IbdTable]:
+        return [
+            table for table in tables
+            if date.date_string not in catalog[table.catalog_name]
+        ]
+
+    @classmethod
+    def checkpoint_name(cls, job_name: str, tables: List[IbdTable]) -> str:
+        """
+        Name the progress of job_name over tables is checkpointed under.
+        A run over another set of tables doesn't reuse the checkpoints,
+        its dates are checked against the snapshot catalog again.
+        """
+        table_names = sorted(table.name for table in tables)
+        if table_names == sorted(table.name for table in IBD_TABLES):
+            return job_name
+
+        return f"{job_name}[{','.join(table_names)}]"
+
+    @classmethod
+    async def backfill(
+        cls,
+        start: dt.date,
+        end: dt.date,
+        tables: List[IbdTable] = IBD_TABLES,
+        job_name: str = 'ibd_backfill',
+        concurrency: int = settings.ibd_backfill_concurrency,
+        include_weekends: bool = False,
+        retry_missing: bool = False,
+        db_conn = None,
+        parse_pool: Optional[ParsePool] = None,
+        clock: Callable[[], float] = time.perf_counter
+    ) -> IbdBackfillReport:
+        """
+        Ingests the tables of every date in [start, end]. The tables a date
+        already has in the snapshot_dates catalog are not fetched again and
+        the outcome of every date is checkpointed under job_name and the
+        set of tables (see checkpoint_name), so a job that is started again
+        resumes where it stopped and retries only the failed dates. concurrency dates are ingested at a time, the requests
+        are spaced out by the rate limiter of IbdClient. With retry_missing a date
+        ibd didn't publish fails instead of being checkpointed as missing, e.g.
+        the current date when the tables are not published yet.
+        """
+        if db_conn is None:
+            db_conn = dependencies.get_db_conn()
+
+        started_at = clock()
+        report = IbdBackfillReport()
+        job_name = cls.checkpoint_name(job_name, tables)
+        checkpoints_repo = BackfillCheckpointsRepo(db_conn)
+        checkpoints = checkpoints_repo.get_checkpoints(job_name)
+        snapshot_dates_repo = SnapshotDatesRepo(db_conn)
+        catalog = {
+            table.catalog_name: set(snapshot_dates_repo.get_snapshot_dates(table.catalog_name))
+            for table in tables
+        }
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def backfill_date(day: dt.date) -> None:
+            date = Date(day.day, day.month, day.year)
+            if checkpoints.get(date.date_string) in (BackfillCheckpointsRepo.DONE, BackfillCheckpointsRepo.MISSING):
+                report.skipped += 1
+                return
+
+            pending_tables = cls._pending_tables(date, tables, catalog)
+            if not pending_tables:
+                report.skipped += 1
+                await asyncio.to_thread(
+                    checkpoints_repo.save_checkpoint, job_name, date, BackfillCheckpointsRepo.DONE
+                )
+                return
+
+            error = None
+            async with semaphore:
+                try:
+                    ingest_report = await IbdIngestService.ingest_for_date(
+                        day.day,
+                        day.month,
+                        day.year,
+                        tables=pending_tables,
+                        db_conn=db_conn,
+                        parse_pool=parse_pool
+                    )
+                except Exception as err:
+                    status = BackfillCheckpointsRepo.FAILED
+                    error = str(err)
+                else:
+                    if ingest_report.failed:
+                        error = '; '.join(f'{name}: {err}' for name, err in ingest_report.failed.items())
+
+                    if len(ingest_report.missing) < len(ingest_report.failed):
+                        status = BackfillCheckpointsRepo.FAILED
+                    elif ingest_report.stored:
+                        # Some tables aren't published every day
+                        status = BackfillCheckpointsRepo.DONE
+                    elif retry_missing:
+                        status = BackfillCheckpointsRepo.FAILED
+                    else:
+                        status = BackfillCheckpointsRepo.MISSING
+
+            if status == BackfillCheckpointsRepo.DONE:
+                report.ingested += 1
+            elif status == BackfillCheckpointsRepo.MISSING:
+                report.missing += 1
+            else:
+                report.failed += 1
+                logging.error(f"Backfill of {date.date_string} failed with error: {error}")
+
+            await asyncio.to_thread(checkpoints_repo.save_checkpoint, job_name, date, status, error)
+
+        dates = cls._dates(start, end, include_weekends)
+        report.dates = len(dates)
+        await asyncio.gather(*[backfill_date(day) for day in dates])
+        report.elapsed_seconds = clock() - started_at
+        return report
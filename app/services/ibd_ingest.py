@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app import dependencies
+from app.domain.date import Date
+from app.errors.ibd import IbdTableNotFoundError
+from app.http.ibd_client import IbdClient
+from app.repos.dividend_leaders_repo import DividendLeadersRepo
+from app.repos.large_mid_cap_leaders_index_repo import LargeMidCapLeadersIndexRepo
+from app.repos.reit_leaders_repo import ReitLeadersRepo
+from app.repos.small_mid_cap_leaders_index_repo import SmallMidCapLeadersIndexRepo
+from app.repos.stocks_with_sector_repo import StocksWithSectorRepo
+from app.repos.tech_leaders_stocks_repo import TechLeadersStocksRepo
+from app.repos.top_composite_stocks_repo import TopCompositeStocksRepo
+from app.repos.utility_leaders_repo import UtilityLeadersRepo
+from app.services.ibd_scrapers.composite_stocks import CompositeStocksScraper
+from app.services.ibd_scrapers.leaders_index import LeadersIndexScraper
+from app.services.ibd_scrapers.stock_leaders import StockLeadersScraper
+from app.services.ibd_scrapers.stocks_with_sector import StocksWithSectorScraper
+from app.services.ibd_scrapers.tech_leaders_stocks import TechLeadersStocksScraper
+from app.services.parse_pool import ParsePool
+
+
+@dataclass(frozen=True)
+class IbdTable:
+    """
+    An ibd data table that is scraped daily
+    :fetch -> Returns the html of the table for a date, None when there is no table
+    :parse -> Converts the html to domain models, it runs in a ParsePool
+    :store -> Stores the domain models of a date through the given connection
+    :snapshot_table -> Name of the sql table (and of the table in the snapshot_dates
+    catalog), when it's not the same as name
+    """
+    name: str
+    fetch: Callable[[IbdClient, int, int, int], Awaitable[Optional[str]]]
+    parse: Callable[[str], Any]
+    store: Callable[[Any, Date, Any], None]
+    snapshot_table: Optional[str] = None
+
+    @property
+    def catalog_name(self) -> str:
+        return self.snapshot_table or self.name
+
+
+IBD_TABLES = [
+    IbdTable(
+        name='dividend_leaders',
+        fetch=lambda client, day, month, year: client.get_dividend_leaders(day, month, year),
+        parse=StockLeadersScraper.parse_stock_leaders,
+        store=lambda db_conn, date, data: DividendLeadersRepo(db_conn).add_stock_leaders_for_date(date=date, data=data)
+    ),
+    IbdTable(
+        name='small_mid_cap_leaders_index',
+        fetch=lambda client, day, month, year: client.get_small_mid_cap_leaders_index(day, month, year),
+        parse=LeadersIndexScraper.parse_leaders_index,
+        store=lambda db_conn, date, data: SmallMidCapLeadersIndexRepo(db_conn).add_stock_leaders_for_date(date=date, data=data)
+    ),
+    IbdTable(
+        name='large_mid_cap_leaders_index',
+        fetch=lambda client, day, month, year: client.get_large_mid_cap_leaders_index(day, month, year),
+        parse=LeadersIndexScraper.parse_leaders_index,
+        store=lambda db_conn, date, data: LargeMidCapLeadersIndexRepo(db_conn).add_stock_leaders_for_date(date=date, data=data)
+    ),
+    IbdTable(
+        name='reit_leaders',
+        fetch=lambda client, day, month, year: client.get_reit_leaders(day, month, year),
+        parse=StockLeadersScraper.parse_stock_leaders,
+        store=lambda db_conn, date, data: ReitLeadersRepo(db_conn).add_stock_leaders_for_date(date=date, data=data)
+    ),
+    IbdTable(
+        name='stocks_with_sector',
+        fetch=lambda client, day, month, year: client.get_top_stocks_by_sector(day, month, year),
+        parse=StocksWithSectorScraper.parse_stocks_with_sector,
+        store=lambda db_conn, date, data: StocksWithSectorRepo(db_conn).add_stocks_with_sector_for_date(
+            date=date,
+            sectors=data[0],
+            stocks=data[1]
+        )
+    ),
+    IbdTable(
+        name='tech_leaders_stocks',
+        fetch=lambda client, day, month, year: client.get_tech_leader_stocks(day, month, year),
+        parse=TechLeadersStocksScraper.parse_tech_leaders_stocks,
+        store=lambda db_conn, date, data: TechLeadersStocksRepo(db_conn).add_tech_leaders_stocks_for_date(date=date, data=data),
+        snapshot_table='tech_leaders'
+    ),
+    IbdTable(
+        name='top_composite_stocks',
+        fetch=lambda client, day, month, year: client.get_top_200_composite_stocks(day, month, year),
+        parse=CompositeStocksScraper.scrape_composite_stocks,
+        store=lambda db_conn, date, data: TopCompositeStocksRepo(db_conn).add_comp_stocks_for_date(date=date, data=data)
+    ),
+    IbdTable(
+        name='utility_leaders',
+        fetch=lambda client, day, month, year: client.get_utility_leaders(day, month, year),
+        parse=StockLeadersScraper.parse_stock_leaders,
+        store=lambda db_conn, date, data: UtilityLeadersRepo(db_conn).add_stock_leaders_for_date(date=date, data=data)
+    ),
+]
+
+
+@dataclass
+class IbdIngestReport:
+    date: Date
+    stored: List[str] = field(default_factory=list)
+    # Table name -> error
+    failed: Dict[str, str] = field(default_factory=dict)
+    # The failed tables that ibd didn't publish for the date
+    missing: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+
+class IbdIngestService:
+    @classmethod
+    async def _fetch_and_parse(
+        cls,
+        ibd_client: IbdClient,
+        table: IbdTable,
+        day: int,
+        month: int,
+        year: int,
+        parse_pool: ParsePool
+    ) -> Any:
+        html_response = await table.fetch(ibd_client, day, month, year)
+        # This function should be called with a date that has data
+        # so in case we got a None respose we raise an error
+        if html_response is None:
+            raise IbdTableNotFoundError(f'Failed to scrape {table.name}')
+
+        return await parse_pool.run(table.parse, html_response)
+
+    @classmethod
+    def _store(
+        cls,
+        db_conn,
+        date: Date,
+        parsed_tables: List[Tuple[IbdTable, Any]],
+        replace: bool = False
+    ) -> None:
+        # The repos open nested transactions on the writer connection,
+        # only this block commits so the date is stored all or nothing
+        with db_conn:
+            for table, data in parsed_tables:
+                if replace:
+                    # The repos append the rows, drop the stored ones of the
+                    # date first so that a re-ingested date isn't duplicated
+                    db_conn.execute(
+                        f"DELETE FROM {table.catalog_name} WHERE registered_date=?",
+                        (date.date_string, )
+                    )
+                table.store(db_conn, date, data)
+
+    @classmethod
+    async def ingest_for_date(
+        cls,
+        day: int,
+        month: int,
+        year: int,
+        tables: List[IbdTable] = IBD_TABLES,
+        db_conn = None,
+        parse_pool: Optional[ParsePool] = None,
+        replace: bool = False
+    ) -> IbdIngestReport:
+        """
+        Fetches the tables of a date concurrently (IbdClient spaces out the
+        requests), parses them in parse_pool (worker threads when not given)
+        and stores the ones that were scraped successfully in a single transaction.
+        With replace the rows that are already stored for the date are deleted
+        in the same transaction, use it when a date is ingested again.
+        """
+        if db_conn is None:
+            db_conn = dependencies.get_db_conn()
+
+        if parse_pool is None:
+            parse_pool = ParsePool(max_workers=0)
+
+        started_at = time.perf_counter()
+        report = IbdIngestReport(date=Date(day, month, year))
+        ibd_client = IbdClient()
+        results = await asyncio.gather(
+            *[cls._fetch_and_parse(ibd_client, table, day, month, year, parse_pool) for table in tables],
+            return_exceptions=True
+        )
+
+        parsed_tables = []
+        for table, result in zip(tables, results):
+            if isinstance(result, Exception):
+                logging.error(f"Failed to scrape {table.name} for date:{day}-{month}-{year} with error: {str(result)}")
+                report.failed[table.name] = str(result)
+                if isinstance(result, IbdTableNotFoundError):
+                    report.missing.append(table.name)
+            else:
+                parsed_tables.append((table, result))
+
+        await asyncio.to_thread(cls._store, db_conn, report.date, parsed_tables, replace)
+        report.stored = [table.name for table, _ in parsed_tables]
+        report.elapsed_seconds = time.perf_counter() - started_at
+        return report
@@ -1,8 +1,7 @@
 from typing import List, Optional
 
-import pandas as pd
-
 from app.http.ibd_client import IbdClient
+from app.services.ibd_scrapers.html_tables import first_table
 from app.domain.composite_stock import CompositeStock
 from app.domain.comp_rating import CompRating
 from app.domain.eps_rating import EpsRating
@@ -33,11 +32,8 @@ class CompositeStocksScraper:
         if html_response is None:
             return None
 
-        tables = pd.read_html(html_response)
-        composite_stocks_df = tables[0]
-
-        composite_stocks_records = composite_stocks_df.to_records(index=False)
-        # record example -> ('99', '99', '97', 'B+', '104.0', 'Denbury', 'DEN', '90.30', '-5.25', '58')
+        composite_stocks_records = first_table(html_response).rows
+        # record example -> ['99', '99', '97', 'B+', '104.0', 'Denbury', 'DEN', '90.30', '-5.25', '58']
        
         # The first two rows containing column names and not the data
         # we are interested in so we skip them
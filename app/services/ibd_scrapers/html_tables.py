@@ -0,0 +1,79 @@
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Iterator, List, Optional, Union
+
+from lxml import etree
+
+from app.errors.ibd import IbdScrapeError
+
+
+@dataclass
+class HtmlTable:
+    # Text of the last <h3> before the table, the ibd pages
+    # put the name of a table (e.g. the sector) there
+    heading: Optional[str]
+    # Text of the cells, a cell spanning n columns is repeated n times
+    rows: List[List[str]] = field(default_factory=list)
+
+
+def _text(element) -> str:
+    # Like pd.read_html, runs of spaces, &nbsp; and new lines become one space
+    return ' '.join(''.join(element.itertext()).split())
+
+
+def _table_rows(table) -> List[List[str]]:
+    rows = []
+    for tr in table.iter('tr'):
+        row = []
+        for cell in tr:
+            if cell.tag not in ('td', 'th'):
+                continue
+
+            colspan = cell.get('colspan', '1')
+            text = _text(cell)
+            row.extend([text] * (int(colspan) if colspan.isdigit() else 1))
+
+        rows.append(row)
+
+    return rows
+
+
+def _in_table(element) -> bool:
+    return any(ancestor.tag == 'table' for ancestor in element.iterancestors())
+
+
+def iter_tables(html_response: Union[str, bytes]) -> Iterator[HtmlTable]:
+    """
+    Walks the html document once and yields its tables in document order.
+    The elements are dropped as soon as they are read so the tree of
+    the whole page is never in memory, and a caller that stops early
+    doesn't parse the rest of the page.
+    """
+    if isinstance(html_response, str):
+        html_response = html_response.encode('utf-8')
+
+    heading = None
+    for _, element in etree.iterparse(
+        BytesIO(html_response),
+        events=('end',),
+        tag=('h3', 'table'),
+        html=True,
+        encoding='utf-8'
+    ):
+        if element.tag == 'h3':
+            heading = _text(element)
+        else:
+            yield HtmlTable(heading=heading, rows=_table_rows(element))
+
+        if not _in_table(element):
+            element.clear()
+            # The siblings before the element were read already
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
+def first_table(html_response: Union[str, bytes]) -> HtmlTable:
+    for table in iter_tables(html_response):
+        return table
+
+    raise IbdScrapeError('No tables found')
@@ -1,8 +1,7 @@
 from typing import List, Optional
 
-import pandas as pd
-
 from app.http.ibd_client import IbdClient
+from app.services.ibd_scrapers.html_tables import first_table
 from app.domain.price import Price
 from app.domain.stock_leader import StockLeader
 from app.domain.comp_rating import CompRating
@@ -21,12 +20,9 @@ class LeadersIndexScraper:
         )
 
     @classmethod
-    async def _scrape_leaders_index(cls, html_response) -> Optional[List[StockLeader]]:
-        tables = pd.read_html(html_response)
-        leaders_index_df = tables[0]
-
-        leaders_index_records = leaders_index_df.to_records(index=False)
-        # record example -> ('99', '98', 'Futu', 'FUTU', '56.38')
+    def parse_leaders_index(cls, html_response) -> Optional[List[StockLeader]]:
+        leaders_index_records = first_table(html_response).rows
+        # record example -> ['99', '98', 'Futu', 'FUTU', '56.38']
         # The first row containing column names and not the data
         # we are interested in so we skip them
         return [
@@ -44,7 +40,7 @@ class LeadersIndexScraper:
         if html_response is None:
             return None
 
-        small_mid_cap_leaders_index = await cls._scrape_leaders_index(html_response)
+        small_mid_cap_leaders_index = cls.parse_leaders_index(html_response)
         return small_mid_cap_leaders_index
 
     @classmethod
@@ -57,5 +53,5 @@ class LeadersIndexScraper:
         if html_response is None:
             return None
 
-        large_mid_cap_leaders_index = await cls._scrape_leaders_index(html_response)
+        large_mid_cap_leaders_index = cls.parse_leaders_index(html_response)
         return large_mid_cap_leaders_index
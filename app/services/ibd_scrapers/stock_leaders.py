@@ -1,8 +1,7 @@
 from typing import List, Optional
 
-import pandas as pd
-
 from app.http.ibd_client import IbdClient
+from app.services.ibd_scrapers.html_tables import first_table
 from app.domain.price import Price
 from app.domain.percentage import Percentage
 from app.domain.stock_leader import StockLeader
@@ -20,12 +19,9 @@ class StockLeadersScraper:
         )
 
     @classmethod
-    async def _scrape_stock_leaders(cls, html_response) -> Optional[List[StockLeader]]:
-        tables = pd.read_html(html_response)
-        stock_leaders_df = tables[0]
-
-        stock_leaders_records = stock_leaders_df.to_records(index=False)
-        # record example -> ('Mplx', 'MPLX', '33.52', '8.41', '11')
+    def parse_stock_leaders(cls, html_response) -> Optional[List[StockLeader]]:
+        stock_leaders_records = first_table(html_response).rows
+        # record example -> ['Mplx', 'MPLX', '33.52', '8.41', '11']
         # The first two rows containing column names and not the data
         # we are interested in so we skip them
         return [
@@ -43,7 +39,7 @@ class StockLeadersScraper:
         if html_response is None:
             return None
 
-        reit_leaders = await cls._scrape_stock_leaders(html_response)
+        reit_leaders = cls.parse_stock_leaders(html_response)
         return reit_leaders
 
     @classmethod
@@ -56,7 +52,7 @@ class StockLeadersScraper:
         if html_response is None:
             return None
 
-        utility_leaders = await cls._scrape_stock_leaders(html_response)
+        utility_leaders = cls.parse_stock_leaders(html_response)
         return utility_leaders
 
     @classmethod
@@ -69,5 +65,5 @@ class StockLeadersScraper:
         if html_response is None:
             return None
 
-        dividend_leaders = await cls._scrape_stock_leaders(html_response)
+        dividend_leaders = cls.parse_stock_leaders(html_response)
         return dividend_leaders
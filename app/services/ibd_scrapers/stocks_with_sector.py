@@ -1,9 +1,6 @@
 from typing import List, Optional, Tuple
 import string
 
-import bs4
-import pandas as pd
-
 from app.domain.acc_dis_rating import AccDisRating
 from app.domain.comp_rating import CompRating
 from app.domain.composite_stock import CompositeStock
@@ -15,6 +12,7 @@ from app.domain.price import Price
 from app.domain.percentage import Percentage
 from app.errors.ibd import IbdScrapeError
 from app.http.ibd_client import IbdClient
+from app.services.ibd_scrapers.html_tables import iter_tables
 
 class StocksWithSectorScraper:
     @classmethod
@@ -35,32 +33,25 @@ class StocksWithSectorScraper:
 
 
     @classmethod
-    def _scrape_sectors(cls, html_response) -> List[SectorPerformance]:
-        soup = bs4.BeautifulSoup(html_response, "lxml")
-        h3 = soup.find_all('h3')
-
-        sector_data = []
-
-        for header in h3:
-            split_data = header.text.split(' ')
-            if len(split_data) == 9 or len(split_data) == 10:
-                if len(split_data) == 10:
-                    sector_name = f'{split_data[1]} {split_data[2]}'
-                    daily_change_pct = split_data[3]
-                    change_since_Jan_1st = split_data[6]
-                else:
-                    sector_name = split_data[1]
-                    daily_change_pct = split_data[2]
-                    change_since_Jan_1st = split_data[5]
-                sector_data.append(
-                    SectorPerformance(
-                        sector_name=sector_name,
-                        daily_price_change_pct=SectorPriceChangePct(str(daily_change_pct)),
-                        start_of_year_price_change_pct=SectorPriceChangePct(str(change_since_Jan_1st))
-                    )
-                )
-
-        return sector_data
+    def _scrape_sector_from_heading(cls, heading: Optional[str]) -> Optional[SectorPerformance]:
+        # Heading example -> '4. METALS +0.8% Daily Change, +5.98% Since Jan. 1'
+        split_data = heading.split(' ') if heading else []
+        if len(split_data) == 10:
+            sector_name = f'{split_data[1]} {split_data[2]}'
+            daily_change_pct = split_data[3]
+            change_since_Jan_1st = split_data[6]
+        elif len(split_data) == 9:
+            sector_name = split_data[1]
+            daily_change_pct = split_data[2]
+            change_since_Jan_1st = split_data[5]
+        else:
+            return None
+
+        return SectorPerformance(
+            sector_name=sector_name,
+            daily_price_change_pct=SectorPriceChangePct(str(daily_change_pct)),
+            start_of_year_price_change_pct=SectorPriceChangePct(str(change_since_Jan_1st))
+        )
 
     @classmethod
     def _scrape_stock_name_from_table_cell(cls, stock_name_cell: str) -> str:
@@ -80,26 +71,38 @@ class StocksWithSectorScraper:
         return stock_symbol_cell.strip()
 
     @classmethod
-    def _scrape_stocks_tables(cls, html_response) -> List[List[CompositeStock]]:
-        stocks_by_sector = []
-        tables = pd.read_html(html_response)
-        for table in tables:
-            table_records = table.to_records(index=False)
-            sector_stocks = []
-            # Record example
-            # ('83', '83', '90', 'C', 'B', '27.7', 'Enact\xa0Hldgs 2.3', 'ACT', '24.32', '+0.42', '-29', '164', '6', 'k')
-            for record in table_records:
-                try:
-                    # To avoid scraping data that are not stocks
-                    int(record[1])
-                except Exception:
-                    continue
-
-                sector_stocks.append(cls._convert_table_record_to_domain_model(record))
-            
-            stocks_by_sector.append(sector_stocks)
-        
-        return stocks_by_sector
+    def _scrape_stocks_table(cls, table_records: List[List[str]]) -> List[CompositeStock]:
+        sector_stocks = []
+        # Record example
+        # ['83', '83', '90', 'C', 'B', '27.7', 'Enact Hldgs 2.3', 'ACT', '24.32', '+0.42', '-29', '164', '6', 'k']
+        for record in table_records:
+            try:
+                # To avoid scraping data that are not stocks
+                int(record[1])
+            except Exception:
+                continue
+
+            sector_stocks.append(cls._convert_table_record_to_domain_model(record))
+
+        return sector_stocks
+
+    @classmethod
+    def parse_stocks_with_sector(
+        cls,
+        html_response: str
+    ) -> Tuple[List[SectorPerformance], List[List[CompositeStock]]]:
+        sectors = []
+        stocks = []
+        # One pass over the page, every table follows the heading of its sector
+        for table in iter_tables(html_response):
+            sector = cls._scrape_sector_from_heading(table.heading)
+            if sector is None:
+                raise IbdScrapeError('Failed to scrape top stocks by sector')
+
+            sectors.append(sector)
+            stocks.append(cls._scrape_stocks_table(table.rows))
+
+        return sectors, stocks
 
     @classmethod
     async def scrape_stocks_with_sector(
@@ -116,10 +119,4 @@ class StocksWithSectorScraper:
         if html_response is None:
             return None
 
-        sectors = cls._scrape_sectors(html_response)
-        stocks = cls._scrape_stocks_tables(html_response)
-
-        if len(sectors) != len(stocks):
-            raise IbdScrapeError('Failed to scrape top stocks by sector')
-        
-        return sectors, stocks
+        return cls.parse_stocks_with_sector(html_response)
@@ -1,8 +1,7 @@
 from typing import List, Optional
 
-import pandas as pd
-
 from app.http.ibd_client import IbdClient
+from app.services.ibd_scrapers.html_tables import first_table
 from app.domain.tech_leader_stock import TechLeaderStock
 from app.domain.comp_rating import CompRating
 from app.domain.eps_rating import EpsRating
@@ -28,6 +27,18 @@ class TechLeadersStocksScraper:
             return_on_equity=str(record[10])
         )
 
+    @classmethod
+    def parse_tech_leaders_stocks(cls, html_response: str) -> List[TechLeaderStock]:
+        tech_leaders_stocks_records = first_table(html_response).rows
+        # record example -> ['Clearfield', 'CLFD', '122.62', '99', '99', '99', '+113', '+109', '+51', '+84', '22', '18']
+       
+        # The first three rows containing column names and not the data
+        # we are interested in so we skip them
+        return [
+            cls._convert_table_record_to_domain_model(record)
+            for record in tech_leaders_stocks_records[3:]
+        ]
+
     @classmethod
     async def scrape_tech_leaders_stocks(cls, day: int, month: int, year: int) -> Optional[List[TechLeaderStock]]:
         ibd_client = IbdClient()
@@ -38,15 +49,4 @@ class TechLeadersStocksScraper:
         if html_response is None:
             return None
 
-        tables = pd.read_html(html_response)
-        tech_leaders_stocks_df = tables[0]
-
-        tech_leaders_stocks_records = tech_leaders_stocks_df.to_records(index=False)
-        # record example -> ('Clearfield', 'CLFD', '122.62', '99', '99', '99', '+113', '+109', '+51', '+84', '22', '18')
-       
-        # The first three rows containing column names and not the data
-        # we are interested in so we skip them
-        return [
-            cls._convert_table_record_to_domain_model(record)
-            for record in tech_leaders_stocks_records[3:]
-        ]
+        return cls.parse_tech_leaders_stocks(html_response)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Type
 import logging
 
 from app.errors.ibd import IbdScrapeError
@@ -8,11 +8,13 @@ from app.repos.large_mid_cap_leaders_index_repo import LargeMidCapLeadersIndexRe
 from app.repos.small_mid_cap_leaders_index_repo import SmallMidCapLeadersIndexRepo
 from app.domain.date import Date
 from app.domain.stock_leader import StockLeader
+from app.cache import cached
+from app.services.base_service import run_query
 
 
 class LeadersIndexService:
 
-    _repo: LeadersIndexRepo = None
+    _repo_class: Type[LeadersIndexRepo] = None
     _scrape_function = None
 
     @classmethod
@@ -34,7 +36,7 @@ class LeadersIndexService:
             raise IbdScrapeError('Failed to scrape leaders index')            
 
         # Store
-        cls._repo.add_stock_leaders_for_date(
+        cls._repo_class().add_stock_leaders_for_date(
             date=Date(day, month, year),
             data=leaders_index
         )
@@ -65,20 +67,23 @@ class LeadersIndexService:
         month: int,
         year: int
     ) -> Optional[List[StockLeader]]:
-        return cls._repo.get_stock_leaders_for_date(
+        return cls._repo_class().get_stock_leaders_for_date(
             date=Date(day, month, year)
         )
 
     @classmethod
-    def get_latest_leaders_index(cls) -> List[StockLeader]:
-        return  cls._repo.get_latest_stock_leaders()
+    @cached(tables=['small_mid_cap_leaders_index', 'large_mid_cap_leaders_index'])
+    async def get_latest_leaders_index(cls) -> List[StockLeader]:
+        return await run_query(
+            lambda db_session: cls._repo_class(db_session).get_latest_stock_leaders()
+        )
 
 
 class SmallMidCapLeadersIndexService(LeadersIndexService):
-    _repo: LeadersIndexRepo = SmallMidCapLeadersIndexRepo()
+    _repo_class: Type[LeadersIndexRepo] = SmallMidCapLeadersIndexRepo
     _scrape_function = LeadersIndexScraper.scrape_small_mid_cap_leaders_index
 
 
 class LargeMidCapLeadersIndexService(LeadersIndexService):
-    _repo: LeadersIndexRepo = LargeMidCapLeadersIndexRepo()
+    _repo_class: Type[LeadersIndexRepo] = LargeMidCapLeadersIndexRepo
     _scrape_function = LeadersIndexScraper.scrape_large_mid_cap_leaders_index
\ No newline at end of file
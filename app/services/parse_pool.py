@@ -0,0 +1,49 @@
+import asyncio
+import concurrent.futures
+from typing import Any, Callable, Optional
+
+from app import settings
+
+
+class ParsePool:
+    """
+    Runs the cpu bound parsers (html tables, big json documents) away from
+    the event loop, so the fetches in flight keep going while a page is
+    parsed. With max_workers > 0 (None is a worker per core) the parsers
+    run in worker processes and use every core: the parser must be a module
+    level function or classmethod, and its arguments and result must be
+    picklable, raw response bodies in and plain rows out are the cheapest.
+    With 0 they run in a thread of this process, which shares the GIL.
+    """
+    def __init__(self, max_workers: Optional[int] = settings.parse_pool_workers) -> None:
+        self._max_workers = max_workers
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+    @property
+    def in_process(self) -> bool:
+        return self._max_workers == 0
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        # The workers start with the first parse, an unused pool costs nothing
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=self._max_workers)
+
+        return self._executor
+
+    async def run(self, parse: Callable[..., Any], *args: Any) -> Any:
+        if self.in_process:
+            return await asyncio.to_thread(parse, *args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), parse, *args)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'ParsePool':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
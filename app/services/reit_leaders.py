@@ -6,6 +6,7 @@ from app.services.ibd_scrapers.stock_leaders import StockLeadersScraper
 from app.repos.reit_leaders_repo import ReitLeadersRepo
 from app.domain.date import Date
 from app.domain.stock_leader import StockLeader
+from app.cache import cached
 from app.services.base_service import BaseService
 
 class ReitLeadersService(BaseService):
@@ -52,5 +53,8 @@ class ReitLeadersService(BaseService):
 
         return reit_leaders
 
-    def get_latest_reit_leaders(self) -> List[StockLeader]:
-        return ReitLeadersRepo(self._db_session).get_latest_stock_leaders()
+    @cached(tables=['reit_leaders'])
+    async def get_latest_reit_leaders(self) -> List[StockLeader]:
+        return await self._run_query(
+            lambda db_session: ReitLeadersRepo(db_session).get_latest_stock_leaders()
+        )
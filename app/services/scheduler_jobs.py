@@ -0,0 +1,49 @@
+import datetime as dt
+from typing import List, Optional, Tuple
+
+from app import dependencies
+from app.domain.scheduler_job import SchedulerJob
+from app.repos.scheduler_jobs_repo import SchedulerJobsRepo
+from app.scheduler.jobs import get_job_definition
+from app.services.base_service import BaseService, run_query
+
+
+class SchedulerJobsService(BaseService):
+    # Not cached, the status of the jobs changes without a data version bump
+    async def get_jobs(
+        self,
+        status: Optional[str] = None,
+        dataset: Optional[str] = None,
+        limit: int = 100
+    ) -> List[SchedulerJob]:
+        return await self._run_query(
+            lambda db_session: SchedulerJobsRepo(db_session).get_jobs(status=status, dataset=dataset, limit=limit)
+        )
+
+    async def enqueue_symbol_data(self, symbol: str, db_conn = None) -> Tuple[SchedulerJob, bool]:
+        """
+        Queues the ingest of the overview, statements, earnings and weekly
+        time series of symbol, the scheduler runs it. Requests for a symbol
+        that is queued or running share its job, the flag is True when the
+        job was queued by this call.
+        """
+        if db_conn is None:
+            db_conn = dependencies.get_db_conn()
+
+        definition = get_job_definition('symbol_data')
+        return await run_query(
+            lambda db_session: SchedulerJobsRepo(db_session).enqueue_unless_active(
+                dataset=definition.dataset,
+                params={'symbol': symbol},
+                provider=definition.provider,
+                priority=definition.priority,
+                max_attempts=definition.max_attempts,
+                now=dt.datetime.now(dt.timezone.utc)
+            ),
+            db_session=db_conn
+        )
+
+    async def get_job(self, job_id: int) -> Optional[SchedulerJob]:
+        return await self._run_query(
+            lambda db_session: SchedulerJobsRepo(db_session).get_job(job_id)
+        )
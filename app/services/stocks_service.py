@@ -1,27 +1,31 @@
 from typing import Optional, List, Dict, Any
 
-from app import settings
 from app.domain.composite_stock import CompositeStock
-from app.services.base_service import BaseService, timed_lru_cache
+from app.cache import cached
+from app.services.base_service import BaseService
 from app.repos.stocks_with_sector_repo import StocksWithSectorRepo
 from app.repos.balance_sheet_repo import BalanceSheetRepo
 from app.repos.income_statement_repo import IncomeStatementRepo
 from app.repos.cash_flow_repo import CashFlowRepo
 
 class StocksService(BaseService):
-    @timed_lru_cache(minutes=settings.cache_time_minutes)
-    def get_stock_profile(self, symbol: str) -> Optional[CompositeStock]:
-        return StocksWithSectorRepo(self._db_session).get_stock_latest_data(symbol)
+    @cached(tables=['stocks_with_sector'])
+    async def get_stock_profile(self, symbol: str) -> Optional[CompositeStock]:
+        return await self._run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_stock_latest_data(symbol)
+        )
     
-    @timed_lru_cache(minutes=settings.cache_time_minutes)
-    def get_stock_historical_performance(
+    @cached(tables=['stocks_with_sector'])
+    async def get_stock_historical_performance(
         self,
         symbol: str
     ) -> List[CompositeStock]:
-        return StocksWithSectorRepo(self._db_session).get_stock_historical_data(symbol)
+        return await self._run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_stock_historical_data(symbol)
+        )
     
-    @timed_lru_cache(minutes=settings.cache_time_minutes)
-    def get_stock_financials(
+    @cached(tables=['balance_sheet', 'income_statement', 'cash_flow'])
+    async def get_stock_financials(
         self,
         symbol: str
     ) -> Dict[str, Any]:
@@ -33,9 +37,13 @@ class StocksService(BaseService):
             'cash_flows': List[CashFlow]
         }
         """
-        balance_sheets = BalanceSheetRepo(self._db_session).get_balance_sheets_for_symbol(symbol)
-        income_statements = IncomeStatementRepo(self._db_session).get_income_statements_for_symbol(symbol)
-        cash_flows = CashFlowRepo(self._db_session).get_cash_flows_for_symbol(symbol)
+        return await self._run_query(self._get_stock_financials, symbol)
+
+    @staticmethod
+    def _get_stock_financials(db_session, symbol: str) -> Dict[str, Any]:
+        balance_sheets = BalanceSheetRepo(db_session).get_balance_sheets_for_symbol(symbol)
+        income_statements = IncomeStatementRepo(db_session).get_income_statements_for_symbol(symbol)
+        cash_flows = CashFlowRepo(db_session).get_cash_flows_for_symbol(symbol)
         return {
             'balance_sheets': balance_sheets,
             'income_statements': income_statements,
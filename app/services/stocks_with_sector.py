@@ -8,6 +8,7 @@ from app.domain.sector import Sector
 from app.errors.ibd import IbdScrapeError
 from app.services.ibd_scrapers.stocks_with_sector import StocksWithSectorScraper
 from app.repos.stocks_with_sector_repo import StocksWithSectorRepo
+from app.cache import cached
 from app.services.base_service import BaseService
 
 class StocksWithSectorService(BaseService):
@@ -43,26 +44,41 @@ class StocksWithSectorService(BaseService):
         )
         return stocks_with_sector
 
-    def get_sector_stocks(
+    @cached(tables=['stocks_with_sector'])
+    async def get_sector_stocks(
         self,
         sector: Sector
     ) -> Optional[List[CompositeStock]]:
-        return StocksWithSectorRepo(self._db_session).get_sector_stocks(sector)
+        return await self._run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_sector_stocks(sector)
+        )
 
-    def get_sectors_performance(
+    @cached(tables=['stocks_with_sector'])
+    async def get_sectors_performance(
         self,
         sector: Optional[Sector] = None
     ) -> List[SectorPerformance]:
-        return StocksWithSectorRepo(self._db_session).get_sectors_performance(sector)
+        return await self._run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_sectors_performance(sector)
+        )
 
-    def get_stock_historical_data(
+    @cached(tables=['stocks_with_sector'])
+    async def get_stock_historical_data(
         self,
         stock_symbol: str
     ) -> Optional[List[CompositeStock]]:
-        return StocksWithSectorRepo(self._db_session).get_stock_historical_data(stock_symbol)
+        return await self._run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_stock_historical_data(stock_symbol)
+        )
 
-    def get_eps_rating_leaders(self) -> List[CompositeStock]:
-        return StocksWithSectorRepo(self._db_session).get_eps_rating_leaders()
+    @cached(tables=['stocks_with_sector'])
+    async def get_eps_rating_leaders(self) -> List[CompositeStock]:
+        return await self._run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_eps_rating_leaders()
+        )
 
-    def get_rs_rating_leaders(self) -> List[CompositeStock]:
-        return StocksWithSectorRepo(self._db_session).get_rs_rating_leaders()
+    @cached(tables=['stocks_with_sector'])
+    async def get_rs_rating_leaders(self) -> List[CompositeStock]:
+        return await self._run_query(
+            lambda db_session: StocksWithSectorRepo(db_session).get_rs_rating_leaders()
+        )
@@ -6,6 +6,7 @@ from app.services.ibd_scrapers.tech_leaders_stocks import TechLeadersStocksScrap
 from app.repos.tech_leaders_stocks_repo import TechLeadersStocksRepo
 from app.domain.date import Date
 from app.domain.tech_leader_stock import TechLeaderStock
+from app.cache import cached
 from app.services.base_service import BaseService
 
 
@@ -53,5 +54,8 @@ class TechLeadersStocksService(BaseService):
 
         return tech_leaders_stocks
 
-    def get_latest_tech_leaders_stocks(self) -> List[TechLeaderStock]:
-        return TechLeadersStocksRepo(self._db_session).get_latest_tech_leaders_stocks()
+    @cached(tables=['tech_leaders'])
+    async def get_latest_tech_leaders_stocks(self) -> List[TechLeaderStock]:
+        return await self._run_query(
+            lambda db_session: TechLeadersStocksRepo(db_session).get_latest_tech_leaders_stocks()
+        )
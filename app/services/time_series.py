@@ -1,6 +1,6 @@
-from typing import List
+import datetime as dt
+from typing import List, Optional
 
-from app import settings
 from app.services.y_finance_scrapers.time_series import IndexTimeSeriesScraper
 from app.services.alpha_vantage_scrapers.economic_indicators import EconomicIndicatorScraper
 from app.services.alpha_vantage_scrapers.stock_time_series import StockTimeSeriesScraper
@@ -12,21 +12,27 @@ from app.domain.economic_indicator import EconomicIndicator
 from app.repos.world_indices_time_series_repo import WorldIndicesTimeSeriesRepo
 from app.repos.economic_indicators_repo import EconomicIndicatorTimeSeriesRepo
 from app.repos.stock_time_series_repo import StockTimeSeriesRepo
-from app.services.base_service import BaseService, timed_lru_cache
+from app.cache import cached
+from app.services.base_service import BaseService
 
 
 class TimeSeriesService(BaseService):
     @classmethod
-    async def _scrape_index_time_series(cls, index: WorldIndex) -> List[IndexTimeSeriesEntry]:
-        time_series = await IndexTimeSeriesScraper.scrape_index_time_series(index)
+    async def _scrape_index_time_series(
+        cls,
+        index: WorldIndex,
+        since: Optional[dt.date] = None
+    ) -> List[IndexTimeSeriesEntry]:
+        time_series = await IndexTimeSeriesScraper.scrape_index_time_series(index, since)
         return time_series
 
     @classmethod
     async def _scrape_economic_indicator_time_series(
         cls,
         indicator: EconomicIndicator,
+        since: Optional[dt.date] = None
     ) -> List[EconomicIndicatorTimeSeriesEntry]:
-        time_series = await EconomicIndicatorScraper.scrape_economic_indicator_time_series(indicator)
+        time_series = await EconomicIndicatorScraper.scrape_economic_indicator_time_series(indicator, since)
         return time_series
 
     @classmethod
@@ -38,39 +44,62 @@ class TimeSeriesService(BaseService):
         return time_series
 
     @classmethod
-    async def scrape_and_store_index_time_series(cls, index: WorldIndex):
-        index_time_series = await cls._scrape_index_time_series(index)
-        WorldIndicesTimeSeriesRepo().add_or_replace_time_series_for_index(
+    async def scrape_and_store_index_time_series(cls, index: WorldIndex, full_history: bool = False) -> int:
+        """
+        Fetches the weeks from the newest stored one on, that week is
+        fetched again since it may not have closed when it was stored.
+        full_history fetches the whole window of the provider instead.
+        """
+        repo = WorldIndicesTimeSeriesRepo()
+        since = None if full_history else repo.get_latest_date_of_index(index)
+        index_time_series = await cls._scrape_index_time_series(index, since)
+        return repo.upsert_time_series_for_index(
             index=index,
             time_series=index_time_series
         )
 
     @classmethod
-    async def scrape_and_store_economic_indicator_time_series(cls, indicator: EconomicIndicator):
-        indicator_time_series = await cls._scrape_economic_indicator_time_series(indicator)
-        EconomicIndicatorTimeSeriesRepo().add_or_replace_time_series_for_indicator(
+    async def scrape_and_store_economic_indicator_time_series(
+        cls,
+        indicator: EconomicIndicator,
+        full_history: bool = False
+    ) -> int:
+        """
+        Stores the entries from the newest stored one on, it is kept
+        in case the provider revised it. full_history stores them all.
+        """
+        repo = EconomicIndicatorTimeSeriesRepo()
+        since = None if full_history else repo.get_latest_date_of_indicator(indicator)
+        indicator_time_series = await cls._scrape_economic_indicator_time_series(indicator, since)
+        return repo.upsert_time_series_for_indicator(
             indicator=indicator,
             time_series=indicator_time_series
         )
 
     @classmethod
-    async def scrape_and_store_stock_time_series(cls, symbol: str):
+    async def scrape_and_store_stock_time_series(cls, symbol: str) -> int:
         stock_time_series = await cls._scrape_stock_time_series(symbol)
-        StockTimeSeriesRepo().add_or_replace_time_series_for_symbol(
+        return StockTimeSeriesRepo().upsert_time_series_for_symbol(
             symbol=symbol,
             time_series=stock_time_series
         )
 
-    @timed_lru_cache(minutes=settings.cache_time_minutes)
-    def get_index_time_series(self, index: WorldIndex) -> List[IndexTimeSeriesEntry]:
-        return WorldIndicesTimeSeriesRepo(self._db_session).get_index_time_series(
-            index=index
+    @cached(tables=['world_indices_time_series'])
+    async def get_index_time_series(self, index: WorldIndex) -> List[IndexTimeSeriesEntry]:
+        return await self._run_query(
+            lambda db_session: WorldIndicesTimeSeriesRepo(db_session).get_index_time_series(
+                index=index
+            )
         )
 
-    @timed_lru_cache(minutes=settings.cache_time_minutes)
-    def get_economic_indicator_time_series(self, indicator: EconomicIndicator) -> List[EconomicIndicatorTimeSeriesEntry]:
-        return EconomicIndicatorTimeSeriesRepo(self._db_session).get_indicator_time_series(indicator)
+    @cached(tables=['economic_indicator_time_series'])
+    async def get_economic_indicator_time_series(self, indicator: EconomicIndicator) -> List[EconomicIndicatorTimeSeriesEntry]:
+        return await self._run_query(
+            lambda db_session: EconomicIndicatorTimeSeriesRepo(db_session).get_indicator_time_series(indicator)
+        )
 
-    @timed_lru_cache(minutes=settings.cache_time_minutes)
-    def get_stock_time_series(self, symbol: str) -> List[StockTimeSeriesEntry]:
-        return StockTimeSeriesRepo(self._db_session).get_symbol_time_series(symbol)
+    @cached(tables=['stock_time_series'])
+    async def get_stock_time_series(self, symbol: str) -> List[StockTimeSeriesEntry]:
+        return await self._run_query(
+            lambda db_session: StockTimeSeriesRepo(db_session).get_symbol_time_series(symbol)
+        )
@@ -6,6 +6,7 @@ from app.services.ibd_scrapers.composite_stocks import CompositeStocksScraper
 from app.repos.top_composite_stocks_repo import TopCompositeStocksRepo
 from app.domain.date import Date
 from app.domain.composite_stock import CompositeStock
+from app.cache import cached
 from app.services.base_service import BaseService
 
 class TopCompositeStocksService(BaseService):
@@ -56,5 +57,8 @@ class TopCompositeStocksService(BaseService):
 
         return top_200_comp_stocks
 
-    def get_latest_top_comp_stocks(self, limit: int = 100) -> List[CompositeStock]:
-        return TopCompositeStocksRepo(self._db_session).get_latest_comp_stocks(limit=limit)
+    @cached(tables=['top_composite_stocks'])
+    async def get_latest_top_comp_stocks(self, limit: int = 100) -> List[CompositeStock]:
+        return await self._run_query(
+            lambda db_session: TopCompositeStocksRepo(db_session).get_latest_comp_stocks(limit=limit)
+        )
@@ -6,6 +6,7 @@ from app.services.ibd_scrapers.stock_leaders import StockLeadersScraper
 from app.repos.utility_leaders_repo import UtilityLeadersRepo
 from app.domain.date import Date
 from app.domain.stock_leader import StockLeader
+from app.cache import cached
 from app.services.base_service import BaseService
 
 
@@ -53,5 +54,8 @@ class UtilityLeadersService(BaseService):
 
         return utility_leaders
 
-    def get_latest_utility_leaders(self) -> List[StockLeader]:
-        return UtilityLeadersRepo(self._db_session).get_latest_stock_leaders()
+    @cached(tables=['utility_leaders'])
+    async def get_latest_utility_leaders(self) -> List[StockLeader]:
+        return await self._run_query(
+            lambda db_session: UtilityLeadersRepo(db_session).get_latest_stock_leaders()
+        )
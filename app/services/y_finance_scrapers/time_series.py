@@ -1,5 +1,5 @@
 import datetime as dt
-from typing import List
+from typing import List, Optional
 import pandas as pd
 import io
 
@@ -29,9 +29,12 @@ class IndexTimeSeriesScraper:
         )
     
     @classmethod
-    async def scrape_index_time_series(cls, index: WorldIndex) -> List[IndexTimeSeriesEntry]:
+    async def scrape_index_time_series(cls, index: WorldIndex, since: Optional[dt.date] = None) -> List[IndexTimeSeriesEntry]:
+        """
+        :since -> Only the weeks from this date on are downloaded
+        """
         yf_client = y_finance_client.YFinanceClient()
-        csv_response = await yf_client.get_world_index_time_series(index=index)
+        csv_response = await yf_client.get_world_index_time_series(index=index, since=since)
 
         try:
             time_series_df = pd.read_csv(io.StringIO(csv_response.decode()))
@@ -0,0 +1,103 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.http_caching import NotModified, conditional_response, not_modified_handler
+from app.cache import DataVersions
+from app.cache import service_cache
+from app.dependencies import create_db_conn
+from app.domain.data_version import DataVersion
+
+
+@pytest.fixture
+def versions(monkeypatch):
+    versions = {
+        'dividend_leaders': DataVersion(
+            'dividend_leaders',
+            3,
+            datetime(2023, 2, 1, 10, 30, tzinfo=timezone.utc)
+        )
+    }
+
+    async def load_versions(db_session = None):
+        return dict(versions)
+
+    monkeypatch.setattr(
+        service_cache,
+        'DATA_VERSIONS',
+        DataVersions(load_versions, refresh_seconds=0)
+    )
+    return versions
+
+
+@pytest.fixture
+def client(versions):
+    app = FastAPI()
+    app.add_exception_handler(NotModified, not_modified_handler)
+    app.dependency_overrides[create_db_conn] = lambda: None
+    app.state.calls = 0
+
+    @app.get('/dividend_leaders', dependencies=[Depends(conditional_response('dividend_leaders'))])
+    async def get_dividend_leaders():
+        app.state.calls += 1
+        return ['AAA']
+
+    return TestClient(app)
+
+
+class TestConditionalResponse:
+    def test_response_has_cache_headers(self, client):
+        # Act
+        response = client.get('/dividend_leaders')
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers['etag'].startswith('"')
+        assert response.headers['last-modified'] == 'Wed, 01 Feb 2023 10:30:00 GMT'
+        assert response.headers['cache-control'] == 'public, max-age=60'
+
+    def test_matching_etag_returns_304_without_running_endpoint(self, client):
+        # Prepare
+        etag = client.get('/dividend_leaders').headers['etag']
+
+        # Act
+        response = client.get('/dividend_leaders', headers={'If-None-Match': etag})
+
+        # Assert
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers['etag'] == etag
+        assert client.app.state.calls == 1
+
+    def test_new_data_version_changes_etag(self, client, versions):
+        # Prepare
+        etag = client.get('/dividend_leaders').headers['etag']
+        versions['dividend_leaders'] = DataVersion(
+            'dividend_leaders',
+            4,
+            datetime(2023, 2, 2, 10, 30, tzinfo=timezone.utc)
+        )
+
+        # Act
+        response = client.get('/dividend_leaders', headers={'If-None-Match': etag})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
+
+    def test_if_modified_since(self, client):
+        # Act
+        not_modified = client.get(
+            '/dividend_leaders',
+            headers={'If-Modified-Since': 'Wed, 01 Feb 2023 10:30:00 GMT'}
+        )
+        modified = client.get(
+            '/dividend_leaders',
+            headers={'If-Modified-Since': 'Tue, 31 Jan 2023 10:30:00 GMT'}
+        )
+
+        # Assert
+        assert not_modified.status_code == 304
+        assert modified.status_code == 200
@@ -0,0 +1,127 @@
+import gzip
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import response_cache
+from app.api.http_caching import NotModified, conditional_response, not_modified_handler
+from app.api.response_cache import CachedEndpoint, cached_response
+from app.cache import DataVersions, TTLCache
+from app.cache import service_cache
+from app.dependencies import create_db_conn
+from app.domain.data_version import DataVersion
+
+
+@pytest.fixture
+def versions(monkeypatch):
+    versions = {'tech_leaders': 1}
+
+    async def load_versions(db_session = None):
+        return {
+            table_name: DataVersion(table_name, version, None)
+            for table_name, version in versions.items()
+        }
+
+    monkeypatch.setattr(
+        service_cache,
+        'DATA_VERSIONS',
+        DataVersions(load_versions, refresh_seconds=0)
+    )
+    monkeypatch.setattr(response_cache, 'RESPONSE_CACHE', TTLCache())
+    return versions
+
+
+@pytest.fixture
+def client(versions):
+    app = FastAPI()
+    app.add_exception_handler(NotModified, not_modified_handler)
+    app.dependency_overrides[create_db_conn] = lambda: None
+    app.state.calls = 0
+
+    @app.get('/tech_leaders', dependencies=[Depends(conditional_response('tech_leaders'))])
+    async def get_tech_leaders(
+        cached_endpoint: CachedEndpoint = Depends(cached_response('tech_leaders'))
+    ):
+        async def build_content():
+            app.state.calls += 1
+            return [{'symbol': f'SYM{i}', 'version': versions['tech_leaders']} for i in range(100)]
+
+        return await cached_endpoint.respond(build_content)
+
+    return TestClient(app)
+
+
+class TestResponseCache:
+    def test_body_is_built_once_per_data_version(self, client, versions):
+        # Act
+        first = client.get('/tech_leaders')
+        second = client.get('/tech_leaders')
+        versions['tech_leaders'] = 2
+        third = client.get('/tech_leaders')
+
+        # Assert
+        assert first.content == second.content
+        assert first.json()[0] == {'symbol': 'SYM0', 'version': 1}
+        assert third.json()[0] == {'symbol': 'SYM0', 'version': 2}
+        assert client.app.state.calls == 2
+
+    def test_conditional_headers_are_kept(self, client):
+        # Act
+        response = client.get('/tech_leaders')
+
+        # Assert
+        assert response.headers['content-type'] == 'application/json'
+        assert response.headers['etag']
+        assert response.headers['vary'] == 'Accept-Encoding'
+
+    def test_gzip_body_is_served_when_accepted(self, client):
+        # Act
+        response = client.get('/tech_leaders', headers={'Accept-Encoding': 'gzip'})
+        raw_response = client.get('/tech_leaders', headers={'Accept-Encoding': 'identity'})
+
+        # Assert
+        assert response.headers['content-encoding'] == 'gzip'
+        assert 'content-encoding' not in raw_response.headers
+        assert response.json() == raw_response.json()
+        assert len(gzip.compress(raw_response.content)) < len(raw_response.content)
+
+    def test_each_encoding_has_its_own_etag(self, client):
+        # Prepare
+        response = client.get('/tech_leaders', headers={'Accept-Encoding': 'gzip'})
+        raw_response = client.get('/tech_leaders', headers={'Accept-Encoding': 'identity'})
+
+        # Act
+        gzip_revalidation = client.get(
+            '/tech_leaders',
+            headers={'Accept-Encoding': 'gzip', 'If-None-Match': response.headers['etag']}
+        )
+        raw_revalidation = client.get(
+            '/tech_leaders',
+            headers={'Accept-Encoding': 'identity', 'If-None-Match': raw_response.headers['etag']}
+        )
+
+        # Assert
+        assert response.headers['etag'] == raw_response.headers['etag'][:-1] + '-gzip"'
+        assert gzip_revalidation.status_code == 304
+        assert gzip_revalidation.headers['etag'] == response.headers['etag']
+        assert raw_revalidation.status_code == 304
+        assert raw_revalidation.headers['etag'] == raw_response.headers['etag']
+        assert client.app.state.calls == 1
+
+    @pytest.mark.parametrize('accept_encoding, gzipped', [
+        ('gzip, deflate, br', True),
+        ('br;q=1.0, GZIP;q=0.5', True),
+        ('*', True),
+        ('gzip;q=0', False),
+        ('gzip;q=0.000, *;q=1', False),
+        ('x-gzip', False),
+        ('identity', False),
+        ('*;q=0', False),
+    ])
+    def test_gzip_body_follows_the_q_values(self, client, accept_encoding, gzipped):
+        # Act
+        response = client.get('/tech_leaders', headers={'Accept-Encoding': accept_encoding})
+
+        # Assert
+        assert (response.headers.get('content-encoding') == 'gzip') == gzipped
@@ -0,0 +1,238 @@
+import asyncio
+
+import pytest
+
+from app.cache import CacheBackend, DataVersions, InMemoryCacheBackend, TTLCache, cached
+from app.cache import service_cache
+from app.domain.data_version import DataVersion
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_entries_expire_individually(self):
+        # Prepare
+        clock = FakeClock()
+        cache = TTLCache(maxsize=10, clock=clock)
+        cache.set('a', 1, ttl_seconds=10)
+        cache.set('b', 2, ttl_seconds=60)
+
+        # Act
+        clock.now = 30
+
+        # Assert
+        assert cache.lookup('a') == (False, None)
+        assert cache.lookup('b') == (True, 2)
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.expirations == 1
+
+    def test_least_recently_used_entry_is_evicted(self):
+        # Prepare
+        cache = TTLCache(maxsize=2)
+        cache.set('a', 1, ttl_seconds=60)
+        cache.set('b', 2, ttl_seconds=60)
+        cache.lookup('a')
+
+        # Act
+        cache.set('c', 3, ttl_seconds=60)
+
+        # Assert
+        assert cache.lookup('b') == (False, None)
+        assert cache.lookup('a') == (True, 1)
+        assert cache.lookup('c') == (True, 3)
+        assert cache.stats().evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_are_computed_once(self):
+        # Prepare
+        cache = TTLCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return 'value'
+
+        # Act
+        results = await asyncio.gather(*[
+            cache.get_or_compute('key', compute, ttl_seconds=60)
+            for _ in range(10)
+        ])
+
+        # Assert
+        assert results == ['value'] * 10
+        assert len(calls) == 1
+        assert cache.stats().coalesced == 9
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        # Prepare
+        cache = TTLCache()
+
+        async def fail():
+            raise ValueError()
+
+        async def succeed():
+            return 'value'
+
+        # Act
+        with pytest.raises(ValueError):
+            await cache.get_or_compute('key', fail, ttl_seconds=60)
+        result = await cache.get_or_compute('key', succeed, ttl_seconds=60)
+
+        # Assert
+        assert result == 'value'
+
+    @pytest.mark.asyncio
+    async def test_waiters_compute_when_the_first_caller_is_cancelled(self):
+        # Prepare
+        cache = TTLCache()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 'value'
+
+        first = asyncio.ensure_future(cache.get_or_compute('key', compute, ttl_seconds=60))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.ensure_future(cache.get_or_compute('key', compute, ttl_seconds=60))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        # Act
+        first.cancel()
+        results = await asyncio.gather(*waiters)
+
+        # Assert
+        assert first.cancelled()
+        assert results == ['value'] * 3
+        assert len(calls) == 2
+        assert cache.lookup('key') == (True, 'value')
+
+
+class TestCachedDecorator:
+    @pytest.mark.asyncio
+    async def test_cache_is_shared_between_instances(self, monkeypatch):
+        # Prepare
+        monkeypatch.setattr(service_cache, 'SERVICE_CACHE', TTLCache())
+        calls = []
+
+        class Service:
+            @cached(minutes=1)
+            async def get_value(self, value):
+                calls.append(value)
+                return value * 2
+
+        # Act
+        results = [
+            await Service().get_value(1),
+            await Service().get_value(1),
+            await Service().get_value(value=2)
+        ]
+
+        # Assert
+        assert results == [2, 2, 4]
+        assert calls == [1, 2]
+        assert service_cache.get_service_cache().stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_entries_are_replaced_when_table_version_changes(self, monkeypatch):
+        # Prepare
+        versions = {'dividend_leaders': 1}
+
+        async def load_versions(db_session = None):
+            return {
+                table_name: DataVersion(table_name, version, None)
+                for table_name, version in versions.items()
+            }
+
+        monkeypatch.setattr(service_cache, 'SERVICE_CACHE', TTLCache())
+        monkeypatch.setattr(
+            service_cache,
+            'DATA_VERSIONS',
+            DataVersions(load_versions, refresh_seconds=0)
+        )
+        calls = []
+
+        class Service:
+            @cached(tables=['dividend_leaders'])
+            async def get_leaders(self):
+                calls.append(1)
+                return len(calls)
+
+        # Act
+        first = await Service().get_leaders()
+        cached_result = await Service().get_leaders()
+        versions['dividend_leaders'] = 2
+        after_bump = await Service().get_leaders()
+
+        # Assert
+        assert (first, cached_result, after_bump) == (1, 1, 2)
+        assert len(calls) == 2
+
+
+class FailingCacheBackend(CacheBackend):
+    async def _get(self, key):
+        raise ConnectionError()
+
+    async def _set(self, key, value, ttl_seconds):
+        raise ConnectionError()
+
+
+class TestCacheBackend:
+    @pytest.mark.asyncio
+    async def test_workers_fill_from_shared_backend(self, monkeypatch):
+        # Prepare
+        backend = InMemoryCacheBackend()
+        monkeypatch.setattr(service_cache, 'CACHE_BACKEND', backend)
+        calls = []
+
+        class Service:
+            @cached(minutes=1)
+            async def get_value(self, value):
+                calls.append(value)
+                return {'value': value}
+
+        monkeypatch.setattr(service_cache, 'SERVICE_CACHE', TTLCache())
+        first_worker_result = await Service().get_value(1)
+
+        # Act
+        # A second worker has its own empty process cache
+        monkeypatch.setattr(service_cache, 'SERVICE_CACHE', TTLCache())
+        second_worker_result = await Service().get_value(1)
+
+        # Assert
+        assert first_worker_result == second_worker_result == {'value': 1}
+        assert calls == [1]
+        assert backend.misses == 1
+        assert backend.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_backend_errors_are_treated_as_misses(self, monkeypatch):
+        # Prepare
+        backend = FailingCacheBackend()
+        monkeypatch.setattr(service_cache, 'CACHE_BACKEND', backend)
+        monkeypatch.setattr(service_cache, 'SERVICE_CACHE', TTLCache())
+
+        class Service:
+            @cached(minutes=1)
+            async def get_value(self, value):
+                return value * 2
+
+        # Act
+        result = await Service().get_value(1)
+
+        # Assert
+        assert result == 2
+        assert backend.errors == 2
@@ -0,0 +1,50 @@
+import sqlite3
+
+import pytest
+
+from app.database.connection_pool import SerializedConnection
+from app.database.migrate import apply_migrations
+
+
+def _create_db_conn(database: str, migrate: bool = True, **kwargs) -> sqlite3.Connection:
+    conn = sqlite3.connect(database, **kwargs)
+    with open('app/database/schema.sql', mode='r') as f:
+        conn.executescript(f.read())
+    if migrate:
+        apply_migrations(conn)
+    return conn
+
+
+@pytest.fixture
+def schema_db_conn():
+    """
+    In memory database with the base schema only
+    """
+    conn = _create_db_conn(':memory:', migrate=False)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def db_conn():
+    """
+    In memory database with the schema and every migration applied
+    """
+    conn = _create_db_conn(':memory:')
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def serialized_db_conn(tmp_path):
+    """
+    File database behind a SerializedConnection, like the writer
+    connection, for the code that uses it from worker threads
+    """
+    conn = _create_db_conn(
+        str(tmp_path / 'test.db'),
+        factory=SerializedConnection,
+        check_same_thread=False
+    )
+    yield conn
+    conn.close()
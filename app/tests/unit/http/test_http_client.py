@@ -0,0 +1,78 @@
+import httpx
+import pytest
+import pytest_asyncio
+from pytest_httpx import HTTPXMock
+
+from app.http.http_client import HttpClient
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_clients():
+    yield
+    await HttpClient.close_all()
+
+
+class TestHttpClient:
+    @pytest.mark.asyncio
+    async def test_instances_share_the_client_of_a_base_url(self, httpx_mock: HTTPXMock):
+        # Prepare
+        httpx_mock.add_response(url='https://example.com/a', text='a')
+        httpx_mock.add_response(url='https://example.com/b', text='b')
+        first_client = HttpClient('https://example.com')
+        second_client = HttpClient('https://example.com')
+        other_client = HttpClient('https://other.example.com')
+
+        # Act
+        first_response = await first_client.get('/a')
+        second_response = await second_client.get('/b')
+
+        # Assert
+        assert first_response.text == 'a'
+        assert second_response.text == 'b'
+        assert first_client._get_client() is second_client._get_client()
+        assert first_client._get_client() is not other_client._get_client()
+
+    @pytest.mark.asyncio
+    async def test_instances_with_other_limits_get_their_own_client(self):
+        # Prepare
+        default_client = HttpClient('https://example.com')
+        small_client = HttpClient('https://example.com', limits=httpx.Limits(max_connections=2))
+
+        # Act
+        pooled_client = default_client._get_client()
+        small_pooled_client = small_client._get_client()
+
+        # Assert
+        assert pooled_client is not small_pooled_client
+        assert HttpClient('https://example.com')._get_client() is pooled_client
+
+    @pytest.mark.asyncio
+    async def test_closing_an_instance_keeps_the_shared_client_open(self, httpx_mock: HTTPXMock):
+        # Prepare
+        httpx_mock.add_response(url='https://example.com/a', text='a')
+        other_client = HttpClient('https://example.com')
+        async with HttpClient('https://example.com') as client:
+            pooled_client = client._get_client()
+
+        # Act
+        response = await other_client.get('/a')
+
+        # Assert
+        assert not pooled_client.is_closed
+        assert other_client._get_client() is pooled_client
+        assert response.text == 'a'
+
+    @pytest.mark.asyncio
+    async def test_close_all(self):
+        # Prepare
+        pooled_clients = [
+            HttpClient('https://example.com')._get_client(),
+            HttpClient('https://other.example.com')._get_client()
+        ]
+
+        # Act
+        await HttpClient.close_all()
+
+        # Assert
+        assert all(pooled_client.is_closed for pooled_client in pooled_clients)
+        assert HttpClient._clients == {}
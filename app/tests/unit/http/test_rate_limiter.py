@@ -0,0 +1,128 @@
+import asyncio
+import heapq
+import itertools
+from typing import List
+
+import pytest
+
+from app.http.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """
+    Virtual time for the rate limiter. sleep() parks the caller until
+    run() advances the clock to its wake up time, so concurrent callers
+    are tested without waiting for real time to pass.
+    """
+    def __init__(self) -> None:
+        self.now = 0.0
+        self._sleepers = []
+        self._sequence = itertools.count()
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self.now + delay, next(self._sequence), future))
+        await future
+
+    async def run(self, *awaitables) -> List:
+        tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+        while not all(task.done() for task in tasks):
+            # Let every runnable task reach its next sleep before moving time
+            for _ in range(5):
+                await asyncio.sleep(0)
+            if self._sleepers:
+                wake_at, _, future = heapq.heappop(self._sleepers)
+                self.now = max(self.now, wake_at)
+                # The sleeper may have been cancelled
+                if not future.done():
+                    future.set_result(None)
+
+        return [task.result() for task in tasks]
+
+
+async def _acquire(bucket: TokenBucket, clock: FakeClock) -> float:
+    await bucket.acquire()
+    return clock()
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_then_refill_rate(self):
+        # Prepare
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+        # Act
+        acquired_at = await clock.run(*[_acquire(bucket, clock) for _ in range(7)])
+
+        # Assert
+        assert acquired_at == [0, 0, 0, 0.5, 1.0, 1.5, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_tokens_refill_while_idle(self):
+        # Prepare
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=2, clock=clock, sleep=clock.sleep)
+        await clock.run(_acquire(bucket, clock), _acquire(bucket, clock))
+        assert bucket.available_tokens == 0
+
+        # Act
+        clock.now += 1.5
+        tokens_after_1_5_seconds = bucket.available_tokens
+        clock.now += 10
+
+        # Assert
+        assert tokens_after_1_5_seconds == 1.5
+        assert bucket.available_tokens == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_break_the_rate(self):
+        # Prepare
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+        await bucket.acquire()
+        waiters = [asyncio.create_task(_acquire(bucket, clock)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        # Act
+        waiters[0].cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiters[0]
+        acquired_at = [0.0] + await clock.run(
+            *waiters[1:],
+            _acquire(bucket, clock)
+        )
+
+        # Assert
+        requests_per_window = [
+            len([t for t in acquired_at if start <= t <= start + 1])
+            for start in acquired_at
+        ]
+        # burst + rate * 1 second
+        assert max(requests_per_window) <= 2
+        assert acquired_at == [0, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_per_minute_never_exceeds_the_limit(self):
+        # Prepare
+        clock = FakeClock()
+        bucket = TokenBucket.per_minute(requests=70, burst=5, clock=clock, sleep=clock.sleep)
+
+        # Act
+        acquired_at = await clock.run(*[_acquire(bucket, clock) for _ in range(300)])
+
+        # Assert
+        requests_per_window = [
+            len([t for t in acquired_at if start <= t <= start + 60])
+            for start in acquired_at
+        ]
+        assert max(requests_per_window) <= 70
+        # The quota is used without gaps: (300 - burst) requests at the refill rate
+        assert acquired_at[-1] == pytest.approx(295 * 60 / 65)
+
+    def test_per_minute_needs_requests_above_burst(self):
+        with pytest.raises(ValueError):
+            TokenBucket.per_minute(requests=5, burst=5)
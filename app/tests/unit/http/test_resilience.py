@@ -0,0 +1,168 @@
+import datetime as dt
+
+import httpx
+import pytest
+import pytest_asyncio
+from pytest_httpx import HTTPXMock
+
+from app import settings
+from app.errors.http import CircuitOpenError, HttpRequestError
+from app.http.alpha_vantage_client import AlphaVantageClient
+from app.http.http_client import HttpClient
+from app.http.resilience import CircuitBreaker, RetryPolicy
+from app.http.response_store import ResponseStore
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_clients(monkeypatch):
+    # No waiting between the attempts
+    monkeypatch.setattr(HttpClient, 'get_retry_policy', classmethod(lambda cls: RetryPolicy(backoff_base_seconds=0)))
+    monkeypatch.setattr(AlphaVantageClient, 'get_retry_policy', classmethod(lambda cls: RetryPolicy(backoff_base_seconds=0)))
+    monkeypatch.setattr(AlphaVantageClient, '_rate_limiter', None)
+    HttpClient.reset_stats()
+    yield
+    HttpClient.reset_stats()
+    await HttpClient.close_all()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRetries:
+    @pytest.mark.asyncio
+    async def test_retries_a_retryable_status(self, httpx_mock: HTTPXMock):
+        # Prepare
+        httpx_mock.add_response(url='https://example.com/page', status_code=503, headers={'Retry-After': '0'})
+        httpx_mock.add_response(url='https://example.com/page', text='ok')
+
+        # Act
+        response = await HttpClient('https://example.com').get('/page')
+
+        # Assert
+        assert response.text == 'ok'
+        stats = HttpClient.get_stats()['https://example.com']
+        assert stats.requests == 2
+        assert stats.retries == 1
+        assert stats.failed == 0
+        assert stats.statuses == {503: 1, 200: 1}
+
+    @pytest.mark.asyncio
+    async def test_raises_once_the_attempts_are_exhausted(self, httpx_mock: HTTPXMock):
+        # Prepare
+        httpx_mock.add_exception(httpx.ConnectError('Connection refused'))
+
+        # Act
+        with pytest.raises(HttpRequestError):
+            await HttpClient('https://example.com').get('/page')
+
+        # Assert
+        assert len(httpx_mock.get_requests()) == 3
+        stats = HttpClient.get_stats()['https://example.com']
+        assert stats.retries == 2
+        assert stats.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_alpha_vantage_retries_a_throttled_call(self, httpx_mock: HTTPXMock):
+        # Prepare
+        throttled = {'Note': 'Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute'}
+        httpx_mock.add_response(json=throttled)
+        httpx_mock.add_response(json={'Symbol': 'AAPL'})
+
+        # Act
+        overview = await AlphaVantageClient().get_company_overview('AAPL')
+
+        # Assert
+        assert overview == {'Symbol': 'AAPL'}
+        assert HttpClient.get_stats()['alpha_vantage'].retries == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_throttled_call_is_not_recorded(self, httpx_mock: HTTPXMock, tmp_path):
+        # Prepare
+        throttled = {'Note': 'Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per minute'}
+        httpx_mock.add_response(json=throttled)
+        store = ResponseStore(str(tmp_path))
+        HttpClient.use_response_store(store)
+
+        # Act
+        try:
+            overview = await AlphaVantageClient().get_company_overview('AAPL')
+        finally:
+            HttpClient.use_response_store(None)
+
+        # Assert
+        assert overview == throttled
+        assert len(httpx_mock.get_requests()) == 3
+        assert store.load('alpha_vantage', 'GET', '', {'function': 'OVERVIEW', 'symbol': 'AAPL'}) is None
+
+
+class TestCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_fails_fast_while_the_host_is_down(self, httpx_mock: HTTPXMock, monkeypatch):
+        # Prepare
+        monkeypatch.setattr(settings, 'http_circuit_failure_threshold', 3)
+        httpx_mock.add_response(url='https://example.com/page', status_code=500)
+
+        # Act
+        response = await HttpClient('https://example.com').get('/page')
+        with pytest.raises(CircuitOpenError):
+            await HttpClient('https://example.com').get('/page')
+
+        # Assert
+        assert response.status_code == 500
+        assert len(httpx_mock.get_requests()) == 3
+        assert HttpClient.get_stats()['https://example.com'].short_circuited == 1
+
+    def test_half_open_after_the_reset_timeout(self):
+        # Prepare
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=30, clock=clock)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        # Act
+        allowed_while_open = breaker.allow_request()
+        clock.now = 30
+        allowed_after_timeout = breaker.allow_request()
+        allowed_during_trial = breaker.allow_request()
+        breaker.record_failure()
+        reopened_state = breaker.state
+        clock.now = 60
+        breaker.allow_request()
+        breaker.record_success()
+
+        # Assert
+        assert allowed_while_open is False
+        assert allowed_after_timeout is True
+        assert allowed_during_trial is False
+        assert reopened_state == CircuitBreaker.OPEN
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestRetryPolicy:
+    def test_retry_after_header(self):
+        # Prepare
+        now = dt.datetime(2023, 1, 2, 10, 0, 0, tzinfo=dt.timezone.utc)
+        in_seconds = httpx.Response(429, headers={'Retry-After': '12'})
+        as_date = httpx.Response(503, headers={'Retry-After': 'Mon, 02 Jan 2023 10:01:30 GMT'})
+        invalid = httpx.Response(503, headers={'Retry-After': 'soon'})
+
+        # Act
+        delays = [RetryPolicy.retry_after_seconds(response, now=now) for response in (in_seconds, as_date, invalid)]
+
+        # Assert
+        assert delays == [12.0, 90.0, None]
+
+    def test_backoff_is_capped(self):
+        # Prepare
+        policy = RetryPolicy(backoff_base_seconds=1, backoff_max_seconds=5)
+
+        # Act
+        upper_bounds = [policy.backoff_seconds(attempt, uniform=lambda low, high: high) for attempt in (1, 2, 3, 4)]
+
+        # Assert
+        assert upper_bounds == [1, 2, 4, 5]
@@ -0,0 +1,87 @@
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+from pytest_httpx import HTTPXMock
+
+from app.errors.http import HttpRequestError
+from app.http.alpha_vantage_client import AlphaVantageClient
+from app.http.http_client import HttpClient
+from app.http.response_store import ResponseStore
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_clients():
+    yield
+    HttpClient.use_response_store(None)
+    await HttpClient.close_all()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 1
+        return self.now
+
+
+def _stored_bodies(path: str):
+    return [
+        name for _, _, names in os.walk(os.path.join(path, 'objects')) for name in names
+    ]
+
+
+class TestResponseStore:
+    @pytest.mark.asyncio
+    async def test_replays_the_recorded_responses(self, httpx_mock: HTTPXMock, tmp_path):
+        # Prepare
+        httpx_mock.add_response(url='https://example.com/page', text='<table>v1</table>')
+        recorder = ResponseStore(str(tmp_path), clock=FakeClock())
+        HttpClient.use_response_store(recorder)
+        await HttpClient('https://example.com').get('/page')
+        recorder.close()
+
+        # Act
+        HttpClient.use_response_store(ResponseStore(str(tmp_path), mode=ResponseStore.REPLAY))
+        response = await HttpClient('https://example.com').get('/page')
+
+        # Assert
+        assert response.status_code == 200
+        assert response.text == '<table>v1</table>'
+        # The replay didn't call the host
+        assert len(httpx_mock.get_requests()) == 1
+        with pytest.raises(HttpRequestError):
+            await HttpClient('https://example.com').get('/other-page')
+
+    def test_same_body_is_stored_once_and_latest_wins(self, tmp_path):
+        # Prepare
+        store = ResponseStore(str(tmp_path), clock=FakeClock())
+
+        # Act
+        for body in (b'v1', b'v1', b'v2'):
+            store.save('ibd', 'GET', '/page', None, httpx.Response(200, content=body))
+
+        # Assert
+        assert len(_stored_bodies(str(tmp_path))) == 2
+        assert store.load('ibd', 'GET', '/page', None).content == b'v2'
+        assert store.load('ibd', 'GET', '/page', None, fetched_before=2).content == b'v1'
+        assert store.load('ibd', 'GET', '/other-page', None) is None
+
+    @pytest.mark.asyncio
+    async def test_api_key_is_not_stored(self, httpx_mock: HTTPXMock, tmp_path):
+        # Prepare
+        httpx_mock.add_response(json={'symbol': 'IBM'})
+        store = ResponseStore(str(tmp_path))
+        HttpClient.use_response_store(store)
+
+        # Act
+        await AlphaVantageClient().get_company_overview('IBM')
+
+        # Assert
+        assert store.load(
+            'alpha_vantage', 'GET', '', {'function': 'OVERVIEW', 'symbol': 'IBM'}
+        ).json() == {'symbol': 'IBM'}
+        rows = store._index.execute("SELECT params FROM responses").fetchall()
+        assert all('apikey' not in params for params, in rows)
@@ -0,0 +1,136 @@
+import logging
+import sqlite3
+import threading
+
+import pytest
+
+from app import dependencies
+from app.database.connection_pool import ConnectionPool
+from app.errors.database import ConnectionPoolTimeoutError
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'test.db'), size=2, timeout=1)
+    with pool.writer as con:
+        con.execute("CREATE TABLE prices (symbol TEXT, price REAL)")
+    yield pool
+    pool.close()
+
+
+class TestConnectionPool:
+    def test_database_is_in_wal_mode(self, pool):
+        journal_mode = pool.writer.execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == 'wal'
+
+    def test_read_connections_are_query_only(self, pool):
+        with pool.connection() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO prices VALUES('AAA', 1.0)")
+
+    def test_connections_are_reused(self, pool):
+        # Prepare
+        with pool.connection() as conn:
+            first_conn = conn
+
+        # Act
+        with pool.connection() as conn:
+            second_conn = conn
+
+        # Assert
+        assert first_conn is second_conn
+        stats = pool.stats()
+        assert stats.open_connections == 1
+        assert stats.idle_connections == 1
+        assert stats.acquired_count == 2
+
+    def test_acquire_times_out_when_pool_is_exhausted(self, pool):
+        # Prepare
+        pool.acquire()
+        pool.acquire()
+
+        # Act
+        with pytest.raises(ConnectionPoolTimeoutError):
+            pool.acquire(timeout=0.05)
+
+        # Assert
+        stats = pool.stats()
+        assert stats.in_use_connections == 2
+        assert stats.max_wait_seconds >= 0.05
+
+    def test_waiting_acquire_gets_released_connection(self, pool):
+        # Prepare
+        first_conn = pool.acquire()
+        pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=(first_conn, ))
+        timer.start()
+
+        # Act
+        conn = pool.acquire(timeout=1)
+
+        # Assert
+        assert conn is first_conn
+        assert pool.stats().wait_count == 1
+
+    def test_readers_are_not_blocked_by_writer(self, pool):
+        # Prepare
+        with pool.writer as con:
+            con.execute("INSERT INTO prices VALUES('AAA', 1.0)")
+
+        # Act
+        with pool.writer as con:
+            con.execute("INSERT INTO prices VALUES('BBB', 2.0)")
+            with pool.connection() as reader:
+                rows = reader.execute("SELECT symbol FROM prices").fetchall()
+
+        # Assert
+        assert rows == [('AAA', )]
+
+    def test_nested_writer_transactions_commit_once(self, pool):
+        # Act
+        with pytest.raises(ValueError):
+            with pool.writer as con:
+                con.execute("INSERT INTO prices VALUES('AAA', 1.0)")
+                with pool.writer as inner_con:
+                    inner_con.execute("INSERT INTO prices VALUES('BBB', 2.0)")
+                raise ValueError()
+
+        # Assert
+        with pool.connection() as reader:
+            rows = reader.execute("SELECT symbol FROM prices").fetchall()
+        assert rows == []
+        assert pool.stats().writer_acquired_count == 2
+
+    def test_writer_reads_wait_for_the_open_transaction(self, pool):
+        # Prepare
+        rows = []
+        reader = threading.Thread(
+            target=lambda: rows.extend(pool.writer.execute("SELECT symbol FROM prices").fetchall())
+        )
+
+        # Act
+        with pool.writer as con:
+            con.execute("INSERT INTO prices VALUES('AAA', 1.0)")
+            reader.start()
+            reader.join(timeout=0.1)
+            read_during_transaction = reader.is_alive()
+            con.execute("UPDATE prices SET symbol='BBB'")
+        reader.join(timeout=1)
+
+        # Assert
+        assert read_during_transaction
+        assert rows == [('BBB', )]
+
+    def test_stats_are_logged_when_the_pool_is_closed(self, pool, monkeypatch, caplog):
+        # Prepare
+        monkeypatch.setattr(dependencies, 'CONNECTION_POOL', pool)
+        with pool.connection():
+            pass
+
+        # Act
+        with caplog.at_level(logging.INFO):
+            dependencies.close_db_conn()
+
+        # Assert
+        assert dependencies.CONNECTION_POOL is None
+        assert 'Connection pool: 0/1 connections in use (size 2), 1 acquired' in caplog.text
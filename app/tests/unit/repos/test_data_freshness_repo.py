@@ -0,0 +1,85 @@
+import datetime as dt
+import sqlite3
+
+from app.database.migrate import apply_migrations
+from app.domain.earnings import Earnings
+from app.repos.data_freshness_repo import DataFreshnessRepo
+from app.repos.earnings_repo import EarningsRepo
+from app.scripts.data_freshness import is_fresh
+
+
+def _earnings(symbol: str, fiscal_date_ending: str) -> Earnings:
+    return Earnings(
+        symbol=symbol,
+        fiscal_date_ending=fiscal_date_ending,
+        reported_date=None,
+        reported_eps=1.5,
+        estimated_eps=1.4,
+        surprise=0.1,
+        surprise_percentage=7.1
+    )
+
+
+class TestDataFreshnessRepo:
+    def test_writes_keep_the_latest_date(self, db_conn):
+        # Prepare
+        repo = EarningsRepo(db_conn)
+
+        # Act
+        repo.add_earnings(_earnings('AAA', '2023-06-30'))
+        repo.add_earnings(_earnings('AAA', '2023-03-31'))
+        repo.add_earnings(_earnings('BBB', '2022-12-31'))
+
+        # Assert
+        freshness_repo = DataFreshnessRepo(db_conn)
+        assert freshness_repo.get_latest_date('earnings', 'AAA') == dt.date(2023, 6, 30)
+        assert freshness_repo.get_latest_date('balance_sheet', 'AAA') is None
+        assert freshness_repo.get_all_latest_dates() == {
+            'earnings': {
+                'AAA': dt.date(2023, 6, 30),
+                'BBB': dt.date(2022, 12, 31)
+            }
+        }
+
+    def test_delete_clears_the_symbol(self, db_conn):
+        # Prepare
+        repo = EarningsRepo(db_conn)
+        repo.add_earnings(_earnings('AAA', '2023-06-30'))
+        repo.add_earnings(_earnings('BBB', '2023-06-30'))
+
+        # Act
+        repo.delete_earnings_of_symbol('AAA')
+
+        # Assert
+        assert DataFreshnessRepo(db_conn).get_latest_dates('earnings') == {'BBB': dt.date(2023, 6, 30)}
+
+    def test_migration_backfills_existing_rows(self):
+        # Prepare
+        conn = sqlite3.connect(':memory:')
+        with open('app/database/schema.sql', mode='r') as f:
+            conn.executescript(f.read())
+        conn.executemany(
+            "INSERT INTO earnings VALUES (?, ?, NULL, NULL, NULL, NULL, NULL)",
+            [('AAA', '2023-03-31'), ('AAA', '2023-06-30')]
+        )
+        conn.commit()
+
+        # Act
+        apply_migrations(conn)
+
+        # Assert
+        assert DataFreshnessRepo(conn).get_latest_date('earnings', 'AAA') == dt.date(2023, 6, 30)
+        conn.close()
+
+
+class TestIsFresh:
+    def test_statements_are_fresh_for_three_months(self):
+        today = dt.date(2024, 7, 15)
+        assert is_fresh('balance_sheet', dt.date(2024, 4, 30), today) is True
+        assert is_fresh('balance_sheet', dt.date(2024, 3, 31), today) is False
+        assert is_fresh('balance_sheet', None, today) is False
+
+    def test_time_series_are_fresh_for_a_week(self):
+        today = dt.date(2024, 7, 15)
+        assert is_fresh('stock_time_series', dt.date(2024, 7, 12), today) is True
+        assert is_fresh('stock_time_series', dt.date(2024, 7, 8), today) is False
@@ -0,0 +1,32 @@
+from app.domain.comp_rating import CompRating
+from app.domain.date import Date
+from app.domain.price import Price
+from app.domain.percentage import Percentage
+from app.domain.stock_leader import StockLeader
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.dividend_leaders_repo import DividendLeadersRepo
+
+
+class TestDataVersionsRepo:
+    def test_writes_bump_table_version(self, db_conn):
+        # Prepare
+        repo = DividendLeadersRepo(db_conn)
+        stock_leader = StockLeader(
+            name='Company AAA',
+            symbol='AAA',
+            closing_price=Price(10.5),
+            comp_rating=CompRating(90),
+            yield_pct=Percentage(2.5),
+            dividend_growth_pct=Percentage(10)
+        )
+
+        # Act
+        repo.add_stock_leaders_for_date(Date(1, 2, 2023), [stock_leader])
+        repo.add_stock_leaders_for_date(Date(2, 2, 2023), [stock_leader])
+
+        # Assert
+        data_versions_repo = DataVersionsRepo(db_conn)
+        assert data_versions_repo.get_version('dividend_leaders') == 2
+        assert data_versions_repo.get_version('reit_leaders') == 0
+        assert data_versions_repo.get_versions() == {'dividend_leaders': 2}
+
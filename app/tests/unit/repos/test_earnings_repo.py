@@ -0,0 +1,58 @@
+import datetime as dt
+
+import pytest
+
+from app.domain.earnings import Earnings
+from app.repos.data_freshness_repo import DataFreshnessRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.earnings_repo import EarningsRepo
+
+
+def _earnings(symbol: str, fiscal_date_ending: str) -> Earnings:
+    return Earnings(
+        symbol=symbol,
+        fiscal_date_ending=fiscal_date_ending,
+        reported_date=None,
+        reported_eps=1.5,
+        estimated_eps=1.4,
+        surprise=0.1,
+        surprise_percentage=7.1
+    )
+
+
+class TestEarningsRepo:
+    def test_replace_earnings_of_symbol(self, db_conn):
+        # Prepare
+        repo = EarningsRepo(db_conn)
+        repo.replace_earnings_of_symbol('AAA', [_earnings('AAA', '2022-12-31')])
+        repo.replace_earnings_of_symbol('BBB', [_earnings('BBB', '2022-12-31')])
+
+        # Act
+        repo.replace_earnings_of_symbol(
+            'AAA',
+            [_earnings('AAA', '2023-03-31'), _earnings('AAA', '2023-06-30')]
+        )
+
+        # Assert
+        earnings = repo.get_earnings_for_symbol('AAA')
+        assert sorted(e.fiscal_date_ending for e in earnings) == ['2023-03-31', '2023-06-30']
+        assert len(repo.get_earnings_for_symbol('BBB')) == 1
+        assert DataVersionsRepo(db_conn).get_version('earnings') == 3
+        assert DataFreshnessRepo(db_conn).get_latest_date('earnings', 'AAA') == dt.date(2023, 6, 30)
+
+    def test_failed_replace_keeps_the_old_earnings(self, db_conn):
+        # Prepare
+        repo = EarningsRepo(db_conn)
+        repo.replace_earnings_of_symbol('AAA', [_earnings('AAA', '2022-12-31')])
+
+        # Act
+        with pytest.raises(ValueError):
+            repo.replace_earnings_of_symbol(
+                'AAA',
+                [_earnings('AAA', '2023-03-31'), _earnings('AAA', 'not a date')]
+            )
+
+        # Assert
+        earnings = repo.get_earnings_for_symbol('AAA')
+        assert [e.fiscal_date_ending for e in earnings] == ['2022-12-31']
+        assert DataVersionsRepo(db_conn).get_version('earnings') == 1
@@ -0,0 +1,35 @@
+import datetime as dt
+from dataclasses import fields
+
+from app.domain.income_statement import IncomeStatement
+from app.repos.data_freshness_repo import DataFreshnessRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.income_statement_repo import IncomeStatementRepo
+
+
+def _income_statement(symbol: str, fiscal_date_ending: str) -> IncomeStatement:
+    amounts = {
+        field.name: 1000.0 for field in fields(IncomeStatement)
+        if field.name not in ('symbol', 'fiscal_date_ending', 'reported_currency')
+    }
+    return IncomeStatement(
+        symbol=symbol,
+        fiscal_date_ending=fiscal_date_ending,
+        reported_currency='USD',
+        **amounts
+    )
+
+
+class TestIncomeStatementRepo:
+    def test_add_income_statement(self, db_conn):
+        # Prepare
+        repo = IncomeStatementRepo(db_conn)
+
+        # Act
+        repo.add_income_statement(_income_statement('AAA', '2023-03-31'))
+
+        # Assert
+        income_statements = repo.get_income_statements_for_symbol('AAA')
+        assert [i.fiscal_date_ending for i in income_statements] == ['2023-03-31']
+        assert DataVersionsRepo(db_conn).get_version('income_statement') == 1
+        assert DataFreshnessRepo(db_conn).get_latest_date('income_statement', 'AAA') == dt.date(2023, 3, 31)
@@ -0,0 +1,84 @@
+import sqlite3
+
+import pytest
+
+from app.database.migrate import (
+    Migration,
+    apply_migrations,
+    get_schema_version,
+    load_migrations
+)
+
+
+class TestMigrations:
+    def test_apply_migrations(self, schema_db_conn):
+        # Act
+        applied_versions = apply_migrations(schema_db_conn)
+
+        # Assert
+        migrations = load_migrations()
+        assert applied_versions == [migration.version for migration in migrations]
+        assert get_schema_version(schema_db_conn) == migrations[-1].version
+
+        indexes = [
+            row[0] for row in schema_db_conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        ]
+        assert 'idx_stocks_with_sector_registered_date_sector' in indexes
+        assert 'idx_stock_time_series_symbol' in indexes
+
+    def test_apply_migrations_is_idempotent(self, schema_db_conn):
+        # Prepare
+        apply_migrations(schema_db_conn)
+        schema_version = get_schema_version(schema_db_conn)
+
+        # Act
+        applied_versions = apply_migrations(schema_db_conn)
+
+        # Assert
+        assert applied_versions == []
+        assert get_schema_version(schema_db_conn) == schema_version
+
+    def test_failed_migration_is_rolled_back(self, schema_db_conn):
+        # Prepare
+        migrations = [
+            Migration(
+                version=1,
+                name='broken',
+                statements=[
+                    "CREATE INDEX idx_earnings_reported_date ON earnings (reported_date)",
+                    "CREATE INDEX idx_missing ON missing_table (column)"
+                ]
+            )
+        ]
+
+        # Act
+        with pytest.raises(sqlite3.OperationalError):
+            apply_migrations(schema_db_conn, migrations)
+
+        # Assert
+        assert get_schema_version(schema_db_conn) == 0
+        index = schema_db_conn.execute(
+            "SELECT name FROM sqlite_master WHERE name='idx_earnings_reported_date'"
+        ).fetchone()
+        assert index is None
+
+    def test_latest_snapshot_queries_use_indexes(self, schema_db_conn):
+        # Prepare
+        apply_migrations(schema_db_conn)
+
+        # Act
+        query_plan = schema_db_conn.execute(
+            """EXPLAIN QUERY PLAN
+            SELECT symbol FROM stocks_with_sector
+            WHERE sector_name=? AND registered_date=(
+                SELECT registered_date
+                FROM stocks_with_sector
+                ORDER BY registered_date_ts DESC
+                LIMIT 1
+            )""",
+            ('ENERGY', )
+        ).fetchall()
+
+        # Assert
+        details = [row[3] for row in query_plan]
+        assert not any(detail == 'SCAN stocks_with_sector' for detail in details)
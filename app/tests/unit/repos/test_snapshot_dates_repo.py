@@ -0,0 +1,64 @@
+import sqlite3
+
+from app.database.migrate import apply_migrations
+from app.domain.comp_rating import CompRating
+from app.domain.date import Date
+from app.domain.price import Price
+from app.domain.percentage import Percentage
+from app.domain.stock_leader import StockLeader
+from app.repos.dividend_leaders_repo import DividendLeadersRepo
+from app.repos.snapshot_dates_repo import SnapshotDatesRepo
+
+
+def _stock_leader(symbol: str) -> StockLeader:
+    return StockLeader(
+        name=f'Company {symbol}',
+        symbol=symbol,
+        closing_price=Price(10.5),
+        comp_rating=CompRating(90),
+        yield_pct=Percentage(2.5),
+        dividend_growth_pct=Percentage(10)
+    )
+
+
+class TestSnapshotDatesRepo:
+    def test_stored_snapshots_are_registered(self, db_conn):
+        # Prepare
+        repo = DividendLeadersRepo(db_conn)
+
+        # Act
+        repo.add_stock_leaders_for_date(Date(1, 2, 2023), [_stock_leader('AAA')])
+        repo.add_stock_leaders_for_date(Date(3, 2, 2023), [_stock_leader('BBB')])
+        repo.add_stock_leaders_for_date(Date(2, 2, 2023), [_stock_leader('CCC')])
+
+        # Assert
+        snapshot_dates_repo = SnapshotDatesRepo(db_conn)
+        assert snapshot_dates_repo.get_latest_snapshot_date('dividend_leaders') == '03-02-2023'
+        assert snapshot_dates_repo.get_snapshot_dates('dividend_leaders') == [
+            '03-02-2023',
+            '02-02-2023',
+            '01-02-2023'
+        ]
+        assert snapshot_dates_repo.get_latest_snapshot_date('reit_leaders') is None
+
+        latest_leaders = repo.get_latest_stock_leaders()
+        assert [leader.symbol for leader in latest_leaders] == ['BBB']
+
+    def test_migration_backfills_existing_snapshots(self):
+        # Prepare
+        conn = sqlite3.connect(':memory:')
+        with open('app/database/schema.sql', mode='r') as f:
+            conn.executescript(f.read())
+
+        with conn:
+            conn.execute(
+                "INSERT INTO reit_leaders VALUES(?,?,?,?,?,?,?)",
+                ('Company AAA', 'AAA', 10.5, 2.5, 10, '05-01-2023', Date(5, 1, 2023).date_ts)
+            )
+
+        # Act
+        apply_migrations(conn)
+
+        # Assert
+        assert SnapshotDatesRepo(conn).get_latest_snapshot_date('reit_leaders') == '05-01-2023'
+        conn.close()
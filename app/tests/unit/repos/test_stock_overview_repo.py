@@ -0,0 +1,44 @@
+import pytest
+
+from app.domain.date import Date
+from app.domain.stock_overview import StockOverview
+from app.repos.data_freshness_repo import DataFreshnessRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.stock_overview_repo import StockOverviewRepo
+
+
+def _stock_overview(symbol: str, pe_ratio: float) -> StockOverview:
+    return StockOverview(symbol=symbol, sector='TECHNOLOGY', industry='SOFTWARE', pe_ratio=pe_ratio)
+
+
+class TestStockOverviewRepo:
+    def test_replace_stock_overview_for_symbol(self, db_conn):
+        # Prepare
+        repo = StockOverviewRepo(db_conn)
+        repo.replace_stock_overview_for_symbol(Date(day=1, month=6, year=2023), _stock_overview('AAA', 10))
+
+        # Act
+        repo.replace_stock_overview_for_symbol(Date(day=8, month=6, year=2023), _stock_overview('AAA', 12))
+
+        # Assert
+        rows = db_conn.execute("SELECT pe_ratio FROM stock_overview WHERE symbol='AAA'").fetchall()
+        assert rows == [(12, )]
+        assert DataVersionsRepo(db_conn).get_version('stock_overview') == 2
+
+    def test_failed_replace_keeps_the_old_overview(self, db_conn, monkeypatch):
+        # Prepare
+        repo = StockOverviewRepo(db_conn)
+        repo.replace_stock_overview_for_symbol(Date(day=1, month=6, year=2023), _stock_overview('AAA', 10))
+
+        def fail(*args, **kwargs):
+            raise ValueError()
+
+        monkeypatch.setattr(DataFreshnessRepo, 'mark_fresh', fail)
+
+        # Act
+        with pytest.raises(ValueError):
+            repo.replace_stock_overview_for_symbol(Date(day=8, month=6, year=2023), _stock_overview('AAA', 12))
+
+        # Assert
+        assert repo.get_stock_overview('AAA').pe_ratio == 10
+        assert DataVersionsRepo(db_conn).get_version('stock_overview') == 1
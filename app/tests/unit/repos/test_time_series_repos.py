@@ -0,0 +1,102 @@
+import datetime as dt
+
+from app.domain.date import Date
+from app.domain.economic_indicator import EconomicIndicator
+from app.domain.price import Price
+from app.domain.time_series import EconomicIndicatorTimeSeriesEntry, StockTimeSeriesEntry
+from app.repos.data_freshness_repo import DataFreshnessRepo
+from app.repos.data_versions_repo import DataVersionsRepo
+from app.repos.economic_indicators_repo import EconomicIndicatorTimeSeriesRepo
+from app.repos.stock_time_series_repo import StockTimeSeriesRepo
+
+
+def _stock_entry(day: int, close_price: float) -> StockTimeSeriesEntry:
+    return StockTimeSeriesEntry(
+        registered_date=Date(day=day, month=6, year=2023),
+        open_price=Price(10),
+        high_price=Price(12),
+        low_price=Price(9),
+        close_price=Price(close_price),
+        volume=1000.0,
+        dividend_amount=0.0
+    )
+
+
+class TestStockTimeSeriesRepo:
+    def test_upsert_writes_only_new_or_changed_rows(self, db_conn):
+        # Prepare
+        repo = StockTimeSeriesRepo(db_conn)
+        repo.upsert_time_series_for_symbol('AAA', [_stock_entry(2, 11), _stock_entry(9, 11)])
+
+        # Act
+        changed_rows = repo.upsert_time_series_for_symbol(
+            'AAA',
+            [_stock_entry(2, 11), _stock_entry(9, 11.5), _stock_entry(16, 12)]
+        )
+
+        # Assert
+        assert changed_rows == 2
+        time_series = repo.get_symbol_time_series('AAA')
+        assert sorted(
+            (entry.registered_date.date_string, entry.close_price.value) for entry in time_series
+        ) == [('02-06-2023', 11.0), ('09-06-2023', 11.5), ('16-06-2023', 12.0)]
+        assert DataVersionsRepo(db_conn).get_version('stock_time_series') == 2
+        assert DataFreshnessRepo(db_conn).get_latest_date('stock_time_series', 'AAA') == dt.date(2023, 6, 16)
+
+    def test_unchanged_upsert_keeps_the_version(self, db_conn):
+        # Prepare
+        repo = StockTimeSeriesRepo(db_conn)
+        repo.upsert_time_series_for_symbol('AAA', [_stock_entry(2, 11)])
+
+        # Act
+        changed_rows = repo.upsert_time_series_for_symbol('AAA', [_stock_entry(2, 11)])
+
+        # Assert
+        assert changed_rows == 0
+        assert len(repo.get_symbol_time_series('AAA')) == 1
+        assert DataVersionsRepo(db_conn).get_version('stock_time_series') == 1
+
+
+class TestEconomicIndicatorTimeSeriesRepo:
+    def test_upsert_writes_only_new_or_changed_rows(self, db_conn):
+        # Prepare
+        repo = EconomicIndicatorTimeSeriesRepo(db_conn)
+        repo.upsert_time_series_for_indicator(
+            EconomicIndicator.Interest_Rate,
+            [
+                EconomicIndicatorTimeSeriesEntry(registered_date=Date(1, 5, 2023), value=Price(5), unit='percent'),
+                EconomicIndicatorTimeSeriesEntry(registered_date=Date(1, 6, 2023), value=Price(5), unit='percent'),
+            ]
+        )
+
+        # Act
+        changed_rows = repo.upsert_time_series_for_indicator(
+            EconomicIndicator.Interest_Rate,
+            [
+                EconomicIndicatorTimeSeriesEntry(registered_date=Date(1, 5, 2023), value=Price(5), unit='percent'),
+                EconomicIndicatorTimeSeriesEntry(registered_date=Date(1, 6, 2023), value=Price(5.25), unit='percent'),
+            ]
+        )
+
+        # Assert
+        assert changed_rows == 1
+        time_series = repo.get_indicator_time_series(EconomicIndicator.Interest_Rate)
+        assert sorted(entry.value.value for entry in time_series) == [5.0, 5.25]
+
+    def test_latest_date_of_indicator(self, db_conn):
+        # Prepare
+        repo = EconomicIndicatorTimeSeriesRepo(db_conn)
+        repo.upsert_time_series_for_indicator(
+            EconomicIndicator.Interest_Rate,
+            [
+                EconomicIndicatorTimeSeriesEntry(registered_date=Date(1, 6, 2023), value=Price(5), unit='percent'),
+                EconomicIndicatorTimeSeriesEntry(registered_date=Date(1, 5, 2023), value=Price(5), unit='percent'),
+            ]
+        )
+
+        # Act
+        latest_date = repo.get_latest_date_of_indicator(EconomicIndicator.Interest_Rate)
+
+        # Assert
+        assert latest_date == dt.date(2023, 6, 1)
+        assert repo.get_latest_date_of_indicator(EconomicIndicator.Unemployment) is None
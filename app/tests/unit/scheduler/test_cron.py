@@ -0,0 +1,56 @@
+import datetime as dt
+
+import pytest
+
+from app.errors.scheduler import InvalidCronExpressionError
+from app.scheduler.cron import CronTrigger
+
+
+def _utc(*args) -> dt.datetime:
+    return dt.datetime(*args, tzinfo=dt.timezone.utc)
+
+
+class TestCronTrigger:
+    def test_next_weekday_after_the_close(self):
+        # Prepare
+        trigger = CronTrigger('30 23 * * 1-5')
+
+        # Act
+        # Friday 23:30 and the Monday after
+        times = [trigger.next_after(_utc(2023, 6, 2, 12, 0)), trigger.next_after(_utc(2023, 6, 2, 23, 30))]
+
+        # Assert
+        assert times == [_utc(2023, 6, 2, 23, 30), _utc(2023, 6, 5, 23, 30)]
+
+    def test_steps_lists_and_sunday_as_7(self):
+        # Prepare
+        every_15_minutes = CronTrigger('*/15 * * * *')
+        twice_a_day = CronTrigger('0 6,18 * * *')
+        sunday = CronTrigger('0 0 * * 7')
+
+        # Act
+        times = [
+            every_15_minutes.next_after(_utc(2023, 6, 2, 12, 7)),
+            twice_a_day.next_after(_utc(2023, 6, 2, 12, 0)),
+            sunday.next_after(_utc(2023, 6, 2, 12, 0)),
+        ]
+
+        # Assert
+        assert times == [_utc(2023, 6, 2, 12, 15), _utc(2023, 6, 2, 18, 0), _utc(2023, 6, 4, 0, 0)]
+
+    def test_day_of_month_or_day_of_week(self):
+        # Prepare
+        # The 1st of the month or any Monday
+        trigger = CronTrigger('0 0 1 * 1')
+
+        # Act
+        times = [trigger.next_after(_utc(2023, 6, 2)), trigger.next_after(_utc(2023, 6, 26))]
+
+        # Assert
+        assert times == [_utc(2023, 6, 5), _utc(2023, 7, 1)]
+
+    @pytest.mark.parametrize('expression', ['* * * *', '60 * * * *', '*/0 * * * *', 'a * * * *', '0 0 30 2 *'])
+    def test_invalid_expression(self, expression):
+        # Act
+        with pytest.raises(InvalidCronExpressionError):
+            CronTrigger(expression).next_after(_utc(2023, 6, 2))
@@ -0,0 +1,287 @@
+import asyncio
+import datetime as dt
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pytest_httpx import HTTPXMock
+
+from app.api.routers import scheduler as scheduler_router
+from app.api.routers import support as support_router
+from app.dependencies import create_db_conn, get_db_conn
+from app.domain.super_investor import SuperInvestor
+from app.http.dataroma_client import DataromaClient
+from app.http.http_client import HttpClient
+from app.http.rate_limiter import TokenBucket
+from app.repos.scheduler_jobs_repo import SchedulerJobsRepo
+from app.repos.super_investor import SuperInvestorRepo
+from app.scheduler.jobs import JOB_DEFINITIONS, JobDefinition
+from app.scheduler.scheduler import Clock, Scheduler
+from app.scripts.refresh_pipeline import RefreshReport
+from app.services.scheduler_jobs import SchedulerJobsService
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_clients():
+    yield
+    await HttpClient.close_all()
+
+
+class FakeClock(Clock):
+    def __init__(self, now: dt.datetime) -> None:
+        self.current = now
+
+    def now(self) -> dt.datetime:
+        return self.current
+
+    async def sleep(self, seconds: float) -> None:
+        self.current += dt.timedelta(seconds=seconds)
+        await asyncio.sleep(0)
+
+
+def _definition(dataset: str, provider: str = 'fake', run=None, **kwargs) -> JobDefinition:
+    async def succeed(params, context):
+        return 'ok'
+
+    return JobDefinition(dataset=dataset, provider=provider, run=run or succeed, **kwargs)
+
+
+class TestScheduler:
+    @pytest.mark.asyncio
+    async def test_cron_trigger_queues_one_job_per_missed_run(self, serialized_db_conn):
+        # Prepare
+        clock = FakeClock(dt.datetime(2023, 6, 2, 23, 0, tzinfo=dt.timezone.utc))
+        definition = _definition(
+            'tables',
+            cron='30 23 * * 1-5',
+            trigger_params=lambda fired_at: {'date': fired_at.date().isoformat()}
+        )
+        scheduler = Scheduler([definition], db_conn=serialized_db_conn, clock=clock)
+        scheduler.fire_due_triggers()
+
+        # Act
+        # Stopped over the weekend, friday's and monday's runs were missed
+        clock.current = dt.datetime(2023, 6, 6, 1, 0, tzinfo=dt.timezone.utc)
+        job_ids = scheduler.fire_due_triggers()
+        duplicate_id = scheduler.enqueue('tables', {'date': '2023-06-02'})
+
+        # Assert
+        assert len(job_ids) == 2
+        assert duplicate_id is None
+        jobs = [SchedulerJobsRepo(serialized_db_conn).get_job(job_id) for job_id in job_ids]
+        assert [job.params for job in jobs] == [{'date': '2023-06-02'}, {'date': '2023-06-05'}]
+        assert all(job.status == SchedulerJobsRepo.PENDING for job in jobs)
+        assert SchedulerJobsRepo(serialized_db_conn).get_next_trigger_times() == {
+            'tables': dt.datetime(2023, 6, 6, 23, 30, tzinfo=dt.timezone.utc)
+        }
+
+    @pytest.mark.asyncio
+    async def test_priority_and_provider_limit(self, serialized_db_conn):
+        # Prepare
+        clock = FakeClock(dt.datetime(2023, 6, 2, 12, 0, tzinfo=dt.timezone.utc))
+        scheduler = Scheduler(
+            [_definition('low'), _definition('high', priority=10), _definition('other', provider='other')],
+            db_conn=serialized_db_conn,
+            clock=clock
+        )
+        low_id = scheduler.enqueue('low')
+        high_id = scheduler.enqueue('high')
+        other_id = scheduler.enqueue('other')
+
+        # Act
+        first_started = await scheduler.tick()
+        await scheduler.wait_running_jobs()
+        second_started = await scheduler.tick()
+        await scheduler.wait_running_jobs()
+
+        # Assert
+        assert first_started == [high_id, other_id]
+        assert second_started == [low_id]
+        jobs = SchedulerJobsRepo(serialized_db_conn).get_jobs()
+        assert {job.status for job in jobs} == {SchedulerJobsRepo.DONE}
+        assert {job.result for job in jobs} == {'ok'}
+
+    @pytest.mark.asyncio
+    async def test_failed_attempts_back_off_then_fail(self, serialized_db_conn, monkeypatch):
+        # Prepare
+        monkeypatch.setattr('app.settings.scheduler_retry_backoff_seconds', 60)
+        clock = FakeClock(dt.datetime(2023, 6, 2, 12, 0, tzinfo=dt.timezone.utc))
+
+        async def fail(params, context):
+            raise ValueError('provider is down')
+
+        scheduler = Scheduler([_definition('flaky', run=fail, max_attempts=2)], db_conn=serialized_db_conn, clock=clock)
+        job_id = scheduler.enqueue('flaky')
+        repo = SchedulerJobsRepo(serialized_db_conn)
+
+        # Act
+        await scheduler.tick()
+        await scheduler.wait_running_jobs()
+        after_first_attempt = repo.get_job(job_id)
+        not_started = await scheduler.tick()
+        clock.current += dt.timedelta(seconds=60)
+        await scheduler.tick()
+        await scheduler.wait_running_jobs()
+
+        # Assert
+        assert after_first_attempt.status == SchedulerJobsRepo.PENDING
+        assert after_first_attempt.run_at == dt.datetime(2023, 6, 2, 12, 1, tzinfo=dt.timezone.utc)
+        assert not_started == []
+        job = repo.get_job(job_id)
+        assert job.status == SchedulerJobsRepo.FAILED
+        assert job.attempts == 2
+        assert job.error == 'ValueError: provider is down'
+
+    @pytest.mark.asyncio
+    async def test_runs_a_dataset_job_until_stopped(self, serialized_db_conn, httpx_mock: HTTPXMock, monkeypatch):
+        # Prepare
+        monkeypatch.setattr(DataromaClient, '_rate_limiter', TokenBucket(rate=1000, burst=10))
+        monkeypatch.setattr(DataromaClient, '_super_investor_map', {SuperInvestor.Warren_Buffet: 'BRK'})
+        httpx_mock.add_response(
+            url='https://www.dataroma.com/m/holdings.php?m=BRK',
+            text="""<table>
+                <tr><th>History</th><th>Stock</th><th>%</th><th>Activity</th><th>Shares</th><th>Price</th><th>Value</th></tr>
+                <tr><td>1</td><td>AAPL - Apple Inc.</td><td>45.5</td><td></td><td>100</td><td>$193.97</td><td>$19,397</td></tr>
+            </table>
+            <table><tr><th>Sector</th><th>%</th></tr><tr><td>Technology</td><td>45.5</td></tr></table>"""
+        )
+        definitions = [
+            definition for definition in JOB_DEFINITIONS
+            if definition.dataset == 'super_investor_portfolios'
+        ]
+        clock = FakeClock(dt.datetime(2023, 6, 5, 4, 0, tzinfo=dt.timezone.utc))
+        scheduler = Scheduler(definitions, db_conn=serialized_db_conn, clock=clock)
+        stop = asyncio.Event()
+
+        async def stop_when_done():
+            while not SchedulerJobsRepo(serialized_db_conn).get_jobs(status=SchedulerJobsRepo.DONE):
+                await asyncio.sleep(0.01)
+            stop.set()
+
+        # Act
+        await asyncio.wait_for(asyncio.gather(scheduler.run(stop), stop_when_done()), timeout=10)
+
+        # Assert
+        # The trigger fired at 05:00 on Monday
+        assert clock.current >= dt.datetime(2023, 6, 5, 5, 0, tzinfo=dt.timezone.utc)
+        portfolio = SuperInvestorRepo(serialized_db_conn).get_super_investor_portfolio_holdings(SuperInvestor.Warren_Buffet)
+        assert [holding.stock for holding in portfolio] == ['AAPL - Apple Inc.']
+
+    def test_status_api(self, serialized_db_conn):
+        # Prepare
+        clock = FakeClock(dt.datetime(2023, 6, 2, 12, 0, tzinfo=dt.timezone.utc))
+        job_id = Scheduler([_definition('tables')], db_conn=serialized_db_conn, clock=clock).enqueue('tables', {'date': '2023-06-02'})
+        app = FastAPI()
+        app.include_router(scheduler_router.router)
+        app.dependency_overrides[create_db_conn] = lambda: serialized_db_conn
+        client = TestClient(app)
+
+        # Act
+        jobs_response = client.get('/scheduler/jobs', params={'status': 'pending'})
+        job_response = client.get(f'/scheduler/jobs/{job_id}')
+        missing_job_response = client.get('/scheduler/jobs/999')
+
+        # Assert
+        assert [job['id'] for job in jobs_response.json()] == [job_id]
+        assert job_response.json()['params'] == {'date': '2023-06-02'}
+        assert job_response.json()['run_at'] == '2023-06-02T12:00:00+00:00'
+        assert missing_job_response.status_code == 404
+
+    def test_add_symbol_api(self, serialized_db_conn):
+        # Prepare
+        clock = FakeClock(dt.datetime(2023, 6, 2, 12, 0, tzinfo=dt.timezone.utc))
+        other_job_id = Scheduler(
+            [_definition('tables')], db_conn=serialized_db_conn, clock=clock
+        ).enqueue('tables', {'date': '2023-06-02'})
+        app = FastAPI()
+        app.include_router(support_router.router)
+        app.dependency_overrides[create_db_conn] = lambda: serialized_db_conn
+        app.dependency_overrides[get_db_conn] = lambda: serialized_db_conn
+        client = TestClient(app)
+
+        # Act
+        first_response = client.post('/price_predictions/support/add_symbol', params={'symbol': 'aapl'})
+        second_response = client.post('/price_predictions/support/add_symbol', params={'symbol': 'AAPL'})
+        invalid_response = client.post('/price_predictions/support/add_symbol', params={'symbol': 'AAPL;--'})
+        job_id = first_response.json()['id']
+        job_response = client.get(f'/price_predictions/support/add_symbol/{job_id}')
+        other_job_response = client.get(f'/price_predictions/support/add_symbol/{other_job_id}')
+        missing_job_response = client.get('/price_predictions/support/add_symbol/999')
+
+        # Assert
+        assert first_response.status_code == 202
+        assert second_response.status_code == 202
+        assert second_response.json()['id'] == job_id
+        assert first_response.json()['params'] == {'symbol': 'AAPL'}
+        assert first_response.json()['status'] == 'pending'
+        assert invalid_response.status_code == 422
+        assert job_response.json()['dataset'] == 'symbol_data'
+        assert other_job_response.status_code == 404
+        assert missing_job_response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_symbol_data_requests_share_the_active_job(self, serialized_db_conn):
+        # Prepare
+        service = SchedulerJobsService(serialized_db_conn)
+        repo = SchedulerJobsRepo(serialized_db_conn)
+
+        # Act
+        first_job, first_queued = await service.enqueue_symbol_data('AAPL', db_conn=serialized_db_conn)
+        second_job, second_queued = await service.enqueue_symbol_data('AAPL', db_conn=serialized_db_conn)
+        repo.mark_running(first_job.id, dt.datetime.now(dt.timezone.utc))
+        running_job, running_queued = await service.enqueue_symbol_data('AAPL', db_conn=serialized_db_conn)
+        repo.mark_done(first_job.id, dt.datetime.now(dt.timezone.utc))
+        new_job, new_queued = await service.enqueue_symbol_data('AAPL', db_conn=serialized_db_conn)
+        other_job, _ = await service.enqueue_symbol_data('MSFT', db_conn=serialized_db_conn)
+
+        # Assert
+        assert (first_queued, second_queued, running_queued, new_queued) == (True, False, False, True)
+        assert first_job.id == second_job.id == running_job.id
+        assert running_job.status == SchedulerJobsRepo.RUNNING
+        assert new_job.id not in (first_job.id, other_job.id)
+        assert first_job.dataset == 'symbol_data'
+        assert first_job.params == {'symbol': 'AAPL'}
+        assert first_job.provider == 'alpha_vantage'
+
+    @pytest.mark.asyncio
+    async def test_symbol_data_job_runs_next_to_the_batch_refresh(self, serialized_db_conn, monkeypatch):
+        # Prepare
+        refreshed = []
+        batch_release = asyncio.Event()
+
+        async def refresh_stock_data(symbols, concurrency, parse_pool):
+            if symbols is None:
+                await batch_release.wait()
+            else:
+                refreshed.append(symbols)
+            return RefreshReport(symbols=1, stored=5, failed=1 if symbols == ['XYZ'] else 0)
+
+        monkeypatch.setattr('app.scheduler.jobs.refresh_stock_data', refresh_stock_data)
+        clock = FakeClock(dt.datetime(2023, 6, 2, 12, 0, tzinfo=dt.timezone.utc))
+        scheduler = Scheduler(db_conn=serialized_db_conn, clock=clock)
+        batch_id = scheduler.enqueue('stock_data')
+        await scheduler.tick()
+        aapl_id = scheduler.enqueue('symbol_data', {'symbol': 'AAPL'})
+        xyz_id = scheduler.enqueue('symbol_data', {'symbol': 'XYZ'})
+
+        # Act
+        # The batch refresh and the symbol with the higher priority
+        # take the two alpha vantage slots
+        started_with_batch = await scheduler.tick()
+        await asyncio.sleep(0)
+        batch_release.set()
+        await scheduler.wait_running_jobs()
+        started_after_batch = await scheduler.tick()
+        await scheduler.wait_running_jobs()
+
+        # Assert
+        assert started_with_batch == [aapl_id]
+        assert started_after_batch == [xyz_id]
+        assert refreshed == [['AAPL'], ['XYZ']]
+        repo = SchedulerJobsRepo(serialized_db_conn)
+        assert repo.get_job(batch_id).status == SchedulerJobsRepo.DONE
+        assert repo.get_job(aapl_id).status == SchedulerJobsRepo.DONE
+        xyz_job = repo.get_job(xyz_id)
+        assert xyz_job.status == SchedulerJobsRepo.PENDING
+        assert xyz_job.error == 'SchedulerError: Failed to ingest 1 datasets of XYZ'
@@ -0,0 +1,38 @@
+import pytest
+
+from app.errors.ibd import IbdScrapeError
+from app.services.ibd_scrapers.html_tables import first_table, iter_tables
+
+
+class TestIterTables:
+    def test_tables_with_their_headings(self):
+        # Prepare
+        html_response = """
+        <html><body>
+            <h3>1. ENERGY +0.1% Daily Change, +51.00% Since Jan. 1</h3>
+            <table>
+                <tr><td colspan="2">SECTOR LEADER | NYSE</td></tr>
+                <tr><td> 97 </td><td>Comstck&nbsp;&nbsp;Res <b>0.0</b></td></tr>
+            </table>
+            <h3>2. METALS +0.8% Daily Change, +5.98% Since Jan. 1</h3>
+            <table><tbody><tr><th>Sym</th><td>AA</td></tr></tbody></table>
+        </body></html>
+        """
+
+        # Act
+        tables = list(iter_tables(html_response))
+
+        # Assert
+        assert [table.heading for table in tables] == [
+            '1. ENERGY +0.1% Daily Change, +51.00% Since Jan. 1',
+            '2. METALS +0.8% Daily Change, +5.98% Since Jan. 1'
+        ]
+        assert tables[0].rows == [
+            ['SECTOR LEADER | NYSE', 'SECTOR LEADER | NYSE'],
+            ['97', 'Comstck Res 0.0']
+        ]
+        assert tables[1].rows == [['Sym', 'AA']]
+
+    def test_page_without_tables(self):
+        with pytest.raises(IbdScrapeError):
+            first_table('<html><body><p>Not found</p></body></html>')
@@ -0,0 +1,50 @@
+import datetime as dt
+
+import pytest
+import pytest_asyncio
+from pytest_httpx import HTTPXMock
+
+from app.domain.world_index import WorldIndex
+from app.http.http_client import HttpClient
+from app.http.y_finance_client import YFinanceClient
+from app.services.alpha_vantage_scrapers.economic_indicators import EconomicIndicatorScraper
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_clients():
+    yield
+    await HttpClient.close_all()
+
+
+class TestIncrementalWindows:
+    def test_indicator_entries_before_since_are_skipped(self):
+        # Prepare
+        json_response = {
+            'unit': 'percent',
+            'data': [
+                {'date': '2023-07-01', 'value': '5.12'},
+                {'date': '2023-06-01', 'value': '5.08'},
+                {'date': '2023-05-01', 'value': '5.06'},
+                {'date': '2023-04-01', 'value': 'not a number'},
+            ]
+        }
+
+        # Act
+        time_series = EconomicIndicatorScraper._convert_json_to_domain_model(json_response, since=dt.date(2023, 6, 1))
+
+        # Assert
+        assert [entry.registered_date.date_string for entry in time_series] == ['01-07-2023', '01-06-2023']
+
+    @pytest.mark.asyncio
+    async def test_index_window_starts_at_since(self, httpx_mock: HTTPXMock):
+        # Prepare
+        httpx_mock.add_response(text='Date,Open,High,Low,Close,Adj Close,Volume\n')
+        since = dt.date(2023, 6, 5)
+
+        # Act
+        await YFinanceClient().get_world_index_time_series(WorldIndex.S_P_500, since=since)
+
+        # Assert
+        params = httpx_mock.get_requests()[0].url.params
+        assert int(params['period1']) == int(dt.datetime(2023, 6, 5).timestamp())
+        assert int(params['period2']) > int(params['period1'])
@@ -0,0 +1,146 @@
+import asyncio
+import contextlib
+
+import pytest
+
+from app.scripts.refresh_pipeline import Dataset, refresh_symbols
+
+
+class FakeProvider:
+    def __init__(self, failing_symbols=()) -> None:
+        self.failing_symbols = set(failing_symbols)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.stored = {}
+
+    async def fetch(self, symbol: str):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if symbol in self.failing_symbols:
+            raise RuntimeError('provider error')
+        return {'symbol': symbol, 'value': len(symbol)}
+
+    def store(self, symbol: str, value: int) -> None:
+        self.stored[symbol] = value
+
+
+class TestRefreshSymbols:
+    @pytest.mark.asyncio
+    async def test_fetches_concurrently_and_stores_every_payload(self):
+        # Prepare
+        provider = FakeProvider(failing_symbols=['BAD'])
+        dataset = Dataset(
+            name='values',
+            is_fresh=lambda symbol: symbol == 'FRESH',
+            fetch=provider.fetch,
+            parse=lambda symbol, json_response: json_response['value'],
+            store=provider.store
+        )
+        symbols = [f'S{i}' for i in range(20)] + ['FRESH', 'BAD']
+
+        # Act
+        report = await refresh_symbols(symbols, [dataset], concurrency=5, queue_size=2)
+
+        # Assert
+        assert provider.max_in_flight == 5
+        assert provider.stored == {f'S{i}': len(f'S{i}') for i in range(20)}
+        assert report.symbols == 22
+        assert report.fetched == 20
+        assert report.stored == 20
+        assert report.skipped == 1
+        assert report.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_store_errors_are_reported(self):
+        # Prepare
+        provider = FakeProvider()
+
+        def store(symbol: str, value: int) -> None:
+            raise ValueError('bad payload')
+
+        dataset = Dataset(
+            name='values',
+            is_fresh=lambda symbol: False,
+            fetch=provider.fetch,
+            parse=lambda symbol, json_response: json_response['value'],
+            store=store
+        )
+
+        # Act
+        report = await refresh_symbols(['A', 'B'], [dataset])
+
+        # Assert
+        assert report.fetched == 2
+        assert report.stored == 0
+        assert report.failed == 2
+
+    @pytest.mark.asyncio
+    async def test_parse_errors_are_reported(self):
+        # Prepare
+        provider = FakeProvider()
+
+        def parse(symbol: str, json_response):
+            if symbol == 'BAD':
+                raise ValueError('bad payload')
+            return json_response['value']
+
+        dataset = Dataset(
+            name='values',
+            is_fresh=lambda symbol: False,
+            fetch=provider.fetch,
+            parse=parse,
+            store=provider.store
+        )
+
+        # Act
+        report = await refresh_symbols(['A', 'BAD'], [dataset])
+
+        # Assert
+        assert provider.stored == {'A': 1}
+        assert report.fetched == 2
+        assert report.stored == 1
+        assert report.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_share_a_transaction(self):
+        # Prepare
+        provider = FakeProvider()
+        transactions = []
+
+        @contextlib.contextmanager
+        def transaction():
+            transactions.append([])
+            yield
+
+        def store(symbol: str, value: int) -> None:
+            if symbol == 'BAD':
+                raise ValueError('bad payload')
+            transactions[-1].append(symbol)
+            provider.store(symbol, value)
+
+        dataset = Dataset(
+            name='values',
+            is_fresh=lambda symbol: False,
+            fetch=provider.fetch,
+            parse=lambda symbol, json_response: json_response['value'],
+            store=store
+        )
+        symbols = ['A', 'B', 'BAD', 'C']
+
+        # Act
+        report = await refresh_symbols(
+            symbols,
+            [dataset],
+            concurrency=4,
+            batch_size=10,
+            transaction=transaction
+        )
+
+        # Assert
+        assert report.stored == 3
+        assert report.failed == 1
+        assert set(provider.stored) == {'A', 'B', 'C'}
+        # The failed batch is retried one payload per transaction
+        assert len(transactions) == 5
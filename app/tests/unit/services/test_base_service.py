@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app import dependencies
+from app.database.connection_pool import ConnectionPool
+from app.database.executor import DatabaseExecutor
+from app.services.base_service import BaseService, run_query
+
+
+def _patch_db_pool(tmp_path, monkeypatch, size: int):
+    pool = ConnectionPool(str(tmp_path / 'test.db'), size=size, timeout=2)
+    executor = DatabaseExecutor(max_workers=size)
+    monkeypatch.setattr(dependencies, 'CONNECTION_POOL', pool)
+    monkeypatch.setattr(dependencies, 'DB_EXECUTOR', executor)
+    return pool, executor
+
+
+@pytest.fixture
+def db_pool(tmp_path, monkeypatch):
+    pool, executor = _patch_db_pool(tmp_path, monkeypatch, size=2)
+    yield pool
+    executor.shutdown()
+    pool.close()
+
+
+@pytest.fixture
+def single_db_pool(tmp_path, monkeypatch):
+    pool, executor = _patch_db_pool(tmp_path, monkeypatch, size=1)
+    yield pool
+    executor.shutdown()
+    pool.close()
+
+
+class TestRunQuery:
+    @pytest.mark.asyncio
+    async def test_query_runs_on_pooled_read_connection(self, db_pool):
+        # Act
+        thread_name, conn = await run_query(
+            lambda db_session: (threading.current_thread().name, db_session)
+        )
+
+        # Assert
+        assert thread_name.startswith('db')
+        assert conn is not db_pool.writer
+        assert db_pool.stats().acquired_count == 1
+        assert db_pool.stats().in_use_connections == 0
+
+    @pytest.mark.asyncio
+    async def test_service_session_is_used_when_given(self, db_pool):
+        # Prepare
+        service = BaseService(db_session=db_pool.writer)
+
+        # Act
+        conn = await service._run_query(lambda db_session, value: db_session, 1)
+
+        # Assert
+        assert conn is db_pool.writer
+        assert db_pool.stats().acquired_count == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_query_does_not_block_event_loop(self, db_pool):
+        # Prepare
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        # Act
+        await asyncio.gather(
+            run_query(lambda db_session: time.sleep(0.2)),
+            ticker()
+        )
+
+        # Assert
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.2
+
+
+    @pytest.mark.asyncio
+    async def test_pool_query_does_not_hold_a_worker_while_waiting_for_a_connection(self, single_db_pool):
+        # Prepare
+        pool = single_db_pool
+        # The connection of a request, taken before its query is run
+        request_conn = pool.acquire()
+
+        # Act
+        pool_query = asyncio.ensure_future(run_query(lambda db_session: 'pool'))
+        await asyncio.sleep(0.05)
+        session_result = await asyncio.wait_for(
+            run_query(lambda db_session: 'session', db_session=request_conn),
+            timeout=1
+        )
+        pool.release(request_conn)
+        pool_result = await asyncio.wait_for(pool_query, timeout=1)
+
+        # Assert
+        assert (session_result, pool_result) == ('session', 'pool')
+        assert pool.stats().in_use_connections == 0
@@ -0,0 +1,94 @@
+import pytest
+import pytest_asyncio
+from pytest_httpx import HTTPXMock
+
+from app.domain.super_investor import SuperInvestor
+from app.http.dataroma_client import DataromaClient
+from app.http.http_client import HttpClient
+from app.http.rate_limiter import TokenBucket
+from app.repos.super_investor import SuperInvestorRepo
+from app.services.dataroma_ingest import DataromaIngestService
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def fast_dataroma_client(monkeypatch):
+    monkeypatch.setattr(DataromaClient, '_rate_limiter', TokenBucket(rate=1000, burst=20))
+    yield
+    await HttpClient.close_all()
+
+
+def _portfolio_page(stock: str) -> str:
+    return f"""<html><body>
+    <table>
+        <tr><th>History</th><th>Stock</th><th>% of Portfolio</th><th>Activity</th><th>Shares</th><th>Reported Price*</th><th>Value</th></tr>
+        <tr><td>1</td><td>{stock}</td><td>45.5</td><td>Add 2%</td><td>915560382</td><td>$193.97</td><td>$177,591,247,000</td></tr>
+    </table>
+    <table>
+        <tr><th>Sector</th><th>% of Portfolio</th></tr>
+        <tr><td>Technology</td><td>45.5</td></tr>
+    </table>
+    </body></html>"""
+
+
+def _grand_portfolio_page(symbol: str) -> str:
+    return f"""<html><body>
+    <table>
+        <tr><th>Symbol</th><th>Stock</th><th>% of all portfolios</th><th>Ownership count</th></tr>
+        <tr><td>{symbol}</td><td>{symbol} Inc.</td><td>2.5</td><td>12</td></tr>
+        <tr><td>Next</td><td>Page</td><td>0</td><td>0</td></tr>
+    </table>
+    </body></html>"""
+
+
+class TestDataromaIngestService:
+    @pytest.mark.asyncio
+    async def test_failed_super_investor_keeps_its_portfolio(self, httpx_mock: HTTPXMock, serialized_db_conn):
+        # Prepare
+        await self._ingest_portfolios(httpx_mock, serialized_db_conn, {'BRK': 'AAPL - Apple Inc.', 'psc': 'HLT - Hilton'})
+        httpx_mock.reset(assert_all_responses_were_requested=True)
+
+        # Act
+        report = await self._ingest_portfolios(httpx_mock, serialized_db_conn, {'BRK': 'OXY - Occidental', 'psc': None})
+
+        # Assert
+        assert report.stored == [SuperInvestor.Warren_Buffet.value]
+        assert list(report.failed) == [SuperInvestor.Bill_Ackman.value]
+        repo = SuperInvestorRepo(serialized_db_conn)
+        buffet_portfolio = repo.get_super_investor_portfolio(SuperInvestor.Warren_Buffet)
+        assert [holding.stock for holding in buffet_portfolio.holdings] == ['OXY - Occidental']
+        assert [entry.sector_name for entry in buffet_portfolio.sector_analysis] == ['Technology']
+        ackman_portfolio = repo.get_super_investor_portfolio(SuperInvestor.Bill_Ackman)
+        assert [holding.stock for holding in ackman_portfolio.holdings] == ['HLT - Hilton']
+
+    @pytest.mark.asyncio
+    async def test_grand_portfolio_is_replaced_only_when_every_page_is_scraped(self, httpx_mock: HTTPXMock, serialized_db_conn):
+        # Prepare
+        for page_num, symbol in enumerate(['AAPL', 'MSFT', 'GOOG'], start=1):
+            httpx_mock.add_response(
+                url=f'https://www.dataroma.com/m/g/portfolio.php?L={page_num}',
+                text=_grand_portfolio_page(symbol)
+            )
+        await DataromaIngestService.ingest_grand_portfolio(pages=3, db_conn=serialized_db_conn)
+        httpx_mock.reset(assert_all_responses_were_requested=True)
+        httpx_mock.add_response(url='https://www.dataroma.com/m/g/portfolio.php?L=1', text=_grand_portfolio_page('AMZN'))
+        httpx_mock.add_response(url='https://www.dataroma.com/m/g/portfolio.php?L=2', status_code=404)
+
+        # Act
+        report = await DataromaIngestService.ingest_grand_portfolio(pages=2, db_conn=serialized_db_conn)
+
+        # Assert
+        assert report.stored == []
+        assert list(report.failed) == ['grand portfolio page 2']
+        grand_portfolio = SuperInvestorRepo(serialized_db_conn).get_super_investor_grand_portfolio()
+        assert [entry.symbol for entry in grand_portfolio.portfolio] == ['AAPL', 'MSFT', 'GOOG']
+
+    @classmethod
+    async def _ingest_portfolios(cls, httpx_mock: HTTPXMock, db_conn, stocks):
+        for code, stock in stocks.items():
+            url = f'https://www.dataroma.com/m/holdings.php?m={code}'
+            if stock is None:
+                httpx_mock.add_response(url=url, status_code=404)
+            else:
+                httpx_mock.add_response(url=url, text=_portfolio_page(stock))
+
+        return await DataromaIngestService.ingest_super_investor_portfolios(db_conn=db_conn)
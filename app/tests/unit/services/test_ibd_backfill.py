@@ -0,0 +1,146 @@
+import datetime as dt
+
+import pytest
+
+from app.domain.date import Date
+from app.repos.backfill_checkpoints_repo import BackfillCheckpointsRepo
+from app.repos.snapshot_dates_repo import SnapshotDatesRepo
+from app.services.ibd_backfill import IbdBackfillService
+from app.services.ibd_ingest import IbdTable
+from app.services.parse_pool import ParsePool
+
+
+class FakeIbd:
+    """
+    Serves a page for every date except the holidays,
+    the dates in failing_dates fail once
+    """
+    def __init__(self, holidays=(), failing_dates=()) -> None:
+        self.holidays = set(holidays)
+        self.failing_dates = set(failing_dates)
+        self.fetched_dates = []
+
+    async def fetch(self, client, day: int, month: int, year: int):
+        date = dt.date(year, month, day)
+        self.fetched_dates.append(date)
+        if date in self.holidays:
+            return None
+        if date in self.failing_dates:
+            self.failing_dates.remove(date)
+            raise RuntimeError('connection reset')
+        return 'html'
+
+    def table(self, name: str = 'leaders') -> IbdTable:
+        return IbdTable(
+            name=name,
+            fetch=self.fetch,
+            parse=lambda html_response: html_response,
+            store=lambda db_conn, date, data: SnapshotDatesRepo.add_snapshot_date(db_conn, name, date)
+        )
+
+
+class TestIbdBackfillService:
+    @pytest.mark.asyncio
+    async def test_resumes_with_the_failed_dates(self, serialized_db_conn):
+        # Prepare
+        fake_ibd = FakeIbd(holidays=[dt.date(2022, 12, 26)], failing_dates=[dt.date(2022, 12, 28)])
+        backfill_kwargs = dict(
+            start=dt.date(2022, 12, 24),
+            end=dt.date(2022, 12, 30),
+            tables=[fake_ibd.table()],
+            db_conn=serialized_db_conn,
+            parse_pool=ParsePool(max_workers=0)
+        )
+
+        # Act
+        first_report = await IbdBackfillService.backfill(**backfill_kwargs)
+        fake_ibd.fetched_dates.clear()
+        second_report = await IbdBackfillService.backfill(**backfill_kwargs)
+
+        # Assert
+        # The weekend is not fetched
+        assert first_report.dates == 5
+        assert (first_report.ingested, first_report.missing, first_report.failed) == (3, 1, 1)
+        assert fake_ibd.fetched_dates == [dt.date(2022, 12, 28)]
+        assert (second_report.ingested, second_report.skipped, second_report.failed) == (1, 4, 0)
+        assert SnapshotDatesRepo(serialized_db_conn).get_snapshot_dates('leaders') == [
+            '30-12-2022', '29-12-2022', '28-12-2022', '27-12-2022'
+        ]
+        checkpoints = BackfillCheckpointsRepo(serialized_db_conn).get_checkpoints('ibd_backfill[leaders]')
+        assert checkpoints['26-12-2022'] == 'missing'
+
+    @pytest.mark.asyncio
+    async def test_skips_the_dates_in_the_snapshot_catalog(self, serialized_db_conn):
+        # Prepare
+        fake_ibd = FakeIbd()
+        with serialized_db_conn as con:
+            SnapshotDatesRepo.add_snapshot_date(con, 'leaders', Date(27, 12, 2022))
+
+        # Act
+        report = await IbdBackfillService.backfill(
+            start=dt.date(2022, 12, 27),
+            end=dt.date(2022, 12, 28),
+            tables=[fake_ibd.table()],
+            job_name='leaders_backfill',
+            db_conn=serialized_db_conn
+        )
+
+        # Assert
+        assert fake_ibd.fetched_dates == [dt.date(2022, 12, 28)]
+        assert (report.ingested, report.skipped) == (1, 1)
+        assert BackfillCheckpointsRepo(serialized_db_conn).get_checkpoints('leaders_backfill[leaders]') == {
+            '27-12-2022': 'done',
+            '28-12-2022': 'done'
+        }
+
+    @pytest.mark.asyncio
+    async def test_rerun_with_other_tables_fetches_the_new_ones(self, serialized_db_conn):
+        # Prepare
+        fake_ibd = FakeIbd()
+        backfill_kwargs = dict(
+            start=dt.date(2022, 12, 27),
+            end=dt.date(2022, 12, 28),
+            db_conn=serialized_db_conn,
+            parse_pool=ParsePool(max_workers=0)
+        )
+        await IbdBackfillService.backfill(tables=[fake_ibd.table('leaders')], **backfill_kwargs)
+        fake_ibd.fetched_dates.clear()
+
+        # Act
+        report = await IbdBackfillService.backfill(
+            tables=[fake_ibd.table('leaders'), fake_ibd.table('reits')],
+            **backfill_kwargs
+        )
+
+        # Assert
+        assert report.ingested == 2
+        # Only the new table is fetched, the other one is in the catalog
+        assert fake_ibd.fetched_dates == [dt.date(2022, 12, 27), dt.date(2022, 12, 28)]
+        assert SnapshotDatesRepo(serialized_db_conn).get_snapshot_dates('reits') == ['28-12-2022', '27-12-2022']
+
+    @pytest.mark.asyncio
+    async def test_retry_missing_fetches_an_unpublished_date_again(self, serialized_db_conn):
+        # Prepare
+        # The tables of the date are not published yet
+        fake_ibd = FakeIbd(holidays=[dt.date(2022, 12, 27)])
+        backfill_kwargs = dict(
+            start=dt.date(2022, 12, 27),
+            end=dt.date(2022, 12, 27),
+            tables=[fake_ibd.table()],
+            job_name='scheduler',
+            retry_missing=True,
+            db_conn=serialized_db_conn
+        )
+
+        # Act
+        first_report = await IbdBackfillService.backfill(**backfill_kwargs)
+        fake_ibd.holidays.clear()
+        second_report = await IbdBackfillService.backfill(**backfill_kwargs)
+
+        # Assert
+        assert (first_report.missing, first_report.failed) == (0, 1)
+        assert second_report.ingested == 1
+        assert fake_ibd.fetched_dates == [dt.date(2022, 12, 27), dt.date(2022, 12, 27)]
+        assert BackfillCheckpointsRepo(serialized_db_conn).get_checkpoints('scheduler[leaders]') == {
+            '27-12-2022': 'done'
+        }
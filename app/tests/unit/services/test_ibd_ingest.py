@@ -0,0 +1,125 @@
+import sqlite3
+
+import pytest
+import pytest_asyncio
+from pytest_httpx import HTTPXMock
+
+from app.http.http_client import HttpClient
+from app.http.ibd_client import IbdClient
+from app.http.rate_limiter import TokenBucket
+from app.services.ibd_ingest import IBD_TABLES, IbdIngestService, IbdTable
+
+PAGES = {
+    'dividend-leaders': 'dividend_leaders.html',
+    'ibd-small-mid-cap-leaders-index': 'small_mid_cap_leaders_index.html',
+    'ibd-large-mid-cap-leaders-index': 'large_mid_cap_leaders_index.html',
+    'reit-leaders': 'reit_leaders.html',
+    'ibd-smart-nyse-nasdaq-tables': 'stocks_by_sector.html',
+    'ibd-tech-leaders': 'tech_leaders_stocks.html',
+    'top-200-composite-stocks': 'top_200_comp_stocks.html',
+    'utility-leaders': 'utility_leaders.html',
+}
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def fast_ibd_client(monkeypatch):
+    monkeypatch.setattr(IbdClient, '_rate_limiter', TokenBucket(rate=1000, burst=len(PAGES)))
+    yield
+    await HttpClient.close_all()
+
+
+def _mock_pages(httpx_mock: HTTPXMock, missing_page: str = None) -> None:
+    for page, file_name in PAGES.items():
+        url = f'https://www.investors.com/data-tables/{page}-oct-19-2022/'
+        if page == missing_page:
+            httpx_mock.add_response(url=url, status_code=404)
+            continue
+
+        with open(f'app/tests/ibd_responses/{file_name}', mode='r') as f:
+            httpx_mock.add_response(url=url, text=f.read())
+
+
+def _count_rows(db_conn, table_name: str) -> int:
+    return db_conn.execute(f'SELECT COUNT(*) FROM {table_name}').fetchone()[0]
+
+
+class TestIbdIngestService:
+    @pytest.mark.asyncio
+    async def test_ingest_all_tables_of_date(self, httpx_mock: HTTPXMock, serialized_db_conn):
+        # Prepare
+        _mock_pages(httpx_mock)
+
+        # Act
+        report = await IbdIngestService.ingest_for_date(19, 10, 2022, db_conn=serialized_db_conn)
+
+        # Assert
+        assert report.failed == {}
+        assert report.stored == [table.name for table in IBD_TABLES]
+        assert _count_rows(serialized_db_conn, 'top_composite_stocks') == 200
+        assert _count_rows(serialized_db_conn, 'dividend_leaders') > 0
+        assert _count_rows(serialized_db_conn, 'stocks_with_sector') > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_table_does_not_stop_the_others(self, httpx_mock: HTTPXMock, serialized_db_conn):
+        # Prepare
+        _mock_pages(httpx_mock, missing_page='ibd-smart-nyse-nasdaq-tables')
+
+        # Act
+        report = await IbdIngestService.ingest_for_date(19, 10, 2022, db_conn=serialized_db_conn)
+
+        # Assert
+        assert list(report.failed) == ['stocks_with_sector']
+        assert len(report.stored) == len(IBD_TABLES) - 1
+        assert _count_rows(serialized_db_conn, 'stocks_with_sector') == 0
+        assert _count_rows(serialized_db_conn, 'utility_leaders') > 0
+
+    @pytest.mark.asyncio
+    async def test_date_is_stored_in_a_single_transaction(self, serialized_db_conn):
+        # Prepare
+        async def fetch(client, day, month, year):
+            return 'html'
+
+        def store_row(db_conn, date, data):
+            with db_conn as con:
+                con.execute("INSERT INTO data_versions VALUES('table_a', 1, NULL)")
+
+        def fail(db_conn, date, data):
+            raise sqlite3.IntegrityError('bad row')
+
+        tables = [
+            IbdTable(name='table_a', fetch=fetch, parse=lambda html: html, store=store_row),
+            IbdTable(name='table_b', fetch=fetch, parse=lambda html: html, store=fail),
+        ]
+
+        # Act
+        with pytest.raises(sqlite3.IntegrityError):
+            await IbdIngestService.ingest_for_date(19, 10, 2022, tables=tables, db_conn=serialized_db_conn)
+
+        # Assert
+        assert _count_rows(serialized_db_conn, 'data_versions') == 0
+
+    @pytest.mark.asyncio
+    async def test_replaying_a_stored_date_replaces_its_rows(self, httpx_mock: HTTPXMock, serialized_db_conn):
+        # Prepare
+        _mock_pages(httpx_mock)
+        await IbdIngestService.ingest_for_date(19, 10, 2022, db_conn=serialized_db_conn)
+        stored_rows = {
+            table.catalog_name: _count_rows(serialized_db_conn, table.catalog_name)
+            for table in IBD_TABLES
+        }
+        _mock_pages(httpx_mock)
+
+        # Act
+        report = await IbdIngestService.ingest_for_date(
+            19,
+            10,
+            2022,
+            db_conn=serialized_db_conn,
+            replace=True
+        )
+
+        # Assert
+        assert report.failed == {}
+        for table_name, row_count in stored_rows.items():
+            assert _count_rows(serialized_db_conn, table_name) == row_count
+        assert _count_rows(serialized_db_conn, 'top_composite_stocks') == 200
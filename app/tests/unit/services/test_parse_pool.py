@@ -0,0 +1,45 @@
+import json
+import os
+
+import pytest
+
+from app.scripts.scrape_and_store_earnings import parse_earnings_rows
+from app.services.parse_pool import ParsePool
+
+
+def _pid(_) -> int:
+    return os.getpid()
+
+
+class TestParsePool:
+    @pytest.mark.asyncio
+    async def test_parses_raw_bodies_in_worker_processes(self):
+        # Prepare
+        content = json.dumps({
+            'quarterlyEarnings': [{
+                'fiscalDateEnding': '2023-06-30',
+                'reportedDate': '2023-07-19',
+                'reportedEPS': '2.18',
+                'estimatedEPS': '2.01',
+                'surprise': '0.17',
+                'surprisePercentage': 'None'
+            }]
+        }).encode()
+
+        # Act
+        with ParsePool(max_workers=2) as parse_pool:
+            rows = await parse_pool.run(parse_earnings_rows, 'IBM', content)
+            worker_pid = await parse_pool.run(_pid, None)
+
+        # Assert
+        assert rows == [('IBM', '2023-06-30', '2023-07-19', 2.18, 2.01, 0.17, None)]
+        assert worker_pid != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_in_process(self):
+        # Act
+        with ParsePool(max_workers=0) as parse_pool:
+            pid = await parse_pool.run(_pid, None)
+
+        # Assert
+        assert pid == os.getpid()